@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+""" Run the benchmark suite.
+
+    $ python -m benchmarks                              # run everything
+    $ python -m benchmarks -k "iso_*"                   # run a subset
+    $ python -m benchmarks --save baseline.json         # record a baseline
+    $ python -m benchmarks --compare baseline.json      # check for regressions
+
+When comparing, the exit status is non-zero if any benchmark has slowed
+down by more than the given threshold.
+"""
+
+from __future__ import print_function
+
+from argparse import ArgumentParser
+from sys import exit
+
+from benchmarks import (bench_bucket, bench_clock, bench_compare, bench_construction, bench_date_table, bench_duration,
+                        bench_indexing, bench_intervals, bench_iso, bench_native, bench_timezones)
+from benchmarks.harness import run, save, compare
+
+
+def main():
+    parser = ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-k", dest="pattern", default="*",
+                        help="only run benchmarks matching this glob pattern")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="minimum duration in seconds of each timing run")
+    parser.add_argument("--save", metavar="FILE",
+                        help="save results as a JSON baseline")
+    parser.add_argument("--compare", metavar="FILE",
+                        help="compare results against a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="fractional slowdown reported as a regression (default 0.1)")
+    args = parser.parse_args()
+    results = run(args.pattern, args.min_time)
+    if args.save:
+        save(results, args.save)
+    if args.compare:
+        print()
+        if compare(results, args.compare, args.threshold):
+            exit(1)
+
+
+if __name__ == "__main__":
+    main()
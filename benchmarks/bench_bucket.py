@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from neotime import DateTime, bucket_many
+
+from benchmarks.harness import benchmark
+
+
+values = [DateTime(2018, 10, 1 + i % 28, i % 24, i % 60, i % 60) for i in range(1000)]
+
+
+@benchmark("bucket.truncate_hour_1000")
+def truncate_hour():
+    return [value.truncate("hour") for value in values]
+
+
+@benchmark("bucket.bucket_many_hour_1000")
+def bucket_many_hour():
+    return bucket_many(values, "hour")
+
+
+@benchmark("bucket.bucket_many_week_1000")
+def bucket_many_week():
+    return bucket_many(values, "week")
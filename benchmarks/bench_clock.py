@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from neotime import Clock, DateTime
+import neotime.clock_implementations  # registers the Clock subclasses
+
+from benchmarks.harness import benchmark
+
+
+def register(clock_class):
+    clock = object.__new__(clock_class)
+
+    @benchmark("clock.%s.utc_time" % clock_class.__name__)
+    def utc_time():
+        return clock.utc_time()
+
+
+for clock_class in Clock.__subclasses__():
+    if clock_class.available():
+        register(clock_class)
+
+
+@benchmark("clock.select")
+def select():
+    return Clock()
+
+
+@benchmark("clock.datetime.utc_now")
+def utc_now():
+    return DateTime.utc_now()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from neotime import Date, Time, DateTime
+
+from benchmarks.harness import benchmark
+
+
+d1 = Date(2018, 10, 1)
+d2 = Date(2018, 10, 2)
+t1 = Time(12, 34, 56.789123456)
+t2 = Time(12, 34, 57)
+dt1 = DateTime(2018, 10, 1, 12, 34, 56.789123456)
+dt2 = DateTime(2018, 10, 1, 12, 34, 57)
+
+
+@benchmark("compare.date.eq")
+def date_eq():
+    return d1 == d2
+
+
+@benchmark("compare.date.lt")
+def date_lt():
+    return d1 < d2
+
+
+@benchmark("compare.time.eq")
+def time_eq():
+    return t1 == t2
+
+
+@benchmark("compare.time.lt")
+def time_lt():
+    return t1 < t2
+
+
+@benchmark("compare.datetime.eq")
+def datetime_eq():
+    return dt1 == dt2
+
+
+@benchmark("compare.datetime.lt")
+def datetime_lt():
+    return dt1 < dt2
+
+
+@benchmark("hash.date")
+def date_hash():
+    return hash(d1)
+
+
+@benchmark("hash.time")
+def time_hash():
+    return hash(t1)
+
+
+@benchmark("hash.datetime")
+def datetime_hash():
+    return hash(dt1)
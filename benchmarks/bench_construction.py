@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from neotime import Date, Time, DateTime, Duration, ClockTime, UnixEpoch
+
+from benchmarks.harness import benchmark
+
+
+d = Date(2018, 10, 1)
+t = Time(12, 34, 56.789123456)
+dt = DateTime(2018, 10, 1, 12, 34, 56.789123456)
+
+
+@benchmark("construct.date")
+def construct_date():
+    return Date(2018, 10, 1)
+
+
+@benchmark("construct.time")
+def construct_time():
+    return Time(12, 34, 56.789123456)
+
+
+@benchmark("construct.datetime")
+def construct_datetime():
+    return DateTime(2018, 10, 1, 12, 34, 56.789123456)
+
+
+@benchmark("construct.duration")
+def construct_duration():
+    return Duration(days=1, hours=2, seconds=3.000000004)
+
+
+@benchmark("construct.clock_time")
+def construct_clock_time():
+    return ClockTime(1538397296, 789123456)
+
+
+@benchmark("from_ordinal.date.1970")
+def date_from_ordinal_1970():
+    return Date.from_ordinal(719200)
+
+
+@benchmark("from_ordinal.date.2018")
+def date_from_ordinal_2018():
+    return Date.from_ordinal(737000)
+
+
+@benchmark("from_ordinal.date.0001")
+def date_from_ordinal_0001():
+    return Date.from_ordinal(1000)
+
+
+@benchmark("from_ordinal.datetime")
+def datetime_from_ordinal():
+    return DateTime.from_ordinal(737000)
+
+
+@benchmark("from_clock_time.datetime")
+def datetime_from_clock_time():
+    return DateTime.from_clock_time((1538397296, 789123456), UnixEpoch)
+
+
+@benchmark("to_clock_time.date")
+def date_to_clock_time():
+    return d.to_clock_time(UnixEpoch)
+
+
+@benchmark("to_clock_time.time")
+def time_to_clock_time():
+    return t.to_clock_time()
+
+
+@benchmark("to_clock_time.datetime")
+def datetime_to_clock_time():
+    return dt.to_clock_time()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+""" Compare construction time and retained memory for a large number of
+:class:`.Date` values drawn from a skewed (Pareto) distribution of
+ordinals, with and without interning.
+
+    $ python -m benchmarks.bench_date_intern [count]
+
+"""
+
+from __future__ import division, print_function
+
+from random import Random
+from sys import argv
+from timeit import default_timer
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from neotime import Date
+from neotime.caching import LRUCache, WeakCache
+
+
+def skewed_ordinals(count, seed=0):
+    """ Ordinals counting back from 2019-12-31, where a small number of
+    recent days account for most values.
+    """
+    random = Random(seed)
+    last = Date(2019, 12, 31).to_ordinal()
+    return [last - min(int(random.paretovariate(1.2)) - 1, 36500) for _ in range(count)]
+
+
+def run(ordinals, cache):
+    Date.intern_enabled = cache is not None
+    if cache is not None:
+        Date.intern_cache = cache
+    if tracemalloc:
+        tracemalloc.start()
+    try:
+        t0 = default_timer()
+        dates = [Date.from_ordinal(ordinal) for ordinal in ordinals]
+        elapsed = default_timer() - t0
+        memory = tracemalloc.get_traced_memory()[0] if tracemalloc else None
+    finally:
+        if tracemalloc:
+            tracemalloc.stop()
+        Date.intern_enabled = False
+        Date.intern_cache = WeakCache()
+    distinct = len(set(map(id, dates)))
+    return elapsed, memory, distinct
+
+
+def main():
+    count = int(argv[1]) if len(argv) > 1 else 1000000
+    ordinals = skewed_ordinals(count)
+    print("%d dates, %d distinct ordinals" % (count, len(set(ordinals))))
+    print("%-12s %12s %14s %12s" % ("mode", "ops/sec", "memory (KiB)", "objects"))
+    for mode, cache in [("none", None), ("weak", WeakCache()), ("lru-4096", LRUCache(4096))]:
+        elapsed, memory, distinct = run(ordinals, cache)
+        print("%-12s %12.0f %14s %12d" % (mode, count / elapsed,
+                                          "-" if memory is None else "%.0f" % (memory / 1024), distinct))
+
+
+if __name__ == "__main__":
+    main()
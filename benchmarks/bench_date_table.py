@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+
+from datetime import date
+from itertools import cycle
+
+from neotime import Date
+from neotime.datetable import DateTable
+
+from benchmarks.harness import benchmark
+
+
+def spread(first_year, last_year, count=1000):
+    """ Ordinals spread evenly over the given years, repeated without end.
+    """
+    first = date(first_year, 1, 1).toordinal()
+    last = date(last_year, 12, 31).toordinal()
+    return cycle(range(first, last, (last - first) // count))
+
+
+table = DateTable()
+in_window = spread(table.start_year, table.end_year)
+out_of_window = spread(table.end_year + 1, table.end_year + 201)
+in_window_dates = cycle([Date.from_ordinal(next(in_window)) for _ in range(1000)])
+out_of_window_dates = cycle([Date.from_ordinal(next(out_of_window)) for _ in range(1000)])
+in_window_fields = cycle([next(in_window_dates).year_month_day for _ in range(1000)])
+out_of_window_fields = cycle([next(out_of_window_dates).year_month_day for _ in range(1000)])
+
+
+def using(date_table, f):
+    previous = Date.date_table
+    Date.date_table = date_table
+    try:
+        return f()
+    finally:
+        Date.date_table = previous
+
+
+@benchmark("date_table.from_ordinal_in_window")
+def from_ordinal_in_window():
+    return using(table, lambda: Date.from_ordinal(next(in_window)))
+
+
+@benchmark("date_table.from_ordinal_out_of_window")
+def from_ordinal_out_of_window():
+    return using(table, lambda: Date.from_ordinal(next(out_of_window)))
+
+
+@benchmark("date_table.from_ordinal_disabled")
+def from_ordinal_disabled():
+    return using(None, lambda: Date.from_ordinal(next(in_window)))
+
+
+@benchmark("date_table.construct_in_window")
+def construct_in_window():
+    return using(table, lambda: Date(*next(in_window_fields)))
+
+
+@benchmark("date_table.construct_out_of_window")
+def construct_out_of_window():
+    return using(table, lambda: Date(*next(out_of_window_fields)))
+
+
+@benchmark("date_table.construct_disabled")
+def construct_disabled():
+    return using(None, lambda: Date(*next(in_window_fields)))
+
+
+@benchmark("date_table.iso_calendar_in_window")
+def iso_calendar_in_window():
+    return using(table, lambda: next(in_window_dates).iso_calendar())
+
+
+@benchmark("date_table.iso_calendar_out_of_window")
+def iso_calendar_out_of_window():
+    return using(table, lambda: next(out_of_window_dates).iso_calendar())
+
+
+@benchmark("date_table.iso_calendar_disabled")
+def iso_calendar_disabled():
+    return using(None, lambda: next(in_window_dates).iso_calendar())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+""" Measure the throughput of adding a :class:`.Duration` to each value
+in a large series of :class:`.DateTime` values, and of subtracting it
+again, comparing with native `datetime` and `timedelta` arithmetic.
+
+    $ python -m benchmarks.bench_datetime_add [count]
+
+"""
+
+from __future__ import division, print_function
+
+from datetime import datetime, timedelta
+from random import Random
+from sys import argv
+from timeit import default_timer
+
+from neotime import DateTime, Duration
+
+
+def distinct_values(seed=0):
+    """ A thousand values spread over the years 1900 to 2100.
+    """
+    random = Random(seed)
+    return [DateTime(random.randint(1900, 2100), random.randint(1, 12), random.randint(1, 28),
+                     random.randint(0, 23), random.randint(0, 59), random.randint(0, 59999999999) / 1000000000)
+            for _ in range(1000)]
+
+
+def series(distinct, count):
+    return [distinct[i % len(distinct)] for i in range(count)]
+
+
+def run(values, operation, other):
+    t0 = default_timer()
+    if operation == "+":
+        for value in values:
+            _ = value + other
+    else:
+        for value in values:
+            _ = value - other
+    return default_timer() - t0
+
+
+def main():
+    count = int(argv[1]) if len(argv) > 1 else 10000000
+    distinct = distinct_values()
+    values = series(distinct, count)
+    natives = series([value.to_native() for value in distinct], count)
+    print("%d values" % count)
+    print("%-28s %12s" % ("operation", "ops/sec"))
+    for name, data, operation, other in [
+        ("DateTime + Duration(P1M2DT3H)", values, "+", Duration(months=1, days=2, hours=3)),
+        ("DateTime - Duration(P1M2DT3H)", values, "-", Duration(months=1, days=2, hours=3)),
+        ("DateTime + Duration(PT1.5S)", values, "+", Duration(seconds=1.5)),
+        ("DateTime + timedelta", values, "+", timedelta(days=2, hours=3)),
+        ("datetime + timedelta", natives, "+", timedelta(days=2, hours=3)),
+    ]:
+        elapsed = run(data, operation, other)
+        print("%-28s %12.0f" % (name, count / elapsed))
+
+
+if __name__ == "__main__":
+    main()
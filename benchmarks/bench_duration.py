@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from datetime import timedelta
+
+from neotime import Date, DateTime, Duration
+
+from benchmarks.harness import benchmark
+
+
+d = Date(2018, 10, 1)
+dt = DateTime(2018, 10, 1, 12, 34, 56.789123456)
+d1 = Duration(months=1, days=2, seconds=3.000000004)
+d2 = Duration(days=1, hours=2)
+days = Duration(days=1)
+delta = timedelta(days=1, seconds=1)
+
+
+@benchmark("duration.add")
+def duration_add():
+    return d1 + d2
+
+
+@benchmark("duration.sub")
+def duration_sub():
+    return d1 - d2
+
+
+@benchmark("duration.mul")
+def duration_mul():
+    return d1 * 3
+
+
+@benchmark("duration.truediv")
+def duration_truediv():
+    return d1 / 3
+
+
+@benchmark("duration.neg")
+def duration_neg():
+    return -d1
+
+
+@benchmark("date.add_duration")
+def date_add_duration():
+    return d + days
+
+
+@benchmark("datetime.add_timedelta")
+def datetime_add_timedelta():
+    return dt + delta
+
+
+@benchmark("datetime.add_duration")
+def datetime_add_duration():
+    return dt + d1
+
+
+@benchmark("datetime.sub_duration")
+def datetime_sub_duration():
+    return dt - d2
+
+
+year_end = Date(2019, 10, 1)
+
+
+@benchmark("date.add_duration_year")
+def date_add_duration_year():
+    values = []
+    value = d
+    while value < year_end:
+        values.append(value)
+        value += days
+    return values
+
+
+@benchmark("date.range_year")
+def date_range_year():
+    return list(Date.range(d, year_end))
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from neotime import DateTime, Duration
+from neotime.indexing import TemporalIndex
+
+from benchmarks.harness import benchmark
+
+
+keys = list(DateTime.range(DateTime(2018, 10, 1), DateTime(2018, 10, 8), Duration(minutes=1)))
+items = [(key, i) for i, key in enumerate(keys)]
+index = TemporalIndex.from_sorted(items)
+start = DateTime(2018, 10, 3, 12)
+end = DateTime(2018, 10, 3, 13)
+
+
+@benchmark("index.linear_range_10080")
+def linear_range():
+    return [(key, value) for key, value in items if start <= key < end]
+
+
+@benchmark("index.range_10080")
+def index_range():
+    return index.range(start, end)
+
+
+@benchmark("index.nearest_before_10080")
+def index_nearest_before():
+    return index.nearest_before(start)
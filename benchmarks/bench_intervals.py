@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from random import Random
+
+from neotime import DateTime, Duration
+from neotime.intervals import Interval, IntervalSet
+
+from benchmarks.harness import benchmark
+
+
+def random_intervals(count, seed=0):
+    random = Random(seed)
+    starts = DateTime.range(DateTime(2018, 1, 1), DateTime(2019, 1, 1), Duration(minutes=1))
+    intervals = []
+    for _ in range(count):
+        start = starts[random.randrange(len(starts) - 1440)]
+        intervals.append(Interval(start, start + Duration(minutes=random.randint(1, 1440))))
+    return intervals
+
+
+intervals = random_intervals(1000)
+interval_set = IntervalSet(intervals)
+query = Interval(DateTime(2018, 6, 1), DateTime(2018, 6, 2))
+
+
+@benchmark("intervals.build_set_1000")
+def build_set():
+    return IntervalSet(intervals)
+
+
+@benchmark("intervals.linear_overlaps_1000")
+def linear_overlaps():
+    return [interval for interval in intervals if interval.overlaps(query)]
+
+
+@benchmark("intervals.set_overlapping_1000")
+def set_overlapping():
+    return interval_set.overlapping(query)
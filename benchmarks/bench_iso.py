@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from pytz import FixedOffset
+
+from neotime import Date, Time, DateTime, Duration
+from neotime.io import parse_iso_stream, parse_iso_columns
+
+from benchmarks.harness import benchmark
+
+
+d = Date(2018, 10, 1)
+t = Time(12, 34, 56.789123456)
+dt = DateTime(2018, 10, 1, 12, 34, 56.789123456)
+dt_tz = DateTime(2018, 10, 1, 12, 34, 56.789123456, tzinfo=FixedOffset(60))
+duration = Duration(months=14, days=3, seconds=3723.000000004)
+duration_strings = ["P1Y2M3DT1H2M3.000000004S"] * 1000
+stream = b"\n".join([b"2018-10-01T12:34:56.789123456+01:00"] * 1000)
+
+
+@benchmark("iso_parse.date")
+def parse_date():
+    return Date.from_iso_format("2018-10-01")
+
+
+@benchmark("iso_parse.time")
+def parse_time():
+    return Time.from_iso_format("12:34:56.789123456")
+
+
+@benchmark("iso_parse.datetime")
+def parse_datetime():
+    return DateTime.from_iso_format("2018-10-01T12:34:56.789123456")
+
+
+@benchmark("iso_parse.datetime_tz")
+def parse_datetime_tz():
+    return DateTime.from_iso_format("2018-10-01T12:34:56.789123456+01:00")
+
+
+@benchmark("iso_parse.duration")
+def parse_duration():
+    return Duration.from_iso_format("P1Y2M3DT1H2M3.000000004S")
+
+
+@benchmark("iso_parse.duration_many_1k")
+def parse_duration_many():
+    return Duration.from_iso_format_many(duration_strings)
+
+
+@benchmark("strptime.datetime")
+def strptime_datetime():
+    return DateTime.parse("2018-10-01 12:34:56.789123456 +0100", "%Y-%m-%d %H:%M:%S.%f %z")
+
+
+@benchmark("iso_parse.stream_datetime_1k")
+def parse_stream_datetime():
+    return list(parse_iso_stream(stream, DateTime))
+
+
+@benchmark("iso_parse.columns_datetime_1k")
+def parse_columns_datetime():
+    return parse_iso_columns(stream, DateTime)
+
+
+@benchmark("iso_format.date")
+def format_date():
+    return d.iso_format()
+
+
+@benchmark("iso_format.time")
+def format_time():
+    return t.iso_format()
+
+
+@benchmark("iso_format.datetime")
+def format_datetime():
+    return dt.iso_format()
+
+
+@benchmark("iso_format.datetime_ms")
+def format_datetime_ms():
+    return dt.iso_format(precision=3)
+
+
+@benchmark("iso_format.datetime_tz")
+def format_datetime_tz():
+    return dt_tz.iso_format()
+
+
+@benchmark("strftime.date")
+def strftime_date():
+    return d.strftime("%d %B %Y")
+
+
+@benchmark("strftime.datetime")
+def strftime_datetime():
+    return dt_tz.strftime("%Y-%m-%d %H:%M:%S.%N %z")
+
+
+@benchmark("iso_format.duration")
+def format_duration():
+    return duration.iso_format()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from datetime import date, time, datetime
+
+from neotime import Date, Time, DateTime
+
+from benchmarks.harness import benchmark
+
+
+d = Date(2018, 10, 1)
+t = Time(12, 34, 56.789123456)
+dt = DateTime(2018, 10, 1, 12, 34, 56.789123456)
+native_d = date(2018, 10, 1)
+native_t = time(12, 34, 56, 789123)
+native_dt = datetime(2018, 10, 1, 12, 34, 56, 789123)
+dts = [dt] * 1000
+
+
+@benchmark("to_native.date")
+def date_to_native():
+    return d.to_native()
+
+
+@benchmark("to_native.time")
+def time_to_native():
+    return t.to_native()
+
+
+@benchmark("to_native.datetime")
+def datetime_to_native():
+    return dt.to_native()
+
+
+@benchmark("to_native_many.datetime.1000")
+def datetime_to_native_many():
+    return DateTime.to_native_many(dts)
+
+
+@benchmark("from_native.date")
+def date_from_native():
+    return Date.from_native(native_d)
+
+
+@benchmark("from_native.time")
+def time_from_native():
+    return Time.from_native(native_t)
+
+
+@benchmark("from_native.datetime")
+def datetime_from_native():
+    return DateTime.from_native(native_dt)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from pytz import timezone, utc
+
+from neotime import DateTime, Duration
+from neotime.timezones import as_timezone_many
+
+from benchmarks.harness import benchmark
+
+
+eastern = timezone("US/Eastern")
+values = [value.replace(tzinfo=utc)
+          for value in DateTime.range(DateTime(2018, 1, 1), DateTime(2019, 1, 1), Duration(hours=9))][:1000]
+natives = [value.to_native() for value in values]
+
+
+@benchmark("timezones.native_fromutc_1000")
+def native_fromutc():
+    return [eastern.fromutc(value.replace(tzinfo=eastern)) for value in natives]
+
+
+@benchmark("timezones.as_timezone_1000")
+def as_timezone():
+    return [value.as_timezone(eastern) for value in values]
+
+
+@benchmark("timezones.as_timezone_many_1000")
+def as_timezone_many_():
+    return as_timezone_many(values, eastern)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+""" A minimal benchmark harness, runnable offline with only the standard
+library. Each benchmark is a zero-argument callable that performs one
+operation and returns its result. Throughput is measured with
+:mod:`timeit` and retained memory per operation with :mod:`tracemalloc`,
+where available.
+"""
+
+from __future__ import division, print_function
+
+from fnmatch import fnmatch
+from json import dump, load
+from platform import python_implementation, python_version
+from timeit import Timer, default_timer
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+BENCHMARKS = []
+
+
+def benchmark(name):
+    """ Decorator to register a benchmark under a dotted `name`.
+    """
+    def register(f):
+        BENCHMARKS.append((name, f))
+        return f
+    return register
+
+
+def measure_throughput(f, min_time=0.2, repeat=3):
+    """ Return the best operations per second over `repeat` runs, each
+    lasting at least `min_time` seconds.
+    """
+    timer = Timer(f, timer=default_timer)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed == 0 else max(2, int(min_time / elapsed) + 1)
+    best = min([elapsed] + timer.repeat(repeat - 1, number))
+    return number / best
+
+
+def measure_memory(f, number=1000):
+    """ Return the average number of bytes retained by the result of
+    each operation, or :const:`None` if :mod:`tracemalloc` is not
+    available.
+    """
+    if tracemalloc is None:
+        return None
+    f()     # warm up any lazily initialised state
+    tracemalloc.start()
+    try:
+        results = [f() for _ in range(number)]
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del results
+    return size / number
+
+
+def run(pattern="*", min_time=0.2, out=print):
+    """ Run all registered benchmarks whose names match the glob
+    `pattern`, returning a dictionary of results keyed by name.
+    """
+    results = {}
+    for name, f in BENCHMARKS:
+        if not fnmatch(name, pattern):
+            continue
+        ops = measure_throughput(f, min_time)
+        memory = measure_memory(f)
+        results[name] = {"ops_per_sec": ops, "bytes_per_op": memory}
+        out("%-40s %14.0f ops/sec %10s bytes/op" % (name, ops, "-" if memory is None else "%.0f" % memory))
+    return results
+
+
+def save(results, path):
+    """ Save results as a JSON baseline.
+    """
+    with open(path, "w") as f:
+        dump({"python": "%s %s" % (python_implementation(), python_version()),
+              "results": results}, f, indent=2, sort_keys=True)
+
+
+def compare(results, path, threshold=0.1, out=print):
+    """ Compare results against a JSON baseline, returning the names of
+    benchmarks whose throughput has dropped by more than `threshold`.
+    """
+    with open(path) as f:
+        baseline = load(f)["results"]
+    regressions = []
+    for name in sorted(results):
+        if name not in baseline:
+            continue
+        ratio = results[name]["ops_per_sec"] / baseline[name]["ops_per_sec"]
+        flag = ""
+        if ratio < 1 - threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        out("%-40s %6.2fx%s" % (name, ratio, flag))
+    return regressions
@@ -25,34 +25,80 @@ a number of utility functions.
 
 from __future__ import division, print_function
 
-from decimal import Decimal
+from array import array
+from os import environ
 from datetime import timedelta, date, time, datetime
-from functools import total_ordering
-from re import compile as re_compile
+from sys import version_info
 from time import gmtime, mktime, struct_time
 
-
 try:
-    from six import with_metaclass
+    from _thread import allocate_lock
 except ImportError:
-    def with_metaclass(*_):
-        return object
+    from thread import allocate_lock
 
 from neotime.arithmetic import (nano_add, nano_sub, nano_mul, nano_div, nano_mod, nano_divmod,
                                 symmetric_divmod, round_half_to_even)
-from neotime.metaclasses import DateType, TimeType, DateTimeType
 
 
 MIN_INT64 = -(2 ** 63)
 MAX_INT64 = (2 ** 63) - 1
 
+try:
+    #: Typecode of signed 64-bit integer arrays, as used for columns of
+    #: nanoseconds; "q" is missing from the array module on Python 2
+    INT64_TYPECODE = array("q").typecode
+except ValueError:
+    INT64_TYPECODE = "l"
+
 MIN_YEAR = 1
 MAX_YEAR = 9999
 
+# Proleptic Gregorian ordinal of 1970-01-01
+UNIX_EPOCH_ORDINAL = 719163
+
+NANOSECONDS_PER_DAY = 86400000000000
+
+
+# Sources of the regular expressions used for ISO 8601 parsing. These
+# are compiled on first use, so that importing this module does not
+# import :mod:`re`.
+_PATTERNS = {
+    "DATE_ISO_PATTERN": r'^(\d{4})-(\d{2})-(\d{2})$',
+    "TIME_ISO_PATTERN": r'^(\d{2})(:(\d{2})(:((\d{2})(\.\d*)?))?)?(([+-])(\d{2}):(\d{2})(:((\d{2})(\.\d*)?))?)?$',
+    "DURATION_ISO_PATTERN": r'^([+-])?P(?:([+-]?\d+)Y)?(?:([+-]?\d+)M)?(?:([+-]?\d+(?:[.,]\d+)?)W)?'
+                            r'(?:([+-]?\d+(?:[.,]\d+)?)D)?(?:T(?:([+-]?\d+(?:[.,]\d+)?)H)?'
+                            r'(?:([+-]?\d+(?:[.,]\d+)?)M)?(?:([+-]?\d+(?:[.,]\d+)?)S)?)?$',
+    "DURATION_ISO_ALTERNATIVE_PATTERN": r'^([+-])?P(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:[.,](\d+))?$',
+}
+
+_compiled_patterns = {}
+
+
+def _pattern(name):
+    """ Return the compiled regular expression of the given name,
+    compiling it on first use.
+    """
+    try:
+        return _compiled_patterns[name]
+    except KeyError:
+        from re import compile as re_compile
+        pattern = _compiled_patterns[name] = re_compile(_PATTERNS[name])
+        return pattern
+
+
+if version_info >= (3, 7):
+
+    def __getattr__(name):
+        """ Resolve the ISO 8601 pattern constants lazily (PEP 562).
+        """
+        if name in _PATTERNS:
+            return _pattern(name)
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
-DATE_ISO_PATTERN = re_compile(r'^(\d{4})-(\d{2})-(\d{2})$')
-TIME_ISO_PATTERN = re_compile(r'^(\d{2})(:(\d{2})(:((\d{2})(\.\d*)?))?)?(([+-])(\d{2}):(\d{2})(:((\d{2})(\.\d*)?))?)?$')
-DURATION_ISO_PATTERN = re_compile(r'^P((\d+)Y)?((\d+)M)?((\d+)D)?(T((\d+)H)?((\d+)M)?((\d+(\.\d+)?)?S)?)?$')
+else:
+    # Module __getattr__ is not supported, so compile the patterns eagerly
+    for _name in _PATTERNS:
+        globals()[_name] = _pattern(_name)
 
 
 def _is_leap_year(year):
@@ -63,14 +109,88 @@ def _is_leap_year(year):
     return year % 400 == 0
 
 
-IS_LEAP_YEAR = {year: _is_leap_year(year) for year in range(MIN_YEAR, MAX_YEAR + 1)}
+class _LazyTable(dict):
+    """ Lookup table over a fixed set of `keys`, whose entries are
+    computed on first access. Membership, length, iteration and `get`
+    follow `keys`, and other keys raise :exc:`KeyError`, all as for a
+    fully populated table.
+    """
+
+    def __init__(self, function, keys):
+        super(_LazyTable, self).__init__()
+        self.__function = function
+        self.__keys = keys
+
+    def __missing__(self, key):
+        if key not in self.__keys:
+            raise KeyError(key)
+        args = key if isinstance(key, tuple) else (key,)
+        value = self[key] = self.__function(*args)
+        return value
+
+    def __contains__(self, key):
+        return key in self.__keys
+
+    def __len__(self):
+        return len(self.__keys)
+
+    def __iter__(self):
+        return iter(self.__keys)
+
+    def __eq__(self, other):
+        return dict(self.items()) == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return list(self.__keys)
+
+    def values(self):
+        return [self[key] for key in self.__keys]
+
+    def items(self):
+        return [(key, self[key]) for key in self.__keys]
+
+
+_YEARS = range(MIN_YEAR, MAX_YEAR + 1)
+
+_MONTHS = range(1, 13)
+
+
+class _YearMonths(object):
+    """ The (year, month) keys of :data:`.DAYS_IN_MONTH`, in order.
+    """
+
+    def __contains__(self, key):
+        return isinstance(key, tuple) and len(key) == 2 and key[0] in _YEARS and key[1] in _MONTHS
+
+    def __iter__(self):
+        return ((year, month) for year in _YEARS for month in _MONTHS)
+
+    def __len__(self):
+        return len(_YEARS) * len(_MONTHS)
+
+
+IS_LEAP_YEAR = _LazyTable(_is_leap_year, _YEARS)
 
 
 def _days_in_year(year):
     return 366 if IS_LEAP_YEAR[year] else 365
 
 
-DAYS_IN_YEAR = {year: _days_in_year(year) for year in range(MIN_YEAR, MAX_YEAR + 1)}
+DAYS_IN_YEAR = _LazyTable(_days_in_year, _YEARS)
 
 
 def _days_in_month(year, month):
@@ -82,8 +202,7 @@ def _days_in_month(year, month):
         return 29 if IS_LEAP_YEAR[year] else 28
 
 
-DAYS_IN_MONTH = {(year, month): _days_in_month(year, month)
-                 for year in range(MIN_YEAR, MAX_YEAR + 1) for month in range(1, 13)}
+DAYS_IN_MONTH = _LazyTable(_days_in_month, _YearMonths())
 
 
 def _normalize_day(year, month, day):
@@ -139,6 +258,120 @@ def _normalize_day(year, month, day):
     raise ValueError("Day %d out of range (1..%d, -1, -2 ,-3)" % (day, days_in_month))
 
 
+# Time formats and divisors for each supported fractional precision
+_TIME_ISO_FORMATS = {
+    0: ("%02d:%02d:%02d", 1000000000),
+    3: ("%02d:%02d:%02d.%03d", 1000000),
+    6: ("%02d:%02d:%02d.%06d", 1000),
+    9: ("%02d:%02d:%02d.%09d", 1),
+}
+
+# Offset suffixes, such as "+01:00", keyed by UTC offset
+_offset_suffixes = {}
+
+
+def _format_time(hour, minute, second, precision):
+    """ Format a time of day with `precision` fractional digits. The
+    fraction is truncated, not rounded, to the requested precision.
+    """
+    try:
+        fmt, divisor = _TIME_ISO_FORMATS[precision]
+    except KeyError:
+        raise ValueError("Precision must be one of 0, 3, 6 or 9")
+    second, nanosecond = divmod(int(round(1000000000 * second)), 1000000000)
+    if precision == 0:
+        return fmt % (hour, minute, second)
+    return fmt % (hour, minute, second, nanosecond // divisor)
+
+
+def _duration_nanoseconds(s, unit):
+    """ Convert a signed decimal string, such as "-1.5", to an exact
+    integer number of nanoseconds, given the length of its `unit` in
+    nanoseconds. Any fraction of a nanosecond is truncated.
+    """
+    negative = s[0] == "-"
+    whole, _, fraction = s.lstrip("+-").replace(",", ".").partition(".")
+    n = int(whole) * unit
+    if fraction:
+        n += unit * int(fraction) // 10 ** len(fraction)
+    return -n if negative else n
+
+
+def _parse_duration(s):
+    """ Parse an ISO 8601 duration string to a tuple of months, days
+    and nanoseconds, using integer arithmetic throughout.
+    """
+    m = _pattern("DURATION_ISO_PATTERN").match(s)
+    if m:
+        sign, years, months, weeks, days, hours, minutes, seconds = m.groups()
+        if s.endswith("P") or s.endswith("T"):
+            raise ValueError("Duration string must be in ISO format")
+        mo = 12 * int(years or 0) + int(months or 0)
+        d = 0
+        nanoseconds = 0
+        # Whole days of weeks and days components stay in days, with
+        # any fraction of a day carried into nanoseconds
+        for value, unit in ((weeks, 7 * NANOSECONDS_PER_DAY), (days, NANOSECONDS_PER_DAY)):
+            if value is not None:
+                whole_days, remainder = symmetric_divmod(_duration_nanoseconds(value, unit), NANOSECONDS_PER_DAY)
+                d += whole_days
+                nanoseconds += remainder
+        for value, unit in ((hours, 3600000000000), (minutes, 60000000000), (seconds, 1000000000)):
+            if value is not None:
+                nanoseconds += _duration_nanoseconds(value, unit)
+    else:
+        m = _pattern("DURATION_ISO_ALTERNATIVE_PATTERN").match(s)
+        if not m:
+            raise ValueError("Duration string must be in ISO format")
+        sign, years, months, days, hours, minutes, seconds, fraction = m.groups()
+        mo = 12 * int(years) + int(months)
+        d = int(days)
+        nanoseconds = 1000000000 * (3600 * int(hours) + 60 * int(minutes) + int(seconds))
+        if fraction:
+            nanoseconds += int(fraction[:9].ljust(9, "0"))
+    if sign == "-":
+        return -mo, -d, -nanoseconds
+    return mo, d, nanoseconds
+
+
+def _format_offset(offset):
+    """ Format a UTC offset as a "+HH:MM" suffix, caching the result.
+    """
+    try:
+        return _offset_suffixes[offset]
+    except KeyError:
+        minutes = (86400 * offset.days + offset.seconds) // 60
+        sign = "-" if minutes < 0 else "+"
+        suffix = "%s%02d:%02d" % ((sign,) + divmod(abs(minutes), 60))
+        if len(_offset_suffixes) < 1024:
+            _offset_suffixes[offset] = suffix
+        return suffix
+
+
+# Bucket keys of date-based truncation units, from the year, month and ordinal
+_DATE_BUCKETS = {
+    "millennium": lambda year, month, ordinal: year // 1000,
+    "century": lambda year, month, ordinal: year // 100,
+    "decade": lambda year, month, ordinal: year // 10,
+    "year": lambda year, month, ordinal: year,
+    "quarter": lambda year, month, ordinal: 4 * year + (month - 1) // 3,
+    "month": lambda year, month, ordinal: 12 * year + month - 1,
+    # Ordinal 1 (0001-01-01) is a Monday, the first day of an ISO week
+    "week": lambda year, month, ordinal: (ordinal - 1) // 7,
+    "day": lambda year, month, ordinal: ordinal,
+}
+
+# Lengths in nanoseconds of time-based truncation units
+_TIME_BUCKETS = {
+    "day": NANOSECONDS_PER_DAY,
+    "hour": 3600000000000,
+    "minute": 60000000000,
+    "second": 1000000000,
+    "millisecond": 1000000,
+    "microsecond": 1000,
+}
+
+
 class ClockTime(tuple):
     """ A count of `seconds` and `nanoseconds`. This class can be used to
     mark a particular point in time, relative to an externally-specified
@@ -211,17 +444,31 @@ class Clock(object):
 
     __implementations = None
 
+    __implementations_lock = allocate_lock()
+
     def __new__(cls):
-        if cls.__implementations is None:
-            # Find an available clock with the best precision
-            import neotime.clock_implementations
-            cls.__implementations = sorted((clock for clock in Clock.__subclasses__() if clock.available()),
-                                           key=lambda clock: clock.precision(), reverse=True)
-        if not cls.__implementations:
+        implementations = Clock.__implementations
+        if implementations is None:
+            implementations = Clock.__load_implementations()
+        if not implementations:
             raise RuntimeError("No clock implementations available")
-        instance = object.__new__(cls.__implementations[0])
+        instance = object.__new__(implementations[0])
         return instance
 
+    @staticmethod
+    def __load_implementations():
+        """ Find the available clock implementations, ordered by best
+        precision first. Implementations are probed only once, even
+        when many threads ask for a clock at the same time; after that,
+        :meth:`.__new__` reads the registry without taking the lock.
+        """
+        with Clock.__implementations_lock:
+            if Clock.__implementations is None:
+                import neotime.clock_implementations
+                Clock.__implementations = sorted((clock for clock in Clock.__subclasses__() if clock.available()),
+                                                 key=lambda clock: clock.precision(), reverse=True)
+            return Clock.__implementations
+
     @classmethod
     def precision(cls):
         """ The precision of this clock implementation, represented as a
@@ -280,10 +527,18 @@ class Duration(tuple):
              int(1000000 * milliseconds) +
              int(1000 * microseconds) +
              int(nanoseconds))
-        s, ss = symmetric_divmod(s, 1000000000)
+        return cls.__new(mo, d, s)
+
+    @classmethod
+    def __new(cls, months, days, nanoseconds):
+        if months < MIN_INT64 or months > MAX_INT64:
+            raise ValueError("Months value out of range")
+        if days < MIN_INT64 or days > MAX_INT64:
+            raise ValueError("Days value out of range")
+        s, ss = symmetric_divmod(nanoseconds, 1000000000)
         if s < MIN_INT64 or s > MAX_INT64:
             raise ValueError("Seconds value out of range")
-        return tuple.__new__(cls, (mo, d, s, ss / 1000000000))
+        return tuple.__new__(cls, (months, days, s, ss / 1000000000))
 
     def __bool__(self):
         return any(map(bool, self))
@@ -359,20 +614,42 @@ class Duration(tuple):
 
     @classmethod
     def from_iso_format(cls, s):
-        m = DURATION_ISO_PATTERN.match(s)
-        if m:
-            return cls(
-                years=int(m.group(2) or 0),
-                months=int(m.group(4) or 0),
-                days=int(m.group(6) or 0),
-                hours=int(m.group(9) or 0),
-                minutes=int(m.group(11) or 0),
-                seconds=float(m.group(13) or 0.0),
-            )
-        raise ValueError("Duration string must be in ISO format")
+        """ Parse an ISO 8601 duration string, such as "P1Y2M3DT4H5M6.7S"
+        or the alternative form "P0001-02-03T04:05:06.7". Components may
+        be negative, a leading sign negates the whole duration, and weeks,
+        days, hours, minutes and seconds may be fractional. Values are
+        computed with integer arithmetic to exact nanoseconds.
+        """
+        return cls.__new(*_parse_duration(s))
 
     fromisoformat = from_iso_format
 
+    @classmethod
+    def from_iso_format_many(cls, strings):
+        """ Parse a sequence of ISO 8601 duration strings, as for
+        :meth:`.from_iso_format`, to produce a list of :class:`.Duration`
+        values.
+        """
+        new = cls.__new
+        parse = _parse_duration
+        return [new(*parse(s)) for s in strings]
+
+    @classmethod
+    def from_timedelta64(cls, value):
+        """ Convert from a NumPy `timedelta64` value. This method requires
+        NumPy.
+        """
+        from neotime.numpy import from_timedelta64
+        return from_timedelta64(value)
+
+    def to_timedelta64(self):
+        """ Convert to a NumPy `timedelta64[ns]` value, counting each day
+        as 86400 seconds. A :exc:`ValueError` is raised if this duration
+        has a non-zero months component. This method requires NumPy.
+        """
+        from neotime.numpy import to_timedelta64
+        return to_timedelta64(self)
+
     def iso_format(self, sep="T"):
         """
 
@@ -388,7 +665,7 @@ class Duration(tuple):
             if seconds == seconds // 1:
                 parts.append("%dS" % seconds)
             else:
-                parts.append("%rS" % seconds)
+                parts.append("%sS" % ("%.9f" % seconds).rstrip("0"))
         if parts:
             parts.insert(0, sep)
         years, months, days = self.years_months_days
@@ -458,7 +735,35 @@ Duration.min = Duration(months=MIN_INT64, days=MIN_INT64, seconds=MIN_INT64, sub
 Duration.max = Duration(months=MAX_INT64, days=MAX_INT64, seconds=MAX_INT64, subseconds=+0.999999999)
 
 
-class Date(with_metaclass(DateType, object)):
+class _LazyClassAttribute(object):
+    """ Class attribute whose value is created by `factory` on first
+    access, and which may be replaced by plain assignment.
+    """
+
+    def __init__(self, name, factory):
+        self.__name = name
+        self.__factory = factory
+
+    def __get__(self, instance, owner):
+        for cls in owner.__mro__:
+            if cls.__dict__.get(self.__name) is self:
+                value = self.__factory()
+                setattr(cls, self.__name, value)
+                return value
+        raise AttributeError(self.__name)
+
+
+def _new_lru_cache():
+    from neotime.caching import LRUCache
+    return LRUCache(65536)
+
+
+def _new_weak_cache():
+    from neotime.caching import WeakCache
+    return WeakCache()
+
+
+class Date(object):
     """
 
     0xxxxxxx xxxxxxxx           -- Date(1970-01-01..2059-09-18) -- 719163..
@@ -475,7 +780,19 @@ class Date(with_metaclass(DateType, object)):
         return cls.__new(ordinal, year, month, day)
 
     @classmethod
-    def __new(cls, ordinal, year, month, day):
+    def __new(cls, ordinal, year, month, day, lookup=True):
+        # Callers that have already missed the intern cache pass
+        # `lookup` as false, so that each miss is counted only once
+        if cls.intern_enabled and cls is Date:
+            instance = cls.intern_cache.get(ordinal) if lookup else None
+            if instance is None:
+                instance = cls.__create(ordinal, year, month, day)
+                cls.intern_cache.put(ordinal, instance)
+            return instance
+        return cls.__create(ordinal, year, month, day)
+
+    @classmethod
+    def __create(cls, ordinal, year, month, day):
         instance = object.__new__(cls)
         instance.__ordinal = int(ordinal)
         instance.__year = int(year)
@@ -483,21 +800,16 @@ class Date(with_metaclass(DateType, object)):
         instance.__day = int(day)
         return instance
 
-    def __getattr__(self, name):
-        """ Map standard library attribute names to local attribute names,
-        for compatibility.
+    @classmethod
+    def __from_native_ordinal(cls, ordinal):
+        """ Construct a :class:`.Date` from an ordinal using the native
+        calendar, avoiding the year and month loops of :meth:`.from_ordinal`.
         """
-        try:
-            return {
-                "isocalendar": self.iso_calendar,
-                "isoformat": self.iso_format,
-                "isoweekday": self.iso_weekday,
-                "strftime": self.__format__,
-                "toordinal": self.to_ordinal,
-                "timetuple": self.time_tuple,
-            }[name]
-        except KeyError:
-            raise AttributeError("Date has no attribute %r" % name)
+        if ordinal < 1 or ordinal > 3652059:
+            raise ValueError("Ordinal out of range (1..3652059)")
+        d = date.fromordinal(ordinal)
+        year, month, day = _normalize_day(d.year, d.month, d.day)
+        return cls.__new(ordinal, year, month, day)
 
     # CLASS METHODS #
 
@@ -519,10 +831,14 @@ class Date(with_metaclass(DateType, object)):
         else:
             return tz.fromutc(DateTime.utcfromtimestamp(timestamp).replace(tzinfo=tz)).date()
 
+    fromtimestamp = from_timestamp
+
     @classmethod
     def utc_from_timestamp(cls, timestamp):
         return cls.from_clock_time((timestamp, 0), UnixEpoch)
 
+    utcfromtimestamp = utc_from_timestamp
+
     @classmethod
     def from_ordinal(cls, ordinal):
         """ Return the :class:`.Date` that corresponds to the proleptic
@@ -534,6 +850,15 @@ class Date(with_metaclass(DateType, object)):
         """
         if ordinal == 0:
             return ZeroDate
+        if cls.intern_enabled and cls is Date:
+            instance = cls.intern_cache.get(ordinal)
+            if instance is not None:
+                return instance
+        table = cls.date_table
+        if table is not None:
+            offset = int(ordinal) - table.first_ordinal
+            if 0 <= offset < table.size:
+                return cls.__new(ordinal, table.years[offset], table.months[offset], table.days[offset], False)
         if ordinal >= 736695:
             year = 2018     # Project release year
             month = 1
@@ -563,18 +888,48 @@ class Date(with_metaclass(DateType, object)):
             month += 1
             days_in_month = DAYS_IN_MONTH[(year, month)]
         year, month, day = _normalize_day(year, month, day)
-        return cls.__new(ordinal, year, month, day)
+        return cls.__new(ordinal, year, month, day, False)
+
+    fromordinal = from_ordinal
 
     @classmethod
-    def parse(cls, s):
+    def range(cls, start, stop, step=Duration(days=1)):
+        """ Return a lazy sequence of dates from `start` up to, but not
+        including, `stop`, stepped by a :class:`.Duration` or `timedelta`
+        of either whole days or whole months. The sequence has a length
+        and supports indexing.
+        """
+        return DateRange(start, stop, step)
+
+    @classmethod
+    def parse(cls, s, format=None, **kwargs):
         """ Parse a string to produce a :class:`.Date`.
 
         Accepted formats:
-            'YYYY-MM-DD'
+            'YYYY-MM-DD', if no `format` is given
 
         :param s:
+        :param format: a strptime-style format string; any time fields
+                       are parsed but ignored
+        :param cache: keyword only; whether to use the :attr:`.Date.string_cache`,
+                      defaulting to :attr:`.Date.string_cache_enabled`
         :return:
         """
+        cache = kwargs.pop("cache", None)
+        if kwargs:
+            raise TypeError("Unexpected keyword arguments %s" % ", ".join(sorted(kwargs)))
+        if isinstance(format, bool):
+            raise TypeError("Format must be a string; pass cache by keyword")
+        if format is not None:
+            from neotime.parsing import compile_pattern
+            year, month, day = compile_pattern(format)(s)[:3]
+            return cls(year, month, day)
+        if cache is None:
+            cache = cls.string_cache_enabled
+        if cache:
+            d = cls.string_cache.get(s)
+            if d is not None:
+                return d
         try:
             numbers = map(int, s.split("-"))
         except (ValueError, AttributeError):
@@ -582,25 +937,73 @@ class Date(with_metaclass(DateType, object)):
         else:
             numbers = list(numbers)
             if len(numbers) == 3:
-                return cls(*numbers)
+                d = cls(*numbers)
+                # Only canonical strings are cached, as the cache is
+                # shared with the stricter from_iso_format
+                if cache and d.iso_format() == s:
+                    cls.string_cache.put(s, d)
+                return d
             raise ValueError("Date string must be in format YYYY-MM-DD")
 
     @classmethod
-    def from_iso_format(cls, s):
-        m = DATE_ISO_PATTERN.match(s)
+    def parse_many(cls, strings, format=None):
+        """ Parse a sequence of strings, as for :meth:`.parse`, to
+        produce a list of :class:`.Date` values. The format string is
+        compiled only once for the whole sequence.
+        """
+        if format is None:
+            return [cls.parse(s) for s in strings]
+        from neotime.parsing import compile_pattern
+        parse = compile_pattern(format)
+        values = []
+        append = values.append
+        for s in strings:
+            year, month, day = parse(s)[:3]
+            append(cls(year, month, day))
+        return values
+
+    @classmethod
+    def from_iso_format(cls, s, cache=None):
+        """ Parse an ISO 8601 'YYYY-MM-DD' string to produce a :class:`.Date`.
+
+        :param s:
+        :param cache: whether to use the :attr:`.Date.string_cache`;
+                      defaults to :attr:`.Date.string_cache_enabled`
+        :return:
+        """
+        if cache is None:
+            cache = cls.string_cache_enabled
+        if cache:
+            d = cls.string_cache.get(s)
+            if d is not None:
+                return d
+        m = _pattern("DATE_ISO_PATTERN").match(s)
         if m:
             year = int(m.group(1))
             month = int(m.group(2))
             day = int(m.group(3))
-            return cls(year, month, day)
+            d = cls(year, month, day)
+            if cache:
+                cls.string_cache.put(s, d)
+            return d
         raise ValueError("Date string must be in format YYYY-MM-DD")
 
+    fromisoformat = from_iso_format
+
     @classmethod
     def from_native(cls, d):
         """ Convert from a native Python `datetime.date` value.
         """
         return Date.from_ordinal(d.toordinal())
 
+    @classmethod
+    def to_native_many(cls, values):
+        """ Convert a sequence of :class:`.Date` values to a list of
+        native Python `datetime.date` values.
+        """
+        from_ordinal = date.fromordinal
+        return [from_ordinal(value.__ordinal) for value in values]
+
     @classmethod
     def from_clock_time(cls, clock_time, epoch):
         """ Convert from a ClockTime relative to a given epoch.
@@ -635,6 +1038,13 @@ class Date(with_metaclass(DateType, object)):
 
     @classmethod
     def __calc_ordinal(cls, year, month, day):
+        table = cls.date_table
+        if table is not None:
+            index = 12 * (year - table.start_year) + month - 1
+            if 0 <= index < table.month_count:
+                if day < 0:
+                    return table.month_starts[index + 1] + day
+                return table.month_starts[index] + day - 1
         if day < 0:
             day = cls.days_in_month(year, month) + int(day) + 1
         # The built-in date class does this faster than a
@@ -649,6 +1059,26 @@ class Date(with_metaclass(DateType, object)):
 
     resolution = None
 
+    #: Bounded cache of :class:`.Date` values keyed by the string from
+    #: which they were parsed.
+    string_cache = None
+
+    #: Whether :meth:`.from_iso_format` and :meth:`.parse` use the
+    #: :attr:`.string_cache` by default.
+    string_cache_enabled = False
+
+    #: Cache of shared :class:`.Date` instances keyed by ordinal.
+    intern_cache = None
+
+    #: Whether :meth:`.from_ordinal` and the :class:`.Date` constructor
+    #: return shared instances from the :attr:`.intern_cache`.
+    intern_enabled = False
+
+    #: Precomputed calendar fields for a window of years, through which
+    #: dates in that window are resolved without calculation, or
+    #: :const:`None` (the default) to always calculate.
+    date_table = None
+
     # INSTANCE ATTRIBUTES #
 
     __ordinal = 0
@@ -682,6 +1112,11 @@ class Date(with_metaclass(DateType, object)):
     @property
     def year_week_day(self):
         ordinal = self.__ordinal
+        table = self.date_table
+        if table is not None:
+            offset = ordinal - table.first_ordinal
+            if 0 <= offset < table.size:
+                return table.iso_years[offset], table.iso_weeks[offset], table.weekdays[offset]
         year = self.__year
 
         def day_of_week(o):
@@ -706,6 +1141,11 @@ class Date(with_metaclass(DateType, object)):
 
     @property
     def year_day(self):
+        table = self.date_table
+        if table is not None:
+            offset = self.__ordinal - table.first_ordinal
+            if 0 <= offset < table.size:
+                return self.__year, table.year_days[offset]
         return self.__year, self.toordinal() - Date(self.__year, 1, 1).toordinal() + 1
 
     # OPERATIONS #
@@ -714,6 +1154,8 @@ class Date(with_metaclass(DateType, object)):
         return hash(self.toordinal())
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if isinstance(other, (Date, date)):
             return self.toordinal() == other.toordinal()
         return False
@@ -771,7 +1213,10 @@ class Date(with_metaclass(DateType, object)):
                 raise ValueError("Cannot add a Duration with seconds or subseconds to a Date")
             if other.months == other.days == 0:
                 return self
-            new_date = self.replace()
+            # Work on a private copy, as the fields are modified in place
+            # and this instance may be shared via the intern cache.
+            year, month, day = _normalize_day(self.__year, self.__month, self.__day)
+            new_date = self.__create(self.__ordinal, year, month, day)
             # Add days before months as the former sometimes
             # requires the current ordinal to be correct.
             if other.days:
@@ -800,16 +1245,46 @@ class Date(with_metaclass(DateType, object)):
                     kwargs.get("month", self.__month),
                     kwargs.get("day", self.__day))
 
+    def truncate(self, unit):
+        """ Return the first day of the "millennium", "century",
+        "decade", "year", "quarter", "month" or ISO "week" that contains
+        this date, or the date itself for "day". The first millennium,
+        century and decade, which would start in year 0, are truncated
+        to :attr:`.Date.min`.
+        """
+        year, month = self.__year, self.__month
+        if unit == "millennium":
+            return Date(max(year - year % 1000, MIN_YEAR), 1, 1)
+        if unit == "century":
+            return Date(max(year - year % 100, MIN_YEAR), 1, 1)
+        if unit == "decade":
+            return Date(max(year - year % 10, MIN_YEAR), 1, 1)
+        if unit == "year":
+            return Date(year, 1, 1)
+        if unit == "quarter":
+            return Date(year, month - (month - 1) % 3, 1)
+        if unit == "month":
+            return Date(year, month, 1)
+        if unit == "week":
+            return Date.__from_native_ordinal(self.__ordinal - (self.__ordinal - 1) % 7)
+        if unit == "day":
+            return self
+        raise ValueError("Cannot truncate a Date to unit %r" % unit)
+
     def time_tuple(self):
         _, _, day_of_week = self.year_week_day
         _, day_of_year = self.year_day
         return struct_time((self.year, self.month, self.day, 0, 0, 0, day_of_week - 1, day_of_year, -1))
 
+    timetuple = time_tuple
+
     def to_ordinal(self):
         """ Return the current value as an ordinal.
         """
         return self.__ordinal
 
+    toordinal = to_ordinal
+
     def to_clock_time(self, epoch):
         try:
             return ClockTime(86400 * (self.to_ordinal() - epoch.to_ordinal()))
@@ -827,13 +1302,22 @@ class Date(with_metaclass(DateType, object)):
     def iso_weekday(self):
         return self.year_week_day[2]
 
+    isoweekday = iso_weekday
+
     def iso_calendar(self):
         return self.year_week_day
 
+    isocalendar = iso_calendar
+
     def iso_format(self):
         if self.__ordinal == 0:
             return "0000-00-00"
-        return "%04d-%02d-%02d" % self.year_month_day
+        day = self.__day
+        if day < 0:
+            day += DAYS_IN_MONTH[(self.__year, self.__month)] + 1
+        return "%04d-%02d-%02d" % (self.__year, self.__month, day)
+
+    isoformat = iso_format
 
     def __repr__(self):
         if self.__ordinal == 0:
@@ -844,18 +1328,28 @@ class Date(with_metaclass(DateType, object)):
         return self.iso_format()
 
     def __format__(self, format_spec):
-        raise NotImplementedError()
+        """ Format according to a strftime-style format string, with
+        time fields taken as midnight. An empty format string returns
+        the same as :meth:`.__str__`.
+        """
+        if not format_spec:
+            return str(self)
+        from neotime.formatting import format_temporal
+        return format_temporal(format_spec, self, Midnight)
+
+    strftime = __format__
 
 
-Date.min = Date.from_ordinal(1)
-Date.max = Date.from_ordinal(3652059)
+Date.min = Date(MIN_YEAR, 1, 1)
+Date.max = Date(MAX_YEAR, 12, 31)
 Date.resolution = Duration(days=1)
+Date.string_cache = _LazyClassAttribute("string_cache", _new_lru_cache)
+Date.intern_cache = _LazyClassAttribute("intern_cache", _new_weak_cache)
 
 
 ZeroDate = object.__new__(Date)
 
-
-class Time(with_metaclass(TimeType, object)):
+class Time(object):
     """ Time of day.
     """
 
@@ -876,17 +1370,16 @@ class Time(with_metaclass(TimeType, object)):
         instance.__tzinfo = tzinfo
         return instance
 
-    def __getattr__(self, name):
-        """ Map standard library attribute names to local attribute names,
-        for compatibility.
+    @classmethod
+    def __from_nanoseconds(cls, nanoseconds, tzinfo):
+        """ Construct a :class:`.Time` from a number of nanoseconds since
+        midnight, wrapping around to fall within a single day.
         """
-        try:
-            return {
-                "isoformat": self.iso_format,
-                "utcoffset": self.utc_offset,
-            }[name]
-        except KeyError:
-            raise AttributeError("Date has no attribute %r" % name)
+        hour, nanoseconds = divmod(nanoseconds % NANOSECONDS_PER_DAY, 3600000000000)
+        minute, nanoseconds = divmod(nanoseconds, 60000000000)
+        second = nanoseconds / 1000000000
+        # Ticks are summed as by the constructor, so that equal times compare equal
+        return cls.__new(3600 * hour + 60 * minute + second, hour, minute, second, tzinfo)
 
     # CLASS METHODS #
 
@@ -901,10 +1394,11 @@ class Time(with_metaclass(TimeType, object)):
     def utc_now(cls):
         return cls.from_clock_time(Clock().utc_time(), UnixEpoch)
 
+    utcnow = utc_now
+
     @classmethod
     def from_iso_format(cls, s):
-        from pytz import FixedOffset
-        m = TIME_ISO_PATTERN.match(s)
+        m = _pattern("TIME_ISO_PATTERN").match(s)
         if m:
             hour = int(m.group(1))
             minute = int(m.group(3) or 0)
@@ -919,9 +1413,12 @@ class Time(with_metaclass(TimeType, object)):
                 # so we can ignore this part
                 # offset_second = float(m.group(13) or 0.0)
                 offset = 60 * offset_hour + offset_minute
-                return cls(hour, minute, second, tzinfo=FixedOffset(offset_multiplier * offset))
+                from neotime.timezones import fixed_offset
+                return cls(hour, minute, second, tzinfo=fixed_offset(offset_multiplier * offset))
         raise ValueError("Time string is not in ISO format")
 
+    fromisoformat = from_iso_format
+
     @classmethod
     def from_ticks(cls, ticks, tz=None):
         if 0 <= ticks < 86400:
@@ -937,6 +1434,19 @@ class Time(with_metaclass(TimeType, object)):
         second = (1000000 * t.second + t.microsecond) / 1000000
         return Time(t.hour, t.minute, second, t.tzinfo)
 
+    @classmethod
+    def to_native_many(cls, values):
+        """ Convert a sequence of :class:`.Time` values to a list of
+        native Python `datetime.time` values. As with :meth:`.to_native`,
+        sub-second precision is reduced to microseconds.
+        """
+        natives = []
+        append = natives.append
+        for value in values:
+            second, nanosecond = divmod(int(1000000000 * value.__second), 1000000000)
+            append(time(value.__hour, value.__minute, second, nanosecond // 1000, value.__tzinfo))
+        return natives
+
     @classmethod
     def from_clock_time(cls, clock_time, epoch):
         """ Convert from a `.ClockTime` relative to a given epoch.
@@ -1061,13 +1571,38 @@ class Time(with_metaclass(TimeType, object)):
         raise TypeError("'>' not supported between instances of 'Time' and %r" % type(other).__name__)
 
     def __add__(self, other):
+        """ Add a :class:`.Duration` or `timedelta`, wrapping around
+        midnight. The months and days of a :class:`.Duration` do not
+        affect a time of day and are ignored.
+        """
         if isinstance(other, Duration):
+            nanoseconds = 1000000000 * other[2] + int(round(1000000000 * other[3]))
+        elif isinstance(other, timedelta):
+            nanoseconds = 1000 * (1000000 * other.seconds + other.microseconds)
+        else:
             return NotImplemented
-        if isinstance(other, timedelta):
-            return NotImplemented
-        return NotImplemented
+        return self.__from_nanoseconds(int(round(1000000000 * self.__ticks)) + nanoseconds, self.__tzinfo)
+
+    __radd__ = __add__
 
     def __sub__(self, other):
+        """ Subtract a :class:`.Duration` or `timedelta`, wrapping around
+        midnight, or subtract another :class:`.Time` to produce a
+        :class:`.Duration`. Times that are both time zone aware are
+        compared by their UTC offsets.
+        """
+        if isinstance(other, Time):
+            nanoseconds = int(round(1000000000 * self.__ticks)) - int(round(1000000000 * other.__ticks))
+            if (self.__tzinfo is None) != (other.__tzinfo is None):
+                raise TypeError("Cannot subtract naive and time zone aware times")
+            if self.__tzinfo is not None:
+                self_offset = self.utc_offset()
+                other_offset = other.utc_offset()
+                if self_offset != other_offset:
+                    nanoseconds -= 1000 * int(1000000 * (self_offset - other_offset).total_seconds())
+            return Duration(nanoseconds=nanoseconds)
+        if isinstance(other, (Duration, timedelta)):
+            return self.__add__(-other)
         return NotImplemented
 
     # INSTANCE METHODS #
@@ -1081,10 +1616,31 @@ class Time(with_metaclass(TimeType, object)):
                     kwargs.get("second", self.__second),
                     kwargs.get("tzinfo", self.__tzinfo))
 
+    def truncate(self, unit):
+        """ Return the start of the "day", "hour", "minute", "second",
+        "millisecond" or "microsecond" that contains this time, keeping
+        the time zone.
+        """
+        try:
+            length = _TIME_BUCKETS[unit]
+        except KeyError:
+            raise ValueError("Cannot truncate a Time to unit %r" % unit)
+        nanoseconds = int(round(1000000000 * self.__ticks))
+        return self.__from_nanoseconds(nanoseconds - nanoseconds % length, self.__tzinfo)
+
+    def __tz_argument(self):
+        """ Return the value to pass to the time zone when resolving the
+        UTC offset, DST or name of this time. As for `datetime.time`,
+        native time zones such as `datetime.timezone` are passed `None`,
+        since they accept only a native `datetime`; pytz time zones are
+        passed the time itself.
+        """
+        return self if hasattr(self.__tzinfo, "localize") else None
+
     def utc_offset(self):
         if self.tzinfo is None:
             return None
-        value = self.tzinfo.utcoffset(self)
+        value = self.tzinfo.utcoffset(self.__tz_argument())
         if value is None:
             return None
         if isinstance(value, timedelta):
@@ -1096,10 +1652,12 @@ class Time(with_metaclass(TimeType, object)):
             return value
         raise TypeError("utcoffset must be a timedelta")
 
+    utcoffset = utc_offset
+
     def dst(self):
         if self.tzinfo is None:
             return None
-        value = self.tzinfo.dst(self)
+        value = self.tzinfo.dst(self.__tz_argument())
         if value is None:
             return None
         if isinstance(value, timedelta):
@@ -1113,29 +1671,31 @@ class Time(with_metaclass(TimeType, object)):
     def tzname(self):
         if self.tzinfo is None:
             return None
-        return self.tzinfo.tzname(self)
+        return self.tzinfo.tzname(self.__tz_argument())
 
     def to_clock_time(self):
-        seconds, nanoseconds = nano_divmod(self.ticks, 1)  # int, float
-        nanoseconds_int = int(Decimal(str(nanoseconds)) * 1000000000)  # Convert fractions to an integer without losing precision
-        return ClockTime(seconds, nanoseconds_int)
+        return ClockTime(*divmod(int(round(1000000000 * self.__ticks)), 1000000000))
 
     def to_native(self):
         """ Convert to a native Python `datetime.time` value.
         """
-        h, m, s = self.hour_minute_second
-        s, ns = nano_divmod(s, 1)
-        ms = int(nano_mul(ns, 1000000))
-        tz = self.tzinfo
-        return time(h, m, s, ms, tz)
+        second, nanosecond = divmod(int(1000000000 * self.__second), 1000000000)
+        return time(self.__hour, self.__minute, second, nanosecond // 1000, self.__tzinfo)
 
-    def iso_format(self):
-        s = "%02d:%02d:%012.9f" % self.hour_minute_second
-        if self.tzinfo is not None:
-            offset = self.tzinfo.utcoffset(self)
-            s += "%+03d:%02d" % divmod(offset.total_seconds() // 60, 60)
+    def iso_format(self, precision=9):
+        """ Return the time as an ISO 8601 string, with `precision`
+        fractional digits (0, 3, 6 or 9) and, if time zone aware, a
+        UTC offset suffix.
+        """
+        s = _format_time(self.__hour, self.__minute, self.__second, precision)
+        if self.__tzinfo is not None:
+            offset = self.utc_offset()
+            if offset is not None:
+                s += _format_offset(offset)
         return s
 
+    isoformat = iso_format
+
     def __repr__(self):
         if self.tzinfo is None:
             return "neotime.Time(%r, %r, %r)" % self.hour_minute_second
@@ -1146,7 +1706,17 @@ class Time(with_metaclass(TimeType, object)):
         return self.iso_format()
 
     def __format__(self, format_spec):
-        raise NotImplementedError()
+        """ Format according to a strftime-style format string, with
+        date fields taken as 1900-01-01. An empty format string returns
+        the same as :meth:`.__str__`.
+        """
+        if not format_spec:
+            return str(self)
+        from neotime.formatting import format_temporal
+        # Date fields are taken from 1900-01-01, as for datetime.time.strftime
+        return format_temporal(format_spec, Date(1900, 1, 1), self)
+
+    strftime = __format__
 
 
 Time.min = Time(0, 0, 0)
@@ -1156,8 +1726,7 @@ Midnight = Time.min
 Midday = Time(12, 0, 0)
 
 
-@total_ordering
-class DateTime(with_metaclass(DateTimeType, object)):
+class DateTime(object):
     """ Regular construction of a :class:`.DateTime` object requires at
     least the `year`, `month` and `day` arguments to be supplied. The
     optional `hour`, `minute` and `second` arguments default to zero and
@@ -1180,25 +1749,6 @@ class DateTime(with_metaclass(DateTimeType, object)):
     def __new__(cls, year, month, day, hour=0, minute=0, second=0.0, tzinfo=None):
         return cls.combine(Date(year, month, day), Time(hour, minute, second, tzinfo))
 
-    def __getattr__(self, name):
-        """ Map standard library attribute names to local attribute names,
-        for compatibility.
-        """
-        try:
-            return {
-                "astimezone": self.as_timezone,
-                "isocalendar": self.iso_calendar,
-                "isoformat": self.iso_format,
-                "isoweekday": self.iso_weekday,
-                "strftime": self.__format__,
-                "toordinal": self.to_ordinal,
-                "timetuple": self.time_tuple,
-                "utcoffset": self.utc_offset,
-                "utctimetuple": self.utc_time_tuple,
-            }[name]
-        except KeyError:
-            raise AttributeError("DateTime has no attribute %r" % name)
-
     # CLASS METHODS #
 
     @classmethod
@@ -1208,17 +1758,27 @@ class DateTime(with_metaclass(DateTimeType, object)):
         else:
             return tz.fromutc(cls.from_clock_time(Clock().utc_time(), UnixEpoch).replace(tzinfo=tz))
 
+    today = now
+
     @classmethod
     def utc_now(cls):
         return cls.from_clock_time(Clock().utc_time(), UnixEpoch)
 
+    utcnow = utc_now
+
     @classmethod
-    def from_iso_format(cls, s):
+    def from_iso_format(cls, s, cache=None):
+        """ Parse an ISO 8601 string to produce a :class:`.DateTime`.
+        The `cache` argument applies to the date part of the string, as
+        described for :meth:`.Date.from_iso_format`.
+        """
         try:
-            return cls.combine(Date.from_iso_format(s[0:10]), Time.from_iso_format(s[11:]))
+            return cls.combine(Date.from_iso_format(s[0:10], cache), Time.from_iso_format(s[11:]))
         except ValueError:
             raise ValueError("DateTime string is not in ISO format")
 
+    fromisoformat = from_iso_format
+
     @classmethod
     def from_timestamp(cls, timestamp, tz=None):
         if tz is None:
@@ -1226,14 +1786,29 @@ class DateTime(with_metaclass(DateTimeType, object)):
         else:
             return tz.fromutc(cls.utcfromtimestamp(timestamp).replace(tzinfo=tz))
 
+    fromtimestamp = from_timestamp
+
     @classmethod
     def utc_from_timestamp(cls, timestamp):
         return cls.from_clock_time((timestamp, 0), UnixEpoch)
 
+    utcfromtimestamp = utc_from_timestamp
+
     @classmethod
     def from_ordinal(cls, ordinal):
         return cls.combine(Date.from_ordinal(ordinal), Midnight)
 
+    fromordinal = from_ordinal
+
+    @classmethod
+    def range(cls, start, stop, step=Duration(days=1)):
+        """ Return a lazy sequence of date-times from `start` up to, but
+        not including, `stop`, stepped by a :class:`.Duration` or
+        `timedelta` of either a fixed length or whole months. The
+        sequence has a length and supports indexing.
+        """
+        return DateTimeRange(start, stop, step)
+
     @classmethod
     def combine(cls, date, time):
         assert isinstance(date, Date)
@@ -1243,9 +1818,40 @@ class DateTime(with_metaclass(DateTimeType, object)):
         instance.__time = time
         return instance
 
+    @classmethod
+    def __from_fields(cls, fields):
+        year, month, day, hour, minute, second, nanosecond, offset = fields
+        if nanosecond:
+            second = float("%d.%09d" % (second, nanosecond))
+        if offset is None:
+            tz = None
+        else:
+            from neotime.timezones import fixed_offset
+            tz = fixed_offset(offset)
+        return cls.combine(Date(year, month, day), Time(hour, minute, second, tz))
+
     @classmethod
     def parse(cls, date_string, format):
-        raise NotImplementedError()
+        """ Parse a string according to a strptime-style format string
+        to produce a :class:`.DateTime`. Fractional seconds are parsed
+        to nanosecond precision, and a ``%z`` offset produces a fixed
+        offset time zone, as given by :func:`neotime.timezones.fixed_offset`.
+        """
+        from neotime.parsing import compile_pattern
+        return cls.__from_fields(compile_pattern(format)(date_string))
+
+    strptime = parse
+
+    @classmethod
+    def parse_many(cls, strings, format):
+        """ Parse a sequence of strings, as for :meth:`.parse`, to
+        produce a list of :class:`.DateTime` values. The format string
+        is compiled only once for the whole sequence.
+        """
+        from neotime.parsing import compile_pattern
+        parse = compile_pattern(format)
+        from_fields = cls.__from_fields
+        return [from_fields(parse(s)) for s in strings]
 
     @classmethod
     def from_native(cls, dt):
@@ -1253,6 +1859,35 @@ class DateTime(with_metaclass(DateTimeType, object)):
         """
         return cls.combine(Date.from_native(dt.date()), Time.from_native(dt.timetz()))
 
+    @classmethod
+    def to_native_many(cls, values):
+        """ Convert a sequence of :class:`.DateTime` values to a list of
+        native Python `datetime.datetime` values. As with :meth:`.to_native`,
+        sub-second precision is reduced to microseconds.
+        """
+        natives = []
+        append = natives.append
+        for value in values:
+            d = value.__date
+            t = value.__time
+            year = d._Date__year
+            month = d._Date__month
+            day = d._Date__day
+            if day < 0:
+                day += DAYS_IN_MONTH[(year, month)] + 1
+            second, nanosecond = divmod(int(1000000000 * t._Time__second), 1000000000)
+            append(datetime(year, month, day, t._Time__hour, t._Time__minute, second,
+                            nanosecond // 1000, t._Time__tzinfo))
+        return natives
+
+    @classmethod
+    def from_datetime64(cls, value):
+        """ Convert from a NumPy `datetime64` value. This method requires
+        NumPy.
+        """
+        from neotime.numpy import from_datetime64
+        return from_datetime64(value)
+
     @classmethod
     def from_clock_time(cls, clock_time, epoch):
         """ Convert from a ClockTime relative to a given epoch.
@@ -1368,14 +2003,39 @@ class DateTime(with_metaclass(DateTimeType, object)):
         raise TypeError("'>' not supported between instances of 'DateTime' and %r" % type(other).__name__)
 
     def __add__(self, other):
+        """ Add a :class:`.Duration` or `timedelta`. The months are added
+        first, with the day clamped to the end of the resulting month,
+        followed by the days and then the seconds, which carry over into
+        the date. The time zone is retained.
+        """
+        if isinstance(other, Duration):
+            return self.__add(other[0], other[1], 1000000000 * other[2] + int(round(1000000000 * other[3])))
         if isinstance(other, timedelta):
-            t = self.to_clock_time() + ClockTime(86400 * other.days + other.seconds, other.microseconds * 1000)
-            days, seconds = symmetric_divmod(t.seconds, 86400)
-            date_ = Date.from_ordinal(days + 1)
-            time_ = Time.from_ticks(seconds + (t.nanoseconds / 1000000000))
-            return self.combine(date_, time_)
+            return self.__add(0, other.days, 1000 * (1000000 * other.seconds + other.microseconds))
         return NotImplemented
 
+    __radd__ = __add__
+
+    def __add(self, months, days, nanoseconds):
+        """ Add months, days and nanoseconds in a single pass over the
+        ordinal and the nanoseconds since midnight.
+        """
+        d = self.__date
+        t = self.__time
+        if months:
+            year, month = divmod(12 * d.year + d.month - 1 + months, 12)
+            month += 1
+            if year < MIN_YEAR or year > MAX_YEAR:
+                raise ValueError("Year out of range (%d..%d)" % (MIN_YEAR, MAX_YEAR))
+            ordinal = date(year, month, min(d.day, DAYS_IN_MONTH[(year, month)])).toordinal()
+        else:
+            ordinal = d.to_ordinal()
+        carry, nanoseconds = divmod(int(round(1000000000 * t.ticks)) + nanoseconds, NANOSECONDS_PER_DAY)
+        ordinal += days + carry
+        if ordinal != d.to_ordinal():
+            d = Date._Date__from_native_ordinal(ordinal)
+        return self.combine(d, Time._Time__from_nanoseconds(nanoseconds, t.tzinfo))
+
     def __sub__(self, other):
         if isinstance(other, DateTime):
             self_month_ordinal = 12 * (self.year - 1) + self.month
@@ -1389,7 +2049,7 @@ class DateTime(with_metaclass(DateTimeType, object)):
             t = self.time().to_clock_time() - ClockTime(3600 * other.hour + 60 * other.minute + other.second, other.microsecond * 1000)
             return timedelta(days=days, seconds=t.seconds, microseconds=(t.nanoseconds // 1000))
         if isinstance(other, Duration):
-            return NotImplemented
+            return self.__add(-other[0], -other[1], -1000000000 * other[2] - int(round(1000000000 * other[3])))
         if isinstance(other, timedelta):
             return self.__add__(-other)
         return NotImplemented
@@ -1410,50 +2070,87 @@ class DateTime(with_metaclass(DateTimeType, object)):
         time_ = self.__time.replace(**kwargs)
         return self.combine(date_, time_)
 
+    def truncate(self, unit):
+        """ Return the start of the "millennium", "century", "decade",
+        "year", "quarter", "month", ISO "week", "day", "hour", "minute",
+        "second", "millisecond" or "microsecond" that contains this
+        date-time, keeping the time zone.
+        """
+        if unit in _TIME_BUCKETS:
+            return self.combine(self.__date, self.__time.truncate(unit))
+        return self.combine(self.__date.truncate(unit), self.__time.truncate("day"))
+
     def as_timezone(self, tz):
+        """ Return the same instant in the time zone `tz`, or this value
+        unchanged if it is naive. Time zones that compile cheaply are
+        compiled into a table of transitions on first use; see
+        :func:`neotime.timezones.as_timezone`.
+        """
         if self.tzinfo is None:
             return self
-        utc = (self - self.utcoffset()).replace(tzinfo=tz)
-        return tz.fromutc(utc)
+        from neotime.timezones import as_timezone
+        return as_timezone(self, tz)
+
+    astimezone = as_timezone
+
+    def __is_native_tz(self):
+        """ Return true if the time zone must be passed a native
+        `datetime`, as for :mod:`zoneinfo` and `datetime.timezone`, rather
+        than the time of day accepted by pytz time zones.
+        """
+        tz = self.__time.tzinfo
+        return tz is not None and not hasattr(tz, "localize")
 
     def utc_offset(self):
+        if self.__is_native_tz():
+            return self.tzinfo.utcoffset(self.to_native())
         return self.__time.utc_offset()
 
+    utcoffset = utc_offset
+
     def dst(self):
+        if self.__is_native_tz():
+            return self.tzinfo.dst(self.to_native())
         return self.__time.dst()
 
     def tzname(self):
+        if self.__is_native_tz():
+            return self.tzinfo.tzname(self.to_native())
         return self.__time.tzname()
 
     def time_tuple(self):
         raise NotImplementedError()
 
+    timetuple = time_tuple
+
     def utc_time_tuple(self):
         raise NotImplementedError()
 
+    utctimetuple = utc_time_tuple
+
     def to_ordinal(self):
         return self.__date.to_ordinal()
 
+    toordinal = to_ordinal
+
     def to_clock_time(self):
-        total_seconds = 0
-        for year in range(1, self.year):
-            total_seconds += 86400 * DAYS_IN_YEAR[year]
-        for month in range(1, self.month):
-            total_seconds += 86400 * Date.days_in_month(self.year, month)
-        total_seconds += 86400 * (self.day - 1)
-        seconds, nanoseconds = nano_divmod(self.__time.ticks, 1)  # int, float
-        nanoseconds_int = int(Decimal(str(nanoseconds)) * 1000000000)  # Convert fractions to an integer without losing precision
-        return ClockTime(total_seconds + seconds, nanoseconds_int)
+        nanoseconds = (NANOSECONDS_PER_DAY * (self.__date.to_ordinal() - 1) +
+                       int(round(1000000000 * self.__time.ticks)))
+        return ClockTime(*divmod(nanoseconds, 1000000000))
 
     def to_native(self):
         """ Convert to a native Python `datetime.datetime` value.
         """
-        y, mo, d = self.year_month_day
-        h, m, s = self.hour_minute_second
-        s, ns = nano_divmod(s, 1)
-        ms = int(nano_mul(ns, 1000000))
-        tz = self.tzinfo
-        return datetime(y, mo, d, h, m, s, ms, tz)
+        return self.to_native_many([self])[0]
+
+    def to_datetime64(self):
+        """ Convert to a NumPy `datetime64[ns]` value. Time zone aware
+        values are converted to their UTC instant. A :exc:`ValueError`
+        is raised for values outside of the `datetime64[ns]` range
+        (1677-09-21 to 2262-04-11). This method requires NumPy.
+        """
+        from neotime.numpy import to_datetime64
+        return to_datetime64(self)
 
     def weekday(self):
         return self.__date.weekday()
@@ -1461,11 +2158,38 @@ class DateTime(with_metaclass(DateTimeType, object)):
     def iso_weekday(self):
         return self.__date.iso_weekday()
 
+    isoweekday = iso_weekday
+
     def iso_calendar(self):
         return self.__date.iso_calendar()
 
-    def iso_format(self, sep="T"):
-        return "%s%s%s" % (self.date().iso_format(), sep, self.timetz().iso_format())
+    isocalendar = iso_calendar
+
+    def iso_format(self, sep="T", precision=9):
+        """ Return the date and time as an ISO 8601 string, separated
+        by `sep`, with `precision` fractional digits (0, 3, 6 or 9) and,
+        if time zone aware, a UTC offset suffix.
+        """
+        d = self.__date
+        t = self.__time
+        year = d._Date__year
+        if d._Date__ordinal == 0:
+            s = "0000-00-00"
+        else:
+            month = d._Date__month
+            day = d._Date__day
+            if day < 0:
+                day += DAYS_IN_MONTH[(year, month)] + 1
+            s = "%04d-%02d-%02d" % (year, month, day)
+        s += sep + _format_time(t._Time__hour, t._Time__minute, t._Time__second, precision)
+        tz = t._Time__tzinfo
+        if tz is not None:
+            offset = tz.utcoffset(t) if hasattr(tz, "localize") else self.utc_offset()
+            if offset is not None:
+                s += _format_offset(offset)
+        return s
+
+    isoformat = iso_format
 
     def __repr__(self):
         if self.tzinfo is None:
@@ -1479,7 +2203,17 @@ class DateTime(with_metaclass(DateTimeType, object)):
         return self.iso_format()
 
     def __format__(self, format_spec):
-        raise NotImplementedError()
+        """ Format according to a strftime-style format string. An empty
+        format string returns the same as :meth:`.__str__`.
+        """
+        if not format_spec:
+            return str(self)
+        from neotime.formatting import format_temporal
+        # The time part is given as this value, so that time zones that
+        # need a full datetime, such as zoneinfo, can be resolved
+        return format_temporal(format_spec, self.__date, self)
+
+    strftime = __format__
 
 
 DateTime.min = DateTime.combine(Date.min, Time.min)
@@ -1488,3 +2222,227 @@ DateTime.resolution = Time.resolution
 
 Never = DateTime.combine(ZeroDate, Midnight)
 UnixEpoch = DateTime(1970, 1, 1, 0, 0, 0)
+
+
+def time_to_nanoseconds(value):
+    """ Return the number of nanoseconds since midnight for a
+    :class:`.Time`, ignoring any time zone.
+    """
+    return int(round(1000000000 * value.ticks))
+
+
+def datetime_to_nanoseconds(value):
+    """ Return the number of nanoseconds between the Unix Epoch and a
+    :class:`.DateTime`. Time zone aware values are measured from their
+    UTC instant; naive values are measured as-is.
+    """
+    t = value.timetz()
+    nanoseconds = (NANOSECONDS_PER_DAY * (value.date().to_ordinal() - UNIX_EPOCH_ORDINAL) +
+                   int(round(1000000000 * t.ticks)))
+    if t.tzinfo is not None:
+        offset = value.utc_offset()
+        if offset is not None:
+            nanoseconds -= 1000000000 * (86400 * offset.days + offset.seconds)
+    return nanoseconds
+
+
+def temporal_to_nanoseconds(value):
+    """ Return the number of nanoseconds between the Unix Epoch and a
+    :class:`.Date` or :class:`.DateTime`. Dates are measured from their
+    midnight, and date-times as for :func:`.datetime_to_nanoseconds`.
+    """
+    if isinstance(value, DateTime):
+        return datetime_to_nanoseconds(value)
+    if isinstance(value, Date):
+        return NANOSECONDS_PER_DAY * (value.to_ordinal() - UNIX_EPOCH_ORDINAL)
+    raise TypeError("Expected a Date or DateTime, not %r" % type(value).__name__)
+
+
+def duration_to_nanoseconds(value):
+    """ Return the total number of nanoseconds in a :class:`.Duration`.
+    Days are counted as 86400 seconds. Durations with a non-zero months
+    component cannot be converted, as months have no fixed length.
+    """
+    months, days, seconds, subseconds = value
+    if months:
+        raise ValueError("Cannot convert a Duration with months to a fixed number of nanoseconds")
+    return 1000000000 * (86400 * days + seconds) + int(round(1000000000 * subseconds))
+
+
+
+def bucket_many(values, unit):
+    """ Return a list of integer bucket keys for a sequence of
+    :class:`.Date`, :class:`.Time` and :class:`.DateTime` values, such
+    that values share a key if and only if they truncate to the same
+    value for `unit`. No intermediate objects are created. Keys for date
+    units are equal for a :class:`.Date` and a :class:`.DateTime` on the
+    same day, and :const:`None` values produce :const:`None` keys.
+    """
+    date_key = _DATE_BUCKETS.get(unit)
+    length = _TIME_BUCKETS.get(unit)
+    if date_key is None and length is None:
+        raise ValueError("Unknown truncation unit %r" % unit)
+    keys = []
+    append = keys.append
+    for value in values:
+        if isinstance(value, DateTime):
+            d = value._DateTime__date
+            t = value._DateTime__time
+        elif isinstance(value, Date):
+            d, t = value, None
+        elif isinstance(value, Time):
+            d, t = None, value
+        elif value is None:
+            append(None)
+            continue
+        else:
+            raise TypeError("Cannot bucket a value of type %r" % type(value).__name__)
+        if d is not None and date_key is not None:
+            append(date_key(d._Date__year, d._Date__month, d._Date__ordinal))
+        elif t is not None and length is not None:
+            nanoseconds = int(round(1000000000 * t._Time__ticks))
+            if d is not None:
+                nanoseconds += NANOSECONDS_PER_DAY * d._Date__ordinal
+            append(nanoseconds // length)
+        else:
+            raise ValueError("Cannot bucket a %s by unit %r" % (type(value).__name__, unit))
+    return keys
+
+
+def _add_months(d, months):
+    """ Add a number of months to a :class:`.Date`. As for :class:`.Date`
+    arithmetic, the last three days of a month remain the last three days
+    of the resulting month.
+    """
+    year, month = divmod(12 * d.year + d.month - 1 + months, 12)
+    return Date(year, month + 1, d._Date__day)
+
+
+class _TemporalRange(object):
+    """ Base class for lazy, sized sequences of temporal values, stepped
+    either by a fixed amount of an integer key or by a number of months.
+    Subclasses define the key of a value, the value for a key, and the
+    value for a month offset from the start.
+    """
+
+    def __init__(self, start, stop, step):
+        if isinstance(step, timedelta):
+            step = Duration(days=step.days, seconds=step.seconds, microseconds=step.microseconds)
+        elif not isinstance(step, Duration):
+            raise TypeError("Range step must be a Duration or timedelta")
+        months, days, seconds, subseconds = step
+        nanoseconds = 1000000000 * (86400 * days + seconds) + int(round(1000000000 * subseconds))
+        if months and nanoseconds:
+            raise ValueError("Range step must be a number of months or a fixed duration, not both")
+        if not months and not nanoseconds:
+            raise ValueError("Range step must not be zero")
+        self.__start = start
+        self.__stop = stop
+        self.__step = step
+        self.__months = months
+        self.__start_key = self._key(start)
+        stop_key = self._key(stop)
+        if months:
+            self.__key_step = None
+            n = (12 * (stop.year - start.year) + stop.month - start.month) // months
+            if n < 0:
+                self.__length = 0
+            else:
+                key = self._key(self._month_value(months * n))
+                self.__length = n + (key < stop_key if months > 0 else key > stop_key)
+        else:
+            self.__key_step = key_step = self._key_step(nanoseconds)
+            self.__length = max(0, (stop_key - self.__start_key + key_step - (1 if key_step > 0 else -1)) // key_step)
+
+    def __repr__(self):
+        return "%s(%r, %r, %r)" % (type(self).__name__, self.__start, self.__stop, self.__step)
+
+    def __len__(self):
+        return self.__length
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.__length
+        if index < 0 or index >= self.__length:
+            raise IndexError("Range index out of range")
+        if self.__months:
+            return self._month_value(self.__months * index)
+        return self._value(self.__start_key + self.__key_step * index)
+
+    def __iter__(self):
+        if self.__months:
+            month_value = self._month_value
+            for i in range(0, self.__months * self.__length, self.__months):
+                yield month_value(i)
+        else:
+            value = self._value
+            for key in range(self.__start_key, self.__start_key + self.__key_step * self.__length, self.__key_step):
+                yield value(key)
+
+    @property
+    def start(self):
+        return self.__start
+
+    @property
+    def stop(self):
+        return self.__stop
+
+    @property
+    def step(self):
+        return self.__step
+
+
+class DateRange(_TemporalRange):
+    """ A lazy sequence of :class:`.Date` values, as returned by
+    :meth:`.Date.range`.
+    """
+
+    def _key(self, value):
+        return value.to_ordinal()
+
+    def _key_step(self, nanoseconds):
+        days, remainder = divmod(nanoseconds, NANOSECONDS_PER_DAY)
+        if remainder:
+            raise ValueError("Date range step must be a whole number of days")
+        return days
+
+    def _value(self, ordinal):
+        return Date._Date__from_native_ordinal(ordinal)
+
+    def _month_value(self, months):
+        return _add_months(self.start, months)
+
+
+class DateTimeRange(_TemporalRange):
+    """ A lazy sequence of :class:`.DateTime` values, as returned by
+    :meth:`.DateTime.range`. Values are stepped in local time, as for
+    :class:`.DateTime` arithmetic, and keep the time zone of `start`.
+    """
+
+    def __init__(self, start, stop, step=Duration(days=1)):
+        if (start.tzinfo is None) != (stop.tzinfo is None):
+            raise TypeError("Cannot mix naive and time zone aware values in a range")
+        self.__start = start
+        self.__time = start.timetz()
+        super(DateTimeRange, self).__init__(start, stop, step)
+
+    def _key(self, value):
+        return NANOSECONDS_PER_DAY * value.to_ordinal() + int(round(1000000000 * value.timetz().ticks))
+
+    def _key_step(self, nanoseconds):
+        return nanoseconds
+
+    def _value(self, nanoseconds):
+        ordinal, nanoseconds = divmod(nanoseconds, NANOSECONDS_PER_DAY)
+        return DateTime.combine(Date._Date__from_native_ordinal(ordinal),
+                                Time._Time__from_nanoseconds(nanoseconds, self.__time.tzinfo))
+
+    def _month_value(self, months):
+        # As for DateTime + Duration(months=...), the day is clamped to
+        # the end of a shorter month
+        return self.__start._DateTime__add(months, 0, 0)
+
+
+if environ.get("NEOTIME_INSTRUMENT"):
+    from neotime.instrumentation import enable as _enable_instrumentation
+    _enable_instrumentation()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+""" This module provides conversions between sequences of neotime values
+and Apache Arrow arrays. PyArrow is an optional dependency and is only
+imported when this module is loaded.
+
+Arrays are built from the integer ordinal and nanosecond fields of each
+value, so no native Python `datetime` objects are created along the way.
+`None` is converted to and from null.
+
+=============  ===============================
+neotime type   Arrow type
+-------------  -------------------------------
+Date           ``date32``
+Time           ``time64[ns]``
+DateTime       ``timestamp[ns, tz]``
+Duration       ``month_day_nano_interval``
+=============  ===============================
+"""
+
+from __future__ import absolute_import, division
+
+import pyarrow
+
+from neotime import (UNIX_EPOCH_ORDINAL, NANOSECONDS_PER_DAY, Date, Time, DateTime, Duration,
+                     time_to_nanoseconds, datetime_to_nanoseconds)
+from neotime.timezones import compile_zone, fixed_offset, get_zone
+
+
+def _timezone(name):
+    if name[:1] in ("+", "-"):
+        hours, _, minutes = name[1:].partition(":")
+        offset = 60 * int(hours) + int(minutes or 0)
+        return fixed_offset(-offset if name[0] == "-" else offset)
+    if name == "UTC":
+        return fixed_offset(0)
+    return get_zone(name)
+
+
+def dates_to_arrow(values):
+    """ Convert a sequence of :class:`.Date` values to a ``date32`` array.
+    """
+    return pyarrow.array([None if value is None else value.to_ordinal() - UNIX_EPOCH_ORDINAL
+                          for value in values], type=pyarrow.date32())
+
+
+def dates_from_arrow(array):
+    """ Convert a ``date32`` or ``date64`` array to a list of
+    :class:`.Date` values.
+    """
+    from_ordinal = Date.from_ordinal
+    days = array.cast(pyarrow.date32()).cast(pyarrow.int32()).to_pylist()
+    return [None if day is None else from_ordinal(UNIX_EPOCH_ORDINAL + day) for day in days]
+
+
+def times_to_arrow(values):
+    """ Convert a sequence of :class:`.Time` values to a ``time64[ns]``
+    array. Arrow times carry no time zone, so any `tzinfo` is dropped.
+    """
+    return pyarrow.array([None if value is None else time_to_nanoseconds(value)
+                          for value in values], type=pyarrow.time64("ns"))
+
+
+def times_from_arrow(array):
+    """ Convert a ``time32`` or ``time64`` array to a list of naive
+    :class:`.Time` values.
+    """
+    from_ticks = Time.from_ticks
+    nanoseconds = array.cast(pyarrow.time64("ns")).cast(pyarrow.int64()).to_pylist()
+    return [None if n is None else from_ticks(n / 1000000000) for n in nanoseconds]
+
+
+def datetimes_to_arrow(values, tz=None):
+    """ Convert a sequence of :class:`.DateTime` values to a
+    ``timestamp[ns, tz]`` array.
+
+    Time zone aware values are stored as their UTC instant, and the
+    array time zone is `tz`, or "UTC" if that is not given. Naive values
+    are stored as-is, with no array time zone. A :exc:`ValueError` is
+    raised if naive and aware values are mixed, or if `tz` is given
+    with naive values, as naive values cannot be labelled as instants.
+    """
+    nanoseconds = []
+    append = nanoseconds.append
+    aware = None
+    for value in values:
+        if value is None:
+            append(None)
+            continue
+        if aware is None:
+            aware = value.tzinfo is not None
+            if not aware and tz is not None:
+                raise ValueError("Cannot store naive DateTime values with time zone %r" % tz)
+        elif aware != (value.tzinfo is not None):
+            raise ValueError("Cannot mix naive and time zone aware DateTime values")
+        append(datetime_to_nanoseconds(value))
+    if aware and tz is None:
+        tz = "UTC"
+    return pyarrow.array(nanoseconds, type=pyarrow.timestamp("ns", tz=tz))
+
+
+def datetimes_from_arrow(array):
+    """ Convert a ``timestamp`` array to a list of :class:`.DateTime`
+    values. If the array has a time zone, each value is converted to
+    that zone; otherwise values are naive. The :class:`.Date` part of
+    each value is shared between values that fall on the same day.
+    """
+    tz = array.type.tz
+    nanoseconds = array.cast(pyarrow.timestamp("ns", tz=tz)).cast(pyarrow.int64()).to_pylist()
+    zone = None if tz is None else _timezone(tz)
+    # Fixed offset zones (including UTC) can be applied up front,
+    # leaving only zones with transitions to be resolved per value
+    offset = None if zone is None else zone.utcoffset(None)
+    if offset is not None:
+        offset = 1000000000 * (86400 * offset.days + offset.seconds)
+    compiled = None if zone is None or offset is not None else compile_zone(zone)
+    dates = {}
+    combine = DateTime.combine
+    from_ticks = Time.from_ticks
+    values = []
+    append = values.append
+    for n in nanoseconds:
+        if n is None:
+            append(None)
+            continue
+        tzinfo = zone
+        if offset is not None:
+            n += offset
+        elif compiled is not None:
+            zone_offset, tzinfo = compiled.resolve(n // 1000000000)
+            n += 1000000000 * zone_offset
+        day, n = divmod(n, NANOSECONDS_PER_DAY)
+        try:
+            date_ = dates[day]
+        except KeyError:
+            date_ = dates[day] = Date.from_ordinal(UNIX_EPOCH_ORDINAL + day)
+        append(combine(date_, from_ticks(n / 1000000000, tzinfo)))
+    return values
+
+
+def durations_to_arrow(values):
+    """ Convert a sequence of :class:`.Duration` values to a
+    ``month_day_nano_interval`` array.
+    """
+    return pyarrow.array([None if value is None else
+                          (value[0], value[1], 1000000000 * value[2] + int(round(1000000000 * value[3])))
+                          for value in values], type=pyarrow.month_day_nano_interval())
+
+
+def durations_from_arrow(array):
+    """ Convert a ``month_day_nano_interval`` array to a list of
+    :class:`.Duration` values.
+    """
+    return [None if value is None else Duration(months=value[0], days=value[1], nanoseconds=value[2])
+            for value in array.to_pylist()]
+
+
+def to_arrow(values, tz=None):
+    """ Convert a sequence of neotime values to an Arrow array, choosing
+    the Arrow type from the type of the first non-null value. The `tz`
+    argument applies only to :class:`.DateTime` values.
+    """
+    values = list(values)
+    for value in values:
+        if isinstance(value, Date):
+            return dates_to_arrow(values)
+        if isinstance(value, Time):
+            return times_to_arrow(values)
+        if isinstance(value, DateTime):
+            return datetimes_to_arrow(values, tz)
+        if isinstance(value, Duration):
+            return durations_to_arrow(values)
+        if value is not None:
+            raise TypeError("Cannot convert %r to an Arrow array" % type(value).__name__)
+    raise ValueError("Cannot infer an Arrow type without at least one non-null value")
+
+
+def from_arrow(array):
+    """ Convert an Arrow temporal array to a list of neotime values,
+    choosing the neotime type from the Arrow type of the array.
+    """
+    t = array.type
+    if pyarrow.types.is_date(t):
+        return dates_from_arrow(array)
+    if pyarrow.types.is_time(t):
+        return times_from_arrow(array)
+    if pyarrow.types.is_timestamp(t):
+        return datetimes_from_arrow(array)
+    if t == pyarrow.month_day_nano_interval():
+        return durations_from_arrow(array)
+    raise TypeError("Cannot convert Arrow type %s to neotime values" % t)
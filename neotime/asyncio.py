@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+
+""" This module provides helpers for waiting on, and scheduling work at,
+points in time given as neotime values, for use with :mod:`asyncio`.
+
+Wall time is read from the selected :class:`.Clock`, while waiting is
+done with timers on the event loop, which follow the loop's monotonic
+clock. No thread is used per timer, so many thousands of timers can be
+active at once. After each wait, the wall clock is read again, and the
+wait is extended if the deadline has not yet been reached.
+
+Deadlines may be given as a :class:`.DateTime`, measured as UTC if it
+is naive, or as a :class:`.ClockTime` measured from the Unix Epoch.
+"""
+
+from __future__ import absolute_import, division
+
+import asyncio
+
+from neotime import Clock, ClockTime, DateTime, Duration, datetime_to_nanoseconds, duration_to_nanoseconds
+
+
+def _loop(loop):
+    if loop is not None:
+        return loop
+    try:
+        return asyncio.get_running_loop()
+    except (AttributeError, RuntimeError):
+        return asyncio.get_event_loop()
+
+
+def _now(clock):
+    t = (clock or Clock()).utc_time()
+    return 1000000000 * t.seconds + t.nanoseconds
+
+
+def _deadline(when):
+    if isinstance(when, DateTime):
+        return datetime_to_nanoseconds(when)
+    if isinstance(when, ClockTime):
+        return 1000000000 * when.seconds + when.nanoseconds
+    raise TypeError("Deadline must be a DateTime or ClockTime, not %r" % type(when).__name__)
+
+
+def _interval(interval):
+    if isinstance(interval, Duration):
+        nanoseconds = duration_to_nanoseconds(interval)
+    else:
+        nanoseconds = int(round(1000000000 * interval))
+    if nanoseconds <= 0:
+        raise ValueError("Interval must be positive")
+    return nanoseconds
+
+
+def time_until(when, clock=None):
+    """ Return the time remaining until a deadline as a :class:`.Duration`,
+    which is negative if the deadline has passed.
+    """
+    return Duration(nanoseconds=_deadline(when) - _now(clock))
+
+
+def sleep_until(when, clock=None, loop=None):
+    """ Return a future that completes, with a result of :const:`None`,
+    once the wall clock reaches a deadline. Cancelling the future
+    cancels the underlying timer.
+    """
+    loop = _loop(loop)
+    deadline = _deadline(when)
+    future = loop.create_future() if hasattr(loop, "create_future") else asyncio.Future(loop=loop)
+    handles = []
+
+    def check():
+        if future.done():
+            return
+        remaining = deadline - _now(clock)
+        if remaining <= 0:
+            future.set_result(None)
+        else:
+            handles[:] = [loop.call_at(loop.time() + remaining / 1000000000, check)]
+
+    def cancel(f):
+        for handle in handles:
+            handle.cancel()
+
+    future.add_done_callback(cancel)
+    check()
+    return future
+
+
+def wait_until(awaitable, when, clock=None):
+    """ Wait for an awaitable to complete, as for :func:`asyncio.wait_for`,
+    raising :exc:`asyncio.TimeoutError` if it has not done so by a
+    deadline.
+    """
+    remaining = max(0, _deadline(when) - _now(clock))
+    return asyncio.wait_for(awaitable, remaining / 1000000000)
+
+
+class PeriodicCall(object):
+    """ Handle for a callback scheduled by :func:`.every`.
+    """
+
+    def __init__(self, loop, interval, callback, args, clock):
+        self.__loop = loop
+        self.__interval = interval
+        self.__callback = callback
+        self.__args = args
+        self.__clock = clock
+        self.__handle = None
+        self.__cancelled = False
+        self.__schedule(_now(clock))
+
+    def __schedule(self, after):
+        loop = self.__loop
+        now = _now(self.__clock)
+        target = (max(now, after) // self.__interval + 1) * self.__interval
+        self.__handle = loop.call_at(loop.time() + (target - now) / 1000000000, self.__run, target)
+
+    def __run(self, target):
+        now = _now(self.__clock)
+        if now < target:
+            # Woken early by drift between the loop and wall clocks
+            self.__handle = self.__loop.call_at(self.__loop.time() + (target - now) / 1000000000,
+                                                self.__run, target)
+            return
+        self.__schedule(target)
+        result = self.__callback(*self.__args)
+        if asyncio.iscoroutine(result):
+            self.__loop.create_task(result)
+
+    @property
+    def cancelled(self):
+        return self.__cancelled
+
+    def cancel(self):
+        """ Cancel all further calls.
+        """
+        self.__cancelled = True
+        if self.__handle is not None:
+            self.__handle.cancel()
+
+
+def every(interval, callback, args=(), clock=None, loop=None):
+    """ Call `callback` with `args` at every multiple of `interval` since
+    the Unix Epoch, as measured by the wall clock, so that an interval
+    of one minute calls back every minute on the minute (UTC). The
+    interval may be a :class:`.Duration` without months or a number of
+    seconds. If the callback returns a coroutine, it is run as a task.
+    Returns a :class:`.PeriodicCall` that can be used to cancel.
+    """
+    return PeriodicCall(_loop(loop), _interval(interval), callback, tuple(args), clock)
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from collections import OrderedDict
+from weakref import WeakValueDictionary
+
+
+class LRUCache(object):
+    """ A bounded mapping that evicts the least recently used entry once
+    more than `max_size` entries are held. Hits and misses are counted
+    for reporting via :meth:`.stats`.
+
+        >>> cache = LRUCache(2)
+        >>> cache.put("a", 1); cache.put("b", 2); cache.put("c", 3)
+        >>> cache.get("a") is None
+        True
+        >>> cache.get("c")
+        3
+        >>> cache.stats()
+        {'hits': 1, 'misses': 1, 'size': 2, 'max_size': 2}
+
+    """
+
+    def __init__(self, max_size):
+        if max_size < 1:
+            raise ValueError("Cache size must be at least 1")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.__entries = OrderedDict()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __contains__(self, key):
+        return key in self.__entries
+
+    def get(self, key, default=None):
+        """ Return the value held for `key`, marking it as the most
+        recently used, or `default` if no such value is held.
+        """
+        entries = self.__entries
+        try:
+            value = entries.pop(key)
+        except KeyError:
+            self.misses += 1
+            return default
+        else:
+            entries[key] = value
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """ Hold `value` for `key`, evicting the least recently used
+        entries if the cache is full.
+        """
+        entries = self.__entries
+        entries[key] = value
+        while len(entries) > self.max_size:
+            try:
+                entries.popitem(last=False)
+            except KeyError:
+                break
+
+    def clear(self):
+        """ Remove all entries and reset the hit and miss counters.
+        """
+        self.__entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """ Return a dictionary of `hits`, `misses`, `size` and `max_size`.
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.__entries), "max_size": self.max_size}
+
+
+class WeakCache(object):
+    """ A mapping with the same interface as :class:`.LRUCache` that holds
+    its values by weak reference. Entries are discarded automatically
+    once a value is no longer referenced elsewhere, so the size of the
+    cache follows the number of live values rather than a fixed bound.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.__entries = WeakValueDictionary()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __contains__(self, key):
+        return key in self.__entries
+
+    def get(self, key, default=None):
+        """ Return the value held for `key`, or `default` if no such value
+        is held.
+        """
+        value = self.__entries.get(key)
+        if value is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """ Hold a weak reference to `value` for `key`.
+        """
+        self.__entries[key] = value
+
+    def clear(self):
+        """ Remove all entries and reset the hit and miss counters.
+        """
+        self.__entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """ Return a dictionary of `hits`, `misses` and `size`.
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.__entries)}
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+""" This module provides a precomputed table of calendar fields for a
+window of years, through which :class:`.Date` resolves ordinals,
+calendar dates and ISO weeks with a single index.
+
+    >>> from neotime import Date
+    >>> table = DateTable(2018, 2019)
+    >>> offset = Date(2018, 12, 31).to_ordinal() - table.first_ordinal
+    >>> table.iso_years[offset], table.iso_weeks[offset], table.weekdays[offset]
+    (2019, 1, 1)
+
+The window bounds are fixed on construction, but the arrays themselves
+are only built on first access, so a table covering a window that is
+never used costs nothing. The ``month_starts`` array, which is all that
+constructing a :class:`.Date` needs, is built separately from the much
+larger per-day arrays.
+
+:attr:`.Date.date_table` is :const:`None` unless a table is assigned.
+"""
+
+from __future__ import absolute_import
+
+from array import array
+from datetime import date
+
+
+#: First and last years covered by a :class:`.DateTable` by default.
+DEFAULT_WINDOW = (1900, 2100)
+
+# ISO weekdays, repeated so that any month can be sliced from it
+_WEEKDAYS = list(range(1, 8)) * 7
+
+_DAY_ARRAYS = ("years", "months", "days", "weekdays", "iso_years", "iso_weeks", "year_days")
+
+
+def _days_in_year(year):
+    return 366 if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0) else 365
+
+
+def _iso_week_1(january_4):
+    """ Ordinal of the Monday that starts ISO week 1, given the
+    ordinal of 4 January of the same year.
+    """
+    return january_4 - (january_4 - 1) % 7
+
+
+class DateTable(object):
+    """ Calendar fields for every day from 1 January of `start_year` to
+    31 December of `end_year`, held in compact arrays indexed by the
+    offset of an ordinal from :attr:`.first_ordinal`:
+
+    ``years``, ``months``, ``days``
+        Calendar date; days are stored as for :class:`.Date`, with the
+        last three days of each month as -3, -2 and -1
+    ``weekdays``, ``iso_years``, ``iso_weeks``
+        ISO weekday (1 to 7), year and week number
+    ``year_days``
+        Day of the year, from 1
+
+    An additional ``month_starts`` array holds the first ordinal of each
+    month, indexed by ``12 * (year - start_year) + month - 1``, with a
+    final entry for the month following the window.
+    """
+
+    def __init__(self, start_year=DEFAULT_WINDOW[0], end_year=DEFAULT_WINDOW[1]):
+        if start_year > end_year:
+            raise ValueError("Start year must not be after end year")
+        self.start_year = start_year
+        self.end_year = end_year
+        self.first_ordinal = date(start_year, 1, 1).toordinal()
+        self.last_ordinal = date(end_year, 12, 31).toordinal()
+        self.size = self.last_ordinal - self.first_ordinal + 1
+        self.month_count = 12 * (end_year - start_year + 1)
+
+    def __repr__(self):
+        return "%s(%r, %r)" % (type(self).__name__, self.start_year, self.end_year)
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, ordinal):
+        return self.first_ordinal <= ordinal <= self.last_ordinal
+
+    def __getattr__(self, name):
+        # Build all per-day arrays on first access to any of them
+        if name == "month_starts":
+            self.__build_month_starts()
+        elif name in _DAY_ARRAYS:
+            self.__build()
+        else:
+            raise AttributeError(name)
+        return self.__dict__[name]
+
+    def __build_month_starts(self):
+        month_starts = array("l")
+        for year in range(self.start_year, self.end_year + 1):
+            month_starts.extend(date(year, month, 1).toordinal() for month in range(1, 13))
+        month_starts.append(self.last_ordinal + 1)
+        self.month_starts = month_starts
+
+    def __build(self):
+        years = array("H")
+        months = array("B")
+        days = array("b")
+        weekdays = array("B")
+        iso_years = array("H")
+        iso_weeks = array("B")
+        year_days = array("H")
+        first = self.first_ordinal
+        # Week 1 of the year before the window, for its last days
+        week_1 = _iso_week_1(first - _days_in_year(self.start_year - 1) + 3)
+        for year in range(self.start_year, self.end_year + 1):
+            previous_week_1 = week_1
+            week_1 = _iso_week_1(first + 3)
+            year_start = first
+            for month in range(1, 13):
+                last = date(year, month + 1, 1).toordinal() if month < 12 else date(year, 12, 31).toordinal() + 1
+                length = last - first
+                months.extend([month] * length)
+                days.extend(range(1, length - 2))
+                days.extend((-3, -2, -1))
+                start = (first - 1) % 7
+                weekdays.extend(_WEEKDAYS[start:start + length])
+                first = last
+            ordinals = range(year_start, first)
+            next_week_1 = _iso_week_1(first + 3)
+            years.extend([year] * len(ordinals))
+            year_days.extend(range(1, len(ordinals) + 1))
+            iso_years.extend([year - 1 if o < week_1 else year + 1 if o >= next_week_1 else year
+                              for o in ordinals])
+            iso_weeks.extend([(o - previous_week_1) // 7 + 1 if o < week_1 else
+                              1 if o >= next_week_1 else (o - week_1) // 7 + 1
+                              for o in ordinals])
+        self.years = years
+        self.months = months
+        self.days = days
+        self.weekdays = weekdays
+        self.iso_years = iso_years
+        self.iso_weeks = iso_weeks
+        self.year_days = year_days
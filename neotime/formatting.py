@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+
+""" This module compiles strftime-style format strings for the
+:meth:`__format__` methods of the temporal classes.
+
+Each format string is compiled once into a list of field emitters,
+each a callable that takes a date part and a time part and returns a
+string. Compiled formats are held in :data:`.format_cache`, so repeated
+formatting with the same pattern only loops over its emitters.
+
+The supported directives are those of C89 ``strftime`` (``%a %A %b %B
+%c %d %f %H %I %j %m %M %p %S %U %w %W %x %X %y %Y %z %Z %%``), the
+C99 and POSIX additions ``%C %D %e %F %g %G %h %n %r %R %t %T %u %V``,
+the GNU extensions ``%k %l %P``, and ``%N`` for nine digits of
+nanoseconds. Names of days and months are always in English, and
+``%c``, ``%x``, ``%X`` and ``%r`` are expanded as for the C locale,
+regardless of the current locale. Directives that depend on the
+platform's time zone database, such as ``%s``, are not supported.
+"""
+
+from datetime import date
+
+from neotime.caching import LRUCache
+
+
+DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+MONTH_NAMES = ("January", "February", "March", "April", "May", "June",
+               "July", "August", "September", "October", "November", "December")
+
+#: Compiled formats, keyed by format string.
+format_cache = LRUCache(256)
+
+
+def _weekday(d):
+    """ Day of the week, from 0 (Monday) to 6 (Sunday).
+    """
+    return (d.to_ordinal() + 6) % 7
+
+
+def _year_day(d):
+    return d.to_ordinal() - date(d.year, 1, 1).toordinal() + 1
+
+
+def _nanoseconds(t):
+    """ Whole seconds and nanoseconds of the second of a time.
+    """
+    return divmod(int(round(1000000000 * t.second)), 1000000000)
+
+
+def _offset(t):
+    offset = t.utc_offset()
+    if offset is None:
+        return ""
+    minutes = (86400 * offset.days + offset.seconds) // 60
+    sign = "-" if minutes < 0 else "+"
+    return "%s%02d%02d" % ((sign,) + divmod(abs(minutes), 60))
+
+
+EMITTERS = {
+    "a": lambda d, t: DAY_NAMES[_weekday(d)][:3],
+    "A": lambda d, t: DAY_NAMES[_weekday(d)],
+    "w": lambda d, t: "%d" % ((_weekday(d) + 1) % 7),
+    "u": lambda d, t: "%d" % (_weekday(d) + 1),
+    "d": lambda d, t: "%02d" % d.day,
+    "e": lambda d, t: "%2d" % d.day,
+    "b": lambda d, t: MONTH_NAMES[d.month - 1][:3],
+    "B": lambda d, t: MONTH_NAMES[d.month - 1],
+    "m": lambda d, t: "%02d" % d.month,
+    "y": lambda d, t: "%02d" % (d.year % 100),
+    "C": lambda d, t: "%02d" % (d.year // 100),
+    "Y": lambda d, t: "%04d" % d.year,
+    "H": lambda d, t: "%02d" % t.hour,
+    "I": lambda d, t: "%02d" % ((t.hour + 11) % 12 + 1),
+    "k": lambda d, t: "%2d" % t.hour,
+    "l": lambda d, t: "%2d" % ((t.hour + 11) % 12 + 1),
+    "p": lambda d, t: "AM" if t.hour < 12 else "PM",
+    "P": lambda d, t: "am" if t.hour < 12 else "pm",
+    "M": lambda d, t: "%02d" % t.minute,
+    "S": lambda d, t: "%02d" % _nanoseconds(t)[0],
+    "f": lambda d, t: "%06d" % (_nanoseconds(t)[1] // 1000),
+    "N": lambda d, t: "%09d" % _nanoseconds(t)[1],
+    "z": lambda d, t: _offset(t),
+    "Z": lambda d, t: t.tzname() or "",
+    "j": lambda d, t: "%03d" % _year_day(d),
+    "U": lambda d, t: "%02d" % ((_year_day(d) + 6 - (_weekday(d) + 1) % 7) // 7),
+    "W": lambda d, t: "%02d" % ((_year_day(d) + 6 - _weekday(d)) // 7),
+    "G": lambda d, t: "%04d" % date.fromordinal(d.to_ordinal()).isocalendar()[0],
+    "g": lambda d, t: "%02d" % (date.fromordinal(d.to_ordinal()).isocalendar()[0] % 100),
+    "V": lambda d, t: "%02d" % date.fromordinal(d.to_ordinal()).isocalendar()[1],
+}
+
+# Directives that stand for other directives, with locale-dependent
+# ones expanded as for the C locale
+EXPANSIONS = {
+    "c": "%a %b %e %H:%M:%S %Y",
+    "x": "%m/%d/%y",
+    "X": "%H:%M:%S",
+    "r": "%I:%M:%S %p",
+    "D": "%m/%d/%y",
+    "F": "%Y-%m-%d",
+    "T": "%H:%M:%S",
+    "R": "%H:%M",
+    "h": "%b",
+    "n": "\n",
+    "t": "\t",
+}
+
+
+def _literal(text):
+    return lambda d, t: text
+
+
+def compile_format(format_spec):
+    """ Compile a strftime-style format string into a list of emitters,
+    raising :exc:`ValueError` for unknown directives.
+    """
+    emitters = format_cache.get(format_spec)
+    if emitters is not None:
+        return emitters
+    emitters = []
+    text = []
+    i, n = 0, len(format_spec)
+    while i < n:
+        c = format_spec[i]
+        if c != "%":
+            text.append(c)
+            i += 1
+            continue
+        if i + 1 == n:
+            raise ValueError("Incomplete format directive at end of %r" % format_spec)
+        directive = format_spec[i + 1]
+        i += 2
+        if directive == "%":
+            text.append("%")
+            continue
+        if directive in EXPANSIONS:
+            expansion = compile_format(EXPANSIONS[directive])
+        elif directive in EMITTERS:
+            expansion = [EMITTERS[directive]]
+        else:
+            raise ValueError("Invalid format directive %%%s in %r" % (directive, format_spec))
+        if text:
+            emitters.append(_literal("".join(text)))
+            text = []
+        emitters.extend(expansion)
+    if text:
+        emitters.append(_literal("".join(text)))
+    format_cache.put(format_spec, emitters)
+    return emitters
+
+
+def format_temporal(format_spec, d, t):
+    """ Format a date part `d` and a time part `t` according to a
+    strftime-style format string.
+    """
+    return "".join([emit(d, t) for emit in compile_format(format_spec)])
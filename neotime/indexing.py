@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+""" This module provides a sorted container of values keyed by
+:class:`.Date` or :class:`.DateTime`, for range scans over in-memory
+time series.
+
+    >>> from neotime import DateTime
+    >>> index = TemporalIndex([(DateTime(2018, 10, 2), "b"), (DateTime(2018, 10, 1), "a")])
+    >>> index.range(DateTime(2018, 10, 1), DateTime(2018, 10, 2))
+    [(neotime.DateTime(2018, 10, 1, 0, 0, 0.0), 'a')]
+
+Each key is reduced to an integer instant, held as seconds and
+nanoseconds since the Unix epoch in two parallel arrays, so that lookups
+use :mod:`bisect` and never compare temporal objects. Time zone aware
+keys are ordered by their UTC instant, naive keys as-is, and dates by
+their midnight.
+"""
+
+from __future__ import absolute_import, division
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+from neotime import INT64_TYPECODE, temporal_to_nanoseconds
+
+
+def _instant(value):
+    """ Return the seconds and nanoseconds since the Unix epoch of a
+    :class:`.Date` or :class:`.DateTime`.
+    """
+    return divmod(temporal_to_nanoseconds(value), 1000000000)
+
+
+class TemporalIndex(object):
+    """ A container of values sorted by a temporal key, which may hold
+    several values for the same key. Values with equal keys are kept in
+    the order in which they were added.
+    """
+
+    def __init__(self, items=()):
+        self.__seconds = array(INT64_TYPECODE)
+        self.__nanoseconds = array("l")
+        self.__keys = []
+        self.__values = []
+        for key, value in items:
+            self.insert(key, value)
+
+    @classmethod
+    def from_sorted(cls, items):
+        """ Bulk load an index from an iterable of `(key, value)` pairs
+        already sorted by key, which is faster than inserting each pair.
+        """
+        index = cls()
+        seconds = index.__seconds
+        nanoseconds = index.__nanoseconds
+        last = None
+        for key, value in items:
+            instant = _instant(key)
+            if last is not None and instant < last:
+                raise ValueError("Items are not sorted by key")
+            last = instant
+            seconds.append(instant[0])
+            nanoseconds.append(instant[1])
+            index.__keys.append(key)
+            index.__values.append(value)
+        return index
+
+    def __repr__(self):
+        return "<%s length=%d>" % (type(self).__name__, len(self))
+
+    def __len__(self):
+        return len(self.__keys)
+
+    def __iter__(self):
+        return iter(zip(self.__keys, self.__values))
+
+    def __getitem__(self, index):
+        return self.__keys[index], self.__values[index]
+
+    def __bisect(self, when, bisect):
+        """ Locate the position of `when` with `bisect_left` or
+        `bisect_right`, first by the seconds and then by the nanoseconds
+        within the run of equal seconds.
+        """
+        s, ns = _instant(when)
+        lo = bisect_left(self.__seconds, s)
+        hi = bisect_right(self.__seconds, s, lo)
+        return bisect(self.__nanoseconds, ns, lo, hi)
+
+    def insert(self, key, value):
+        """ Add a value under `key`, after any values with an equal key.
+        """
+        i = self.__bisect(key, bisect_right)
+        s, ns = _instant(key)
+        self.__seconds.insert(i, s)
+        self.__nanoseconds.insert(i, ns)
+        self.__keys.insert(i, key)
+        self.__values.insert(i, value)
+
+    def range(self, start=None, end=None):
+        """ Return a list of the `(key, value)` pairs with keys from
+        `start` up to, but not including, `end`. Either bound may be
+        :const:`None` to leave that end open.
+        """
+        i = 0 if start is None else self.__bisect(start, bisect_left)
+        j = len(self.__keys) if end is None else self.__bisect(end, bisect_left)
+        return list(zip(self.__keys[i:j], self.__values[i:j]))
+
+    def nearest_before(self, when):
+        """ Return the last `(key, value)` pair with a key at or before
+        `when`, or :const:`None` if there is none.
+        """
+        i = self.__bisect(when, bisect_right)
+        if i == 0:
+            return None
+        return self.__keys[i - 1], self.__values[i - 1]
+
+    def nearest_after(self, when):
+        """ Return the first `(key, value)` pair with a key at or after
+        `when`, or :const:`None` if there is none.
+        """
+        i = self.__bisect(when, bisect_left)
+        if i == len(self.__keys):
+            return None
+        return self.__keys[i], self.__values[i]
+
+    def keys(self):
+        """ Return a list of the keys, in order.
+        """
+        return list(self.__keys)
+
+    def values(self):
+        """ Return a list of the values, in order of their keys.
+        """
+        return list(self.__values)
@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+""" Opt-in counters for the number of temporal objects created and for the
+use of known slow paths, along with the time spent in those paths.
+
+Instrumentation is enabled either by setting the ``NEOTIME_INSTRUMENT``
+environment variable before :mod:`neotime` is imported, or by calling
+:func:`.enable` or using the :func:`.instrumented` context manager.
+Counting wrappers are installed on the temporal classes only while
+instrumentation is enabled, so it costs nothing when disabled.
+
+    >>> from neotime import Date
+    >>> with instrumented() as counters:
+    ...     _ = Date(2018, 10, 1)
+    >>> counters["construct.Date"]
+    1
+
+Counters are exported as a flat dictionary with dotted keys:
+
+==============================  ==================================================
+Key                             Meaning
+------------------------------  --------------------------------------------------
+``construct.<Type>``            Instances created, per type
+``<method>.calls``              Calls to an instrumented slow path
+``<method>.seconds``            Time spent in an instrumented slow path
+``from_ordinal.iterations``     Year and month loop iterations in ``from_ordinal``
+                                for dates outside :attr:`.Date.date_table`
+``regex_parses``                ISO strings matched against a regular expression
+==============================  ==================================================
+"""
+
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from timeit import default_timer
+
+from neotime import ClockTime, Duration, Date, Time, DateTime
+
+
+_counters = defaultdict(int)
+_patches = []
+
+
+def _patch(cls, name, make_wrapper):
+    """ Replace the attribute `name` of `cls`, along with any aliases that
+    refer to the same object, with a wrapper around the original function.
+    """
+    original = vars(cls)[name]
+    if isinstance(original, classmethod):
+        wrapper = classmethod(make_wrapper(original.__func__))
+    elif isinstance(original, staticmethod):
+        wrapper = staticmethod(make_wrapper(original.__func__))
+    else:
+        wrapper = make_wrapper(original)
+    for alias, value in list(vars(cls).items()):
+        if value is original:
+            setattr(cls, alias, wrapper)
+            _patches.append((cls, alias, original))
+
+
+def _counting(key):
+    def make_wrapper(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            _counters[key] += 1
+            return f(*args, **kwargs)
+        return wrapper
+    return make_wrapper
+
+
+def _timing(key, extra=None, before=None):
+    """ Count calls to, and time spent in, a slow path. If given, `extra`
+    is called with the arguments, the result and the value returned by
+    `before`, to record any further counters.
+    """
+    def make_wrapper(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            state = None if before is None else before()
+            t0 = default_timer()
+            try:
+                result = f(*args, **kwargs)
+            finally:
+                _counters[key + ".seconds"] += default_timer() - t0
+                _counters[key + ".calls"] += 1
+            if extra is not None:
+                extra(args, result, state)
+            return result
+        return wrapper
+    return make_wrapper
+
+
+def _intern_hits():
+    return Date.intern_cache.hits
+
+
+def _string_hits():
+    return Date.string_cache.hits
+
+
+def _from_ordinal_iterations(args, d, intern_hits):
+    # The ordinal is read from the result, as it may be passed by keyword
+    ordinal = d.to_ordinal()
+    table = Date.date_table
+    if table is not None and ordinal in table:
+        return
+    if d.year and Date.intern_cache.hits == intern_hits:
+        base = 2018 if ordinal >= 736695 else 1970 if ordinal >= 719163 else 1
+        _counters["from_ordinal.iterations"] += (d.year - base) + (d.month - 1)
+
+
+def _date_regex_parse(args, d, string_hits):
+    if Date.string_cache.hits == string_hits:
+        _counters["regex_parses"] += 1
+
+
+def _regex_parse(args, result, _):
+    _counters["regex_parses"] += 1
+
+
+def _install():
+    _patch(ClockTime, "__new__", _counting("construct.ClockTime"))
+    _patch(Duration, "_Duration__new", _counting("construct.Duration"))
+    _patch(Date, "_Date__create", _counting("construct.Date"))
+    _patch(Time, "_Time__new", _counting("construct.Time"))
+    _patch(DateTime, "combine", _counting("construct.DateTime"))
+    _patch(Date, "from_ordinal", _timing("from_ordinal", _from_ordinal_iterations, _intern_hits))
+    _patch(Date, "from_iso_format", _timing("Date.from_iso_format", _date_regex_parse, _string_hits))
+    _patch(Time, "from_iso_format", _timing("Time.from_iso_format", _regex_parse))
+    _patch(Duration, "from_iso_format", _timing("Duration.from_iso_format", _regex_parse))
+
+
+def _uninstall():
+    while _patches:
+        cls, name, original = _patches.pop()
+        setattr(cls, name, original)
+
+
+def is_enabled():
+    """ Return :const:`True` if instrumentation is currently enabled.
+    """
+    return bool(_patches)
+
+
+def enable():
+    """ Start counting. Counters accumulate until :func:`.reset` is called.
+    """
+    if not _patches:
+        _install()
+
+
+def disable():
+    """ Stop counting. Counters retain their values.
+    """
+    _uninstall()
+
+
+def reset():
+    """ Reset all counters to zero.
+    """
+    _counters.clear()
+
+
+def counters():
+    """ Return a copy of the current counters as a flat dictionary.
+    """
+    return dict(_counters)
+
+
+@contextmanager
+def instrumented():
+    """ Context manager that enables instrumentation for the duration of
+    the block. The dictionary yielded is filled, when the block exits,
+    with the change in each counter over the block. Counters recorded
+    outside of the block are not affected.
+    """
+    was_enabled = is_enabled()
+    initial = counters()
+    enable()
+    result = {}
+    try:
+        yield result
+    finally:
+        if not was_enabled:
+            disable()
+        for key, value in _counters.items():
+            if value != initial.get(key, 0):
+                result[key] = value - initial.get(key, 0)
@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+""" This module provides half-open intervals of :class:`.Date` or
+:class:`.DateTime` values, and sets of such intervals.
+
+    >>> from neotime import DateTime
+    >>> a = Interval(DateTime(2018, 10, 1), DateTime(2018, 10, 3))
+    >>> b = Interval(DateTime(2018, 10, 2), DateTime(2018, 10, 4))
+    >>> a.overlaps(b)
+    True
+    >>> a.intersection(b)
+    Interval(neotime.DateTime(2018, 10, 2, 0, 0, 0.0), neotime.DateTime(2018, 10, 3, 0, 0, 0.0))
+
+Endpoints are compared by their integer instant in nanoseconds since the
+Unix epoch. Time zone aware endpoints are compared by their UTC instant,
+naive endpoints as-is, and dates by their midnight.
+"""
+
+from __future__ import absolute_import, division
+
+from bisect import bisect_left, bisect_right
+
+from neotime import temporal_to_nanoseconds
+
+
+class Interval(object):
+    """ The half-open interval of instants from `start` up to, but not
+    including, `end`. An interval where `start` equals `end` is empty.
+    """
+
+    def __init__(self, start, end):
+        self.__start_key = temporal_to_nanoseconds(start)
+        self.__end_key = temporal_to_nanoseconds(end)
+        if self.__end_key < self.__start_key:
+            raise ValueError("Interval end must not be before its start")
+        self.__start = start
+        self.__end = end
+
+    def __repr__(self):
+        return "Interval(%r, %r)" % (self.__start, self.__end)
+
+    def __eq__(self, other):
+        if isinstance(other, Interval):
+            return self.__start_key == other.__start_key and self.__end_key == other.__end_key
+        return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((self.__start_key, self.__end_key))
+
+    def __bool__(self):
+        return self.__end_key > self.__start_key
+
+    __nonzero__ = __bool__
+
+    def __contains__(self, item):
+        return self.contains(item)
+
+    @property
+    def start(self):
+        return self.__start
+
+    @property
+    def end(self):
+        return self.__end
+
+    def overlaps(self, other):
+        """ Return true if this interval shares any instant with another.
+        """
+        return max(self.__start_key, other.__start_key) < min(self.__end_key, other.__end_key)
+
+    def contains(self, item):
+        """ Return true if `item`, which may be a :class:`.Date`,
+        :class:`.DateTime` or :class:`.Interval`, lies within this interval.
+        """
+        if isinstance(item, Interval):
+            return self.__start_key <= item.__start_key and item.__end_key <= self.__end_key
+        return self.__start_key <= temporal_to_nanoseconds(item) < self.__end_key
+
+    def intersection(self, other):
+        """ Return the interval of instants shared with another, or
+        :const:`None` if the intervals do not overlap.
+        """
+        if not self.overlaps(other):
+            return None
+        start = self.__start if self.__start_key >= other.__start_key else other.__start
+        end = self.__end if self.__end_key <= other.__end_key else other.__end
+        return Interval(start, end)
+
+    def union(self, other):
+        """ Return the interval covering both this and another interval,
+        which must overlap or be adjacent. For any other intervals, use
+        an :class:`.IntervalSet`.
+        """
+        if self.__start_key > other.__end_key or other.__start_key > self.__end_key:
+            raise ValueError("Cannot form the union of disjoint intervals")
+        start = self.__start if self.__start_key <= other.__start_key else other.__start
+        end = self.__end if self.__end_key >= other.__end_key else other.__end
+        return Interval(start, end)
+
+
+class IntervalSet(object):
+    """ A set of instants, held as the sorted, disjoint intervals that
+    result from merging any overlapping or adjacent intervals given.
+    Merging sorts the intervals once and sweeps over them, so building
+    a set takes O(n log n) time and queries take O(log n) time.
+    """
+
+    def __init__(self, intervals=()):
+        self.__starts = []
+        self.__ends = []
+        self.__intervals = []
+        intervals = sorted((i for i in intervals if i), key=lambda i: i._Interval__start_key)
+        for interval in intervals:
+            start_key = interval._Interval__start_key
+            end_key = interval._Interval__end_key
+            if self.__ends and start_key <= self.__ends[-1]:
+                if end_key > self.__ends[-1]:
+                    self.__ends[-1] = end_key
+                    self.__intervals[-1] = Interval(self.__intervals[-1].start, interval.end)
+            else:
+                self.__starts.append(start_key)
+                self.__ends.append(end_key)
+                self.__intervals.append(interval)
+
+    def __repr__(self):
+        return "IntervalSet(%r)" % self.__intervals
+
+    def __eq__(self, other):
+        if isinstance(other, IntervalSet):
+            return self.__starts == other.__starts and self.__ends == other.__ends
+        return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __len__(self):
+        return len(self.__intervals)
+
+    def __bool__(self):
+        return bool(self.__intervals)
+
+    __nonzero__ = __bool__
+
+    def __iter__(self):
+        return iter(self.__intervals)
+
+    def __getitem__(self, index):
+        return self.__intervals[index]
+
+    def __contains__(self, item):
+        return self.contains(item)
+
+    def contains(self, item):
+        """ Return true if `item`, which may be a :class:`.Date`,
+        :class:`.DateTime` or :class:`.Interval`, lies within the set.
+        """
+        if isinstance(item, Interval):
+            if not item:
+                return True
+            start_key = item._Interval__start_key
+            end_key = item._Interval__end_key
+        else:
+            start_key = end_key = temporal_to_nanoseconds(item)
+        i = bisect_right(self.__starts, start_key) - 1
+        return i >= 0 and end_key <= self.__ends[i] and start_key < self.__ends[i]
+
+    def overlaps(self, interval):
+        """ Return true if any instant of `interval` lies within the set.
+        """
+        return bool(self.overlapping(interval))
+
+    def overlapping(self, interval):
+        """ Return a list of the intervals of the set that overlap
+        `interval`.
+        """
+        if not interval:
+            return []
+        i = bisect_right(self.__ends, interval._Interval__start_key)
+        j = bisect_left(self.__starts, interval._Interval__end_key)
+        return self.__intervals[i:j]
+
+    def union(self, other):
+        """ Return the set of instants in either this or another set.
+        """
+        return IntervalSet(self.__intervals + other.__intervals)
+
+    def intersection(self, other):
+        """ Return the set of instants in both this and another set.
+        """
+        intervals = []
+        i = j = 0
+        while i < len(self.__intervals) and j < len(other.__intervals):
+            overlap = self.__intervals[i].intersection(other.__intervals[j])
+            if overlap is not None:
+                intervals.append(overlap)
+            if self.__ends[i] <= other.__ends[j]:
+                i += 1
+            else:
+                j += 1
+        return IntervalSet(intervals)
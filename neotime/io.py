@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+
+""" This module provides streaming ISO 8601 parsing of temporal fields
+held in files and byte buffers, such as CSV or JSON Lines exports.
+
+Input is read in chunks of a bounded size and each field is parsed
+directly from its bytes, so no intermediate `str` is decoded per field.
+A source may be any binary file object, such as an `io.BufferedReader`,
+or any bytes-like buffer that supports `find`, such as `bytes`,
+`bytearray` or `mmap.mmap`.
+
+    >>> from neotime import Date
+    >>> list(parse_iso_stream(b"2018-10-01\\n2018-10-02\\n", Date))
+    [neotime.Date(2018, 10, 1), neotime.Date(2018, 10, 2)]
+
+Records are separated by `sep`. If `column` is given, each record is
+further split by `delimiter` and only the field at that index is parsed.
+Blank fields, such as that following a trailing newline, are skipped.
+"""
+
+from __future__ import absolute_import, division
+
+from array import array
+from collections import deque
+from datetime import date
+from re import compile as re_compile
+
+from neotime import INT64_TYPECODE, UNIX_EPOCH_ORDINAL, NANOSECONDS_PER_DAY, Date, Time, DateTime
+from neotime.timezones import fixed_offset
+
+
+DEFAULT_CHUNK_SIZE = 1048576
+
+_TIME = br"(\d{2})(?::(\d{2})(?::(\d{2})(?:\.(\d{1,9}))?)?)?(?:([+-])(\d{2}):(\d{2}))?"
+
+DATE_ISO_BYTES_PATTERN = re_compile(br"^(\d{4})-(\d{2})-(\d{2})$")
+TIME_ISO_BYTES_PATTERN = re_compile(br"^" + _TIME + br"$")
+DATETIME_ISO_BYTES_PATTERN = re_compile(br"^(\d{4})-(\d{2})-(\d{2})[T ]" + _TIME + br"$")
+
+
+def _match(pattern, field, type_name):
+    m = pattern.match(field)
+    if m is None:
+        raise ValueError("%s field %r is not in ISO format" % (type_name, field.decode("latin-1")))
+    return m.groups()
+
+
+def _time_fields(hour, minute, second, fraction):
+    hour = int(hour)
+    minute = int(minute or 0)
+    second = int(second or 0)
+    if hour > 23 or minute > 59 or second > 59:
+        raise ValueError("Time field out of range")
+    nanoseconds = int(fraction.ljust(9, b"0")) if fraction else 0
+    return 1000000000 * (3600 * hour + 60 * minute + second) + nanoseconds
+
+
+def _offset(sign, hours, minutes):
+    offset = 60 * int(hours) + int(minutes)
+    return -offset if sign == b"-" else offset
+
+
+def _time(hour, minute, second, fraction, sign, offset_hours, offset_minutes):
+    # Seconds are converted exactly as by Time.from_iso_format, so that
+    # both produce equal values
+    second = float(second + b"." + fraction) if fraction else int(second or 0)
+    tz = None if sign is None else fixed_offset(_offset(sign, offset_hours, offset_minutes))
+    return Time(int(hour), int(minute or 0), second, tz)
+
+
+def _parse_date(field):
+    year, month, day = _match(DATE_ISO_BYTES_PATTERN, field, "Date")
+    return Date(int(year), int(month), int(day))
+
+
+def _parse_time(field):
+    return _time(*_match(TIME_ISO_BYTES_PATTERN, field, "Time"))
+
+
+def _parse_datetime(field):
+    fields = _match(DATETIME_ISO_BYTES_PATTERN, field, "DateTime")
+    return DateTime.combine(Date(int(fields[0]), int(fields[1]), int(fields[2])), _time(*fields[3:]))
+
+
+def _date_key(field):
+    year, month, day = _match(DATE_ISO_BYTES_PATTERN, field, "Date")
+    return date(int(year), int(month), int(day)).toordinal()
+
+
+def _time_key(field):
+    return _time_fields(*_match(TIME_ISO_BYTES_PATTERN, field, "Time")[:4])
+
+
+def _datetime_key(field):
+    fields = _match(DATETIME_ISO_BYTES_PATTERN, field, "DateTime")
+    ordinal = date(int(fields[0]), int(fields[1]), int(fields[2])).toordinal()
+    nanoseconds = NANOSECONDS_PER_DAY * (ordinal - UNIX_EPOCH_ORDINAL) + _time_fields(*fields[3:7])
+    if fields[7] is not None:
+        nanoseconds -= 60000000000 * _offset(*fields[7:])
+    return nanoseconds
+
+
+_PARSERS = {
+    Date: (_parse_date, _date_key),
+    Time: (_parse_time, _time_key),
+    DateTime: (_parse_datetime, _datetime_key),
+}
+
+
+def _converters(cls):
+    try:
+        return _PARSERS[cls]
+    except KeyError:
+        raise TypeError("Cannot parse %s values from a stream" % cls.__name__)
+
+
+def _chunks(source, sep, chunk_size):
+    """ Split a source into chunks of whole records, each of roughly
+    `chunk_size` bytes.
+    """
+    if hasattr(source, "read"):
+        tail = b""
+        while True:
+            data = source.read(chunk_size)
+            if not data:
+                break
+            data = tail + data
+            end = data.rfind(sep)
+            if end == -1:
+                tail = data
+            else:
+                yield data[:end]
+                tail = data[end + len(sep):]
+        if tail:
+            yield tail
+    else:
+        start = 0
+        size = len(source)
+        while start < size:
+            end = source.find(sep, start + chunk_size) if start + chunk_size < size else -1
+            if end == -1:
+                end = size
+            yield source[start:end]
+            start = end + len(sep)
+
+
+def _chunk_parser(convert, sep, column, delimiter):
+    def parse(chunk):
+        records = chunk.split(sep)
+        if column is None:
+            return [convert(record.strip()) for record in records if record.strip()]
+        fields = (record.split(delimiter)[column].strip() for record in records if record.strip())
+        return [convert(field) for field in fields if field]
+    return parse
+
+
+def _parse_chunks(source, convert, sep, column, delimiter, chunk_size, workers):
+    """ Yield a list of parsed fields for each chunk of the source, in
+    order. If `workers` is given, chunks are parsed in a thread pool,
+    with no more than two chunks per worker in memory at once.
+    """
+    parse = _chunk_parser(convert, sep, column, delimiter)
+    chunks = _chunks(source, sep, chunk_size)
+    if not workers:
+        for chunk in chunks:
+            yield parse(chunk)
+        return
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(parse, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def parse_iso_stream(source, cls=DateTime, sep=b"\n", column=None, delimiter=b",",
+                     chunk_size=DEFAULT_CHUNK_SIZE, workers=None):
+    """ Parse ISO 8601 fields from a binary file or buffer, yielding a
+    :class:`.Date`, :class:`.Time` or :class:`.DateTime` value, as
+    selected by `cls`, for each field.
+
+    Time zone offsets are parsed as given by :func:`.fixed_offset`. If
+    `workers` is given, chunks are parsed by a pool of that many threads.
+    """
+    parse, _ = _converters(cls)
+    for values in _parse_chunks(source, parse, sep, column, delimiter, chunk_size, workers):
+        for value in values:
+            yield value
+
+
+def parse_iso_columns(source, cls=DateTime, sep=b"\n", column=None, delimiter=b",",
+                      chunk_size=DEFAULT_CHUNK_SIZE, workers=None):
+    """ Parse ISO 8601 fields from a binary file or buffer into a single
+    64-bit integer `array`, without creating any neotime values.
+
+    Each :class:`.Date` field is stored as its ordinal, each :class:`.Time`
+    field as nanoseconds since midnight, ignoring any offset, and each
+    :class:`.DateTime` field as nanoseconds since the Unix Epoch, measured
+    from the UTC instant where an offset is given. These match the values
+    of :meth:`.Date.to_ordinal`, :func:`.time_to_nanoseconds` and
+    :func:`.datetime_to_nanoseconds` respectively.
+    """
+    _, key = _converters(cls)
+    keys = array(INT64_TYPECODE)
+    for values in _parse_chunks(source, key, sep, column, delimiter, chunk_size, workers):
+        keys.extend(values)
+    return keys
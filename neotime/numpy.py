@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+""" This module provides conversions between neotime values and NumPy
+`datetime64[ns]` and `timedelta64[ns]` values and arrays. NumPy is an
+optional dependency and is only imported when this module is loaded.
+
+Values are mapped via an integer count of nanoseconds, so no native
+Python `datetime` objects are created along the way.
+"""
+
+from __future__ import absolute_import, division
+
+import numpy
+
+from neotime import (MIN_INT64, MAX_INT64, UNIX_EPOCH_ORDINAL, NANOSECONDS_PER_DAY,
+                     Date, Time, DateTime, Duration, datetime_to_nanoseconds, duration_to_nanoseconds)
+from neotime.arithmetic import symmetric_divmod
+
+
+DATETIME64_RANGE = "1677-09-21T00:12:43.145224193..2262-04-11T23:47:16.854775807"
+
+DTYPE_KINDS = {
+    "datetime64": "M",
+    "timedelta64": "m",
+}
+
+
+def _check_range(nanoseconds, value, type_name):
+    # MIN_INT64 is reserved by NumPy to represent NaT
+    if nanoseconds <= MIN_INT64 or nanoseconds > MAX_INT64:
+        if type_name == "datetime64":
+            raise ValueError("%r out of range for datetime64[ns] (%s)" % (value, DATETIME64_RANGE))
+        raise ValueError("%r out of range for %s[ns]" % (value, type_name))
+    return nanoseconds
+
+
+# Units no coarser than nanoseconds, which cannot overflow when cast to them
+FINE_UNITS = ("ns", "ps", "fs", "as")
+
+
+def _nanoseconds(array, type_name):
+    array = numpy.asarray(array)
+    if array.dtype.kind != DTYPE_KINDS[type_name]:
+        raise TypeError("Expected %s values, not %s" % (type_name, array.dtype))
+    if numpy.isnat(array).any():
+        raise ValueError("Cannot convert NaT")
+    unit, count = numpy.datetime_data(array.dtype)
+    if unit in ("Y", "M") and type_name == "datetime64":
+        array = array.astype("datetime64[D]")
+        unit, count = "D", 1
+    if unit not in FINE_UNITS:
+        # NumPy wraps silently on overflow, so check the range in the source unit
+        limit = MAX_INT64 // int(numpy.timedelta64(count, unit) // numpy.timedelta64(1, "ns"))
+        units = array.view("int64")
+        overflow = (units < -limit) | (units > limit)
+        if overflow.any():
+            _check_range(MIN_INT64, array[overflow][0], type_name)
+    return array.astype("%s[ns]" % type_name).view("int64")
+
+
+def to_datetime64(value):
+    """ Convert a :class:`.DateTime` to a NumPy `datetime64[ns]` value.
+    """
+    nanoseconds = _check_range(datetime_to_nanoseconds(value), value, "datetime64")
+    return numpy.datetime64(nanoseconds, "ns")
+
+
+def to_datetime64_many(values):
+    """ Convert a sequence of :class:`.DateTime` values to a NumPy
+    `datetime64[ns]` array.
+    """
+    nanoseconds = []
+    append = nanoseconds.append
+    for value in values:
+        append(_check_range(datetime_to_nanoseconds(value), value, "datetime64"))
+    return numpy.array(nanoseconds, dtype="int64").view("datetime64[ns]")
+
+
+def from_datetime64(value):
+    """ Convert a NumPy `datetime64` value to a naive :class:`.DateTime`.
+    """
+    return from_datetime64_many(numpy.asarray([value]))[0]
+
+
+def from_datetime64_many(array):
+    """ Convert a NumPy `datetime64` array to a list of naive
+    :class:`.DateTime` values. The :class:`.Date` part of each value
+    is shared between values that fall on the same day.
+    """
+    days, nanoseconds = numpy.divmod(_nanoseconds(array, "datetime64"), NANOSECONDS_PER_DAY)
+    dates = {}
+    combine = DateTime.combine
+    from_ticks = Time.from_ticks
+    values = []
+    append = values.append
+    for day, nanosecond in zip(days.tolist(), nanoseconds.tolist()):
+        try:
+            date_ = dates[day]
+        except KeyError:
+            date_ = dates[day] = Date.from_ordinal(UNIX_EPOCH_ORDINAL + day)
+        append(combine(date_, from_ticks(nanosecond / 1000000000)))
+    return values
+
+
+def to_timedelta64(value):
+    """ Convert a :class:`.Duration` without months to a NumPy
+    `timedelta64[ns]` value.
+    """
+    nanoseconds = _check_range(duration_to_nanoseconds(value), value, "timedelta64")
+    return numpy.timedelta64(nanoseconds, "ns")
+
+
+def to_timedelta64_many(values):
+    """ Convert a sequence of :class:`.Duration` values without months
+    to a NumPy `timedelta64[ns]` array.
+    """
+    nanoseconds = []
+    append = nanoseconds.append
+    for value in values:
+        append(_check_range(duration_to_nanoseconds(value), value, "timedelta64"))
+    return numpy.array(nanoseconds, dtype="int64").view("timedelta64[ns]")
+
+
+def from_timedelta64(value):
+    """ Convert a NumPy `timedelta64` value to a :class:`.Duration`.
+    """
+    return from_timedelta64_many(numpy.asarray([value]))[0]
+
+
+def from_timedelta64_many(array):
+    """ Convert a NumPy `timedelta64` array to a list of :class:`.Duration`
+    values. Whole days are held in the `days` component, with days and
+    seconds carrying the same sign.
+    """
+    values = []
+    append = values.append
+    for nanoseconds in _nanoseconds(array, "timedelta64").tolist():
+        days, nanoseconds = symmetric_divmod(nanoseconds, NANOSECONDS_PER_DAY)
+        append(Duration(days=days, nanoseconds=nanoseconds))
+    return values
@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+
+""" This module compiles strptime-style format strings for the
+:meth:`parse` methods of the temporal classes.
+
+Each format string is compiled once into a regular expression and a
+list of field converters, and held in :data:`.pattern_cache`. The
+directives understood are those produced by :mod:`neotime.formatting`,
+except for the week-based ``%U``, ``%W``, ``%G`` and ``%V``, and the
+time zone name ``%Z``. Both ``%f`` and ``%N`` accept from one to nine
+digits of fractional seconds. Names of days and months are matched in
+English, regardless of case. Whitespace in a format string matches
+one or more whitespace characters.
+"""
+
+from datetime import date
+from re import compile as re_compile, escape, IGNORECASE
+
+from neotime.caching import LRUCache
+from neotime.formatting import DAY_NAMES, MONTH_NAMES, EXPANSIONS
+
+
+#: Compiled patterns, keyed by format string.
+pattern_cache = LRUCache(256)
+
+
+def _names(names, length=None):
+    return {(name if length is None else name[:length]).lower(): i for i, name in enumerate(names)}
+
+
+_MONTHS = _names(MONTH_NAMES)
+_MONTH_ABBREVIATIONS = _names(MONTH_NAMES, 3)
+_DAYS = _names(DAY_NAMES)
+_DAY_ABBREVIATIONS = _names(DAY_NAMES, 3)
+
+
+def _alternatives(names):
+    return "(%s)" % "|".join(sorted(names, key=len, reverse=True))
+
+
+def _two_digit_year(s):
+    # As for time.strptime, 69-99 map to 1969-1999 and 0-68 to 2000-2068
+    year = int(s)
+    return year + (1900 if year >= 69 else 2000)
+
+
+def _fraction(s):
+    return int(s.ljust(9, "0"))
+
+
+def _offset(s):
+    if s in ("Z", "z"):
+        return 0
+    minutes = 60 * int(s[1:3]) + int(s[-2:])
+    return -minutes if s[0] == "-" else minutes
+
+
+#: Regular expression, field name and converter for each directive.
+DIRECTIVES = {
+    "Y": (r"(\d{4})", "year", int),
+    "y": (r"(\d{2})", "year", _two_digit_year),
+    "m": (r"(\d{1,2})", "month", int),
+    "b": (_alternatives(_MONTH_ABBREVIATIONS), "month", lambda s: _MONTH_ABBREVIATIONS[s.lower()] + 1),
+    "B": (_alternatives(_MONTHS), "month", lambda s: _MONTHS[s.lower()] + 1),
+    "d": (r"(\d{1,2})", "day", int),
+    "e": (r" ?(\d{1,2})", "day", int),
+    "j": (r"(\d{1,3})", "year_day", int),
+    "a": (_alternatives(_DAY_ABBREVIATIONS), None, None),
+    "A": (_alternatives(_DAYS), None, None),
+    "w": (r"([0-6])", None, None),
+    "u": (r"([1-7])", None, None),
+    "H": (r"(\d{1,2})", "hour", int),
+    "I": (r"(\d{1,2})", "hour12", int),
+    "p": (r"(AM|PM)", "pm", lambda s: s.upper() == "PM"),
+    "M": (r"(\d{1,2})", "minute", int),
+    "S": (r"(\d{1,2})", "second", int),
+    "f": (r"(\d{1,9})", "nanosecond", _fraction),
+    "N": (r"(\d{1,9})", "nanosecond", _fraction),
+    "z": (r"(Z|[+-]\d{2}:?\d{2})", "offset", _offset),
+}
+
+
+def _translate(format_spec, fields):
+    """ Translate a format string to the source of a regular expression,
+    appending the field name and converter of each group to `fields`.
+    """
+    parts = []
+    i, n = 0, len(format_spec)
+    while i < n:
+        c = format_spec[i]
+        if c != "%":
+            parts.append(r"\s+" if c.isspace() else escape(c))
+            i += 1
+            while c.isspace() and i < n and format_spec[i].isspace():
+                i += 1
+            continue
+        if i + 1 == n:
+            raise ValueError("Incomplete format directive at end of %r" % format_spec)
+        directive = format_spec[i + 1]
+        i += 2
+        if directive == "%":
+            parts.append("%")
+        elif directive in EXPANSIONS:
+            parts.append(_translate(EXPANSIONS[directive], fields))
+        elif directive in DIRECTIVES:
+            regex, name, convert = DIRECTIVES[directive]
+            parts.append(regex)
+            fields.append((name, convert))
+        else:
+            raise ValueError("Invalid format directive %%%s in %r" % (directive, format_spec))
+    return "".join(parts)
+
+
+def _resolve(values):
+    """ Resolve parsed values to a tuple of year, month, day, hour,
+    minute, second, nanosecond and UTC offset in minutes (or
+    :const:`None`), with defaults as for :func:`time.strptime`.
+    """
+    year = values.get("year", 1900)
+    if "year_day" in values:
+        d = date.fromordinal(date(year, 1, 1).toordinal() + values["year_day"] - 1)
+        month, day = d.month, d.day
+    else:
+        month = values.get("month", 1)
+        day = values.get("day", 1)
+    if "hour12" in values:
+        hour = values["hour12"] % 12 + (12 if values.get("pm") else 0)
+    else:
+        hour = values.get("hour", 0)
+    return (year, month, day, hour, values.get("minute", 0), values.get("second", 0),
+            values.get("nanosecond", 0), values.get("offset"))
+
+
+def compile_pattern(format_spec):
+    """ Compile a strptime-style format string into a function that
+    parses a string to a tuple of fields, as described for
+    :func:`.parse_fields`. Raises :exc:`ValueError` for unknown
+    directives.
+    """
+    parse = pattern_cache.get(format_spec)
+    if parse is not None:
+        return parse
+    fields = []
+    match = re_compile(_translate(format_spec, fields) + "$", IGNORECASE).match
+    fields = [(i, name, convert) for i, (name, convert) in enumerate(fields) if name is not None]
+
+    def parse(s):
+        m = match(s)
+        if m is None:
+            raise ValueError("String %r does not match format %r" % (s, format_spec))
+        groups = m.groups()
+        return _resolve({name: convert(groups[i]) for i, name, convert in fields})
+
+    pattern_cache.put(format_spec, parse)
+    return parse
+
+
+def parse_fields(s, format_spec):
+    """ Parse a string according to a strptime-style format string,
+    returning a tuple of year, month, day, hour, minute, second,
+    nanosecond and UTC offset in minutes, or :const:`None` if the
+    format has no ``%z`` directive.
+    """
+    return compile_pattern(format_spec)(s)
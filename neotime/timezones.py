@@ -0,0 +1,315 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+""" This module compiles time zones into arrays of integer transition
+instants and UTC offsets, so that converting values to a time zone
+needs only a bisect per value, rather than a call into the time zone
+implementation.
+
+    >>> from pytz import timezone, utc
+    >>> from neotime import DateTime
+    >>> as_timezone_many([DateTime(2018, 7, 1, 12, tzinfo=utc)], timezone("Europe/Stockholm"))
+    [neotime.DateTime(2018, 7, 1, 14, 0, 0.0, tzinfo=<DstTzInfo 'Europe/Stockholm' CEST+2:00:00 DST>)]
+
+Time zones are looked up by name with :func:`.get_zone`, which prefers
+the standard library :mod:`zoneinfo` module and falls back to pytz. Fixed
+offsets are created by :func:`.fixed_offset`. Neither backend is imported
+until a time zone is first needed.
+
+For a pytz time zone, the transition table held by the zone is used as-is,
+and converted values carry the same localized `tzinfo` objects as pytz
+would give them. A time zone with a fixed offset compiles to a single
+entry. For any other `tzinfo`, including :mod:`zoneinfo` zones, the
+transitions between the years :const:`PROBE_START_YEAR` and
+:const:`PROBE_END_YEAR` are found by probing the offset once a day, and
+instants outside that window are converted by calling the `tzinfo`
+directly. Probing takes some 73,000 calls into the `tzinfo`, a fraction
+of a second, so it is only done for batch conversions; single values
+are converted by :func:`.as_timezone` with one call instead. An offset
+that changes and changes back within one day is not seen by probing.
+"""
+
+from __future__ import absolute_import, division
+
+from array import array
+from bisect import bisect_right
+from datetime import datetime, timedelta
+try:
+    from datetime import timezone
+except ImportError:
+    timezone = None
+
+from neotime import (INT64_TYPECODE, UNIX_EPOCH_ORDINAL, NANOSECONDS_PER_DAY, Date, Time, DateTime,
+                     datetime_to_nanoseconds)
+
+
+PROBE_START_YEAR = 1900
+PROBE_END_YEAR = 2100
+
+_EPOCH = datetime(1970, 1, 1)
+
+# Seconds since the Unix epoch of 0001-01-01T00:00:00
+_MIN_SECONDS = -86400 * (UNIX_EPOCH_ORDINAL - 1)
+
+
+def _seconds(value):
+    """ Return a `timedelta` as a whole number of seconds.
+    """
+    return 86400 * value.days + value.seconds
+
+
+def _utc_offset(tz, seconds):
+    """ Ask a `tzinfo` for its offset in seconds at an instant given in
+    seconds since the Unix epoch.
+    """
+    return _seconds(tz.fromutc((_EPOCH + timedelta(seconds=seconds)).replace(tzinfo=tz)).utcoffset())
+
+
+def _needs_probing(tz):
+    """ Return true if compiling `tz` requires probing its offsets, as
+    for any time zone that is neither from pytz nor a fixed offset.
+    """
+    return not hasattr(tz, "_utc_transition_times") and tz.utcoffset(None) is None
+
+
+def _shift(value, offset, tzinfo):
+    """ Return a time zone aware :class:`.DateTime` as the same instant
+    with the given offset in seconds and `tzinfo`.
+    """
+    nanoseconds = datetime_to_nanoseconds(value) + 1000000000 * offset
+    ordinal, nanoseconds = divmod(nanoseconds + NANOSECONDS_PER_DAY * UNIX_EPOCH_ORDINAL, NANOSECONDS_PER_DAY)
+    return DateTime.combine(Date._Date__from_native_ordinal(ordinal),
+                            Time._Time__from_nanoseconds(nanoseconds, tzinfo))
+
+
+def _zoneinfo_zone(name):
+    try:
+        from zoneinfo import ZoneInfo
+    except ImportError:
+        from backports.zoneinfo import ZoneInfo
+    return ZoneInfo(name)
+
+
+def _pytz_zone(name):
+    from pytz import timezone as pytz_timezone
+    return pytz_timezone(name)
+
+
+#: Time zone backends by name, each a function from a zone name to a `tzinfo`
+BACKENDS = {
+    "zoneinfo": _zoneinfo_zone,
+    "pytz": _pytz_zone,
+}
+
+_DEFAULT_BACKENDS = ["zoneinfo", "pytz"]
+
+_backends = [BACKENDS[name] for name in _DEFAULT_BACKENDS]
+_zones = {}
+_offsets = {}
+
+
+def set_backend(backend=None):
+    """ Select the backend used by :func:`.get_zone`, either by a name
+    in :data:`.BACKENDS` or as a function from a zone name to a `tzinfo`.
+    With no argument, the default order of preference is restored. This
+    clears the cache of time zones.
+    """
+    global _backends
+    if backend is None:
+        _backends = [BACKENDS[name] for name in _DEFAULT_BACKENDS]
+    elif callable(backend):
+        _backends = [backend]
+    else:
+        _backends = [BACKENDS[backend]]
+    _zones.clear()
+
+
+def get_zone(name):
+    """ Return the time zone with an IANA `name`, such as
+    ``"Europe/Stockholm"``, from the first backend that provides it.
+    Time zones are cached by name.
+    """
+    try:
+        return _zones[name]
+    except KeyError:
+        pass
+    unknown = False
+    for backend in _backends:
+        try:
+            zone = backend(name)
+        except ImportError:
+            continue
+        except KeyError:
+            # Both zoneinfo and pytz raise a subclass of KeyError
+            unknown = True
+            continue
+        _zones[name] = zone
+        return zone
+    if unknown:
+        raise KeyError("Unknown time zone %r" % name)
+    raise ImportError("No time zone backend is available; use Python 3.9 or later, or install pytz")
+
+
+def fixed_offset(minutes):
+    """ Return a time zone with a fixed offset from UTC in minutes. This
+    is a `pytz.FixedOffset` if pytz is installed, for compatibility with
+    earlier versions of neotime, or a `datetime.timezone` otherwise.
+    """
+    try:
+        return _offsets[minutes]
+    except KeyError:
+        pass
+    try:
+        from pytz import FixedOffset
+    except ImportError:
+        if timezone is None:
+            raise
+        tz = timezone(timedelta(minutes=minutes))
+    else:
+        tz = FixedOffset(minutes)
+    _offsets[minutes] = tz
+    return tz
+
+
+class CompiledZone(object):
+    """ A time zone compiled into parallel arrays of the UTC instants,
+    in seconds since the Unix epoch, at which each offset starts to
+    apply, the offsets in seconds and the `tzinfo` objects to attach to
+    converted values.
+    """
+
+    def __init__(self, tz):
+        self.__tz = tz
+        self.__transitions = array(INT64_TYPECODE)
+        self.__offsets = array("l")
+        self.__tzinfos = []
+        self.__window = None
+        if hasattr(tz, "_utc_transition_times"):
+            # A pytz time zone, with its own transition table
+            for when, info in zip(tz._utc_transition_times, tz._transition_info):
+                self.__add(max(_MIN_SECONDS, _seconds(when - _EPOCH)), _seconds(info[0]), tz._tzinfos[info])
+        elif _needs_probing(tz):
+            self.__probe()
+        else:
+            self.__add(_MIN_SECONDS, _seconds(tz.utcoffset(None)), tz)
+
+    def __repr__(self):
+        return "<%s %r transitions=%d>" % (type(self).__name__, self.__tz, len(self.__transitions))
+
+    def __add(self, seconds, offset, tzinfo):
+        self.__transitions.append(seconds)
+        self.__offsets.append(offset)
+        self.__tzinfos.append(tzinfo)
+
+    def __probe(self):
+        """ Find the transitions within the probe window by checking the
+        offset at the start of each day, then bisecting to the second
+        within any day in which it changes. Several transitions within
+        one day are found as long as the offset differs at its end.
+        """
+        tz = self.__tz
+        start = _seconds(datetime(PROBE_START_YEAR, 1, 1) - _EPOCH)
+        end = _seconds(datetime(PROBE_END_YEAR + 1, 1, 1) - _EPOCH)
+        self.__window = (start, end)
+        offset = _utc_offset(tz, start)
+        self.__add(start, offset, tz)
+        for day in range(start + 86400, end, 86400):
+            day_offset = _utc_offset(tz, day)
+            lo = day - 86400
+            while offset != day_offset:
+                hi = day
+                while hi - lo > 1:
+                    mid = (lo + hi) // 2
+                    if _utc_offset(tz, mid) == offset:
+                        lo = mid
+                    else:
+                        hi = mid
+                offset = _utc_offset(tz, hi)
+                self.__add(hi, offset, tz)
+                lo = hi
+
+    @property
+    def tz(self):
+        return self.__tz
+
+    def resolve(self, seconds):
+        """ Return the offset in seconds and the `tzinfo` that apply at an
+        instant given in seconds since the Unix epoch.
+        """
+        window = self.__window
+        if window is not None and not window[0] <= seconds < window[1]:
+            return _utc_offset(self.__tz, seconds), self.__tz
+        i = bisect_right(self.__transitions, seconds) - 1
+        if i < 0:
+            i = 0
+        return self.__offsets[i], self.__tzinfos[i]
+
+    def as_timezone(self, value):
+        """ Convert a time zone aware :class:`.DateTime` to the same
+        instant in this time zone. Naive values are returned unchanged.
+        """
+        if value is None or value.tzinfo is None:
+            return value
+        offset, tzinfo = self.resolve(datetime_to_nanoseconds(value) // 1000000000)
+        return _shift(value, offset, tzinfo)
+
+    def as_timezone_many(self, values):
+        """ Convert a sequence of values, as for :meth:`.as_timezone`, to
+        produce a list. :const:`None` values are passed through.
+        """
+        return list(map(self.as_timezone, values))
+
+
+_compiled = {}
+
+
+def compile_zone(tz):
+    """ Return the :class:`.CompiledZone` for a `tzinfo`, compiling it on
+    first use.
+    """
+    try:
+        return _compiled[tz]
+    except KeyError:
+        zone = _compiled[tz] = CompiledZone(tz)
+        return zone
+
+
+def as_timezone(value, tz):
+    """ Convert a single time zone aware :class:`.DateTime` to the time
+    zone `tz`, as for :meth:`.DateTime.as_timezone`. Zones that compile
+    cheaply, or have already been compiled, are compiled and cached.
+    Any other zone is asked for its offset directly, as probing it for
+    a single value would cost far more than the conversion.
+    """
+    zone = _compiled.get(tz)
+    if zone is None and _needs_probing(tz):
+        if value.tzinfo is None:
+            return value
+        return _shift(value, _utc_offset(tz, datetime_to_nanoseconds(value) // 1000000000), tz)
+    return compile_zone(tz).as_timezone(value)
+
+
+def as_timezone_many(values, tz):
+    """ Convert a sequence of :class:`.DateTime` values to the time zone
+    `tz`, as for :meth:`.DateTime.as_timezone`, to produce a list. The
+    time zone is compiled only once.
+    """
+    return compile_zone(tz).as_timezone_many(values)
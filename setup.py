@@ -31,9 +31,15 @@ from neotime.meta import package, version
 
 
 install_requires = [
-    "pytz",
-    "six",
+    # Named time zones come from the standard library zoneinfo module
+    # where available, so pytz is only needed on earlier versions
+    'pytz; python_version < "3.9"',
 ]
+extras_require = {
+    "arrow": ["pyarrow"],
+    "numpy": ["numpy"],
+    "pytz": ["pytz"],
+}
 classifiers = [
     "Intended Audience :: Developers",
     "License :: OSI Approved :: Apache Software License",
@@ -58,6 +64,7 @@ setup_args = {
     "author_email": "drivers@neo4j.com",
     "url": "https://neotime.readthedocs.io",
     "install_requires": install_requires,
+    "extras_require": extras_require,
     "classifiers": classifiers,
     "packages": packages,
 }
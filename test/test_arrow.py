@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from unittest import TestCase, skipIf
+
+from pytz import timezone, FixedOffset
+
+from neotime import Date, Time, DateTime, Duration
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+else:
+    from neotime.arrow import (dates_to_arrow, times_to_arrow, datetimes_to_arrow, durations_to_arrow,
+                               to_arrow, from_arrow)
+
+
+eastern = timezone("US/Eastern")
+
+
+@skipIf(pyarrow is None, "PyArrow is not installed")
+class ArrowTestCase(TestCase):
+
+    def test_dates(self):
+        dates = [Date(2018, 10, 1), None, Date(1, 1, 1), Date(9999, 12, 31)]
+        array = dates_to_arrow(dates)
+        self.assertEqual(array.type, pyarrow.date32())
+        self.assertEqual(array.null_count, 1)
+        self.assertEqual(array[0].as_py(), Date(2018, 10, 1).to_native())
+        self.assertEqual(from_arrow(array), dates)
+
+    def test_date64(self):
+        array = dates_to_arrow([Date(2018, 10, 1)]).cast(pyarrow.date64())
+        self.assertEqual(from_arrow(array), [Date(2018, 10, 1)])
+
+    def test_times(self):
+        times = [Time(12, 34, 56.789123456), None, Time(0, 0, 0), Time(23, 59, 59.999999999)]
+        array = times_to_arrow(times)
+        self.assertEqual(array.type, pyarrow.time64("ns"))
+        self.assertEqual(array.cast(pyarrow.int64())[0].as_py(), 45296789123456)
+        self.assertEqual(from_arrow(array), times)
+
+    def test_naive_datetimes(self):
+        dts = [DateTime(2018, 10, 1, 12, 34, 56.789123456), None, DateTime(1969, 12, 31, 23, 59, 59.999999999)]
+        array = datetimes_to_arrow(dts)
+        self.assertEqual(array.type, pyarrow.timestamp("ns"))
+        self.assertEqual(array.cast(pyarrow.int64())[2].as_py(), -1)
+        self.assertEqual(from_arrow(array), dts)
+
+    def test_aware_datetimes_default_to_utc(self):
+        dt = DateTime(2018, 10, 1, 12, 34, 56.789123456, tzinfo=FixedOffset(60))
+        array = datetimes_to_arrow([dt])
+        self.assertEqual(array.type, pyarrow.timestamp("ns", tz="UTC"))
+        value, = from_arrow(array)
+        self.assertEqual(value.utc_offset().total_seconds(), 0)
+        self.assertEqual(value.hour_minute_second, (11, 34, 56.789123456))
+
+    def test_datetimes_mixing_naive_and_aware(self):
+        aware = DateTime(2020, 1, 1, tzinfo=FixedOffset(60))
+        with self.assertRaises(ValueError):
+            _ = datetimes_to_arrow([DateTime(2020, 1, 1), None, aware])
+        with self.assertRaises(ValueError):
+            _ = datetimes_to_arrow([aware, DateTime(2020, 1, 1)])
+
+    def test_naive_datetimes_with_tz(self):
+        with self.assertRaises(ValueError):
+            _ = datetimes_to_arrow([None, DateTime(2020, 1, 1)], tz="UTC")
+
+    def test_datetimes_with_named_tz(self):
+        dt = eastern.localize(DateTime(2018, 10, 1, 12, 34, 56.789123456))
+        array = datetimes_to_arrow([dt], tz="US/Eastern")
+        value, = from_arrow(array)
+        self.assertEqual(value, dt)
+        self.assertEqual(value.tzname(), "EDT")
+
+    def test_datetimes_with_offset_tz(self):
+        dt = DateTime(2018, 10, 1, 12, 34, 56, tzinfo=FixedOffset(-90))
+        value, = from_arrow(datetimes_to_arrow([dt], tz="-01:30"))
+        self.assertEqual(value, dt)
+
+    def test_datetimes_with_coarser_unit(self):
+        array = datetimes_to_arrow([DateTime(2018, 10, 1, 12, 34, 56.789)]).cast(pyarrow.timestamp("ms"))
+        self.assertEqual(from_arrow(array), [DateTime(2018, 10, 1, 12, 34, 56.789)])
+
+    def test_durations(self):
+        durations = [Duration(months=14, days=-3, seconds=5.000000006), None, Duration()]
+        array = durations_to_arrow(durations)
+        self.assertEqual(array.type, pyarrow.month_day_nano_interval())
+        self.assertEqual(tuple(array[0].as_py()), (14, -3, 5000000006))
+        self.assertEqual(from_arrow(array), durations)
+
+    def test_to_arrow_infers_type(self):
+        self.assertEqual(to_arrow([None, Date(2018, 10, 1)]).type, pyarrow.date32())
+        self.assertEqual(to_arrow([Time(1, 2, 3)]).type, pyarrow.time64("ns"))
+        self.assertEqual(to_arrow([DateTime(2018, 10, 1)]).type, pyarrow.timestamp("ns"))
+        self.assertEqual(to_arrow([DateTime(2018, 10, 1, tzinfo=FixedOffset(60))], tz="US/Eastern").type,
+                         pyarrow.timestamp("ns", tz="US/Eastern"))
+        self.assertEqual(to_arrow([Duration(days=1)]).type, pyarrow.month_day_nano_interval())
+
+    def test_to_arrow_without_values(self):
+        with self.assertRaises(ValueError):
+            _ = to_arrow([None])
+
+    def test_to_arrow_with_other_type(self):
+        with self.assertRaises(TypeError):
+            _ = to_arrow([1])
+
+    def test_from_arrow_with_other_type(self):
+        with self.assertRaises(TypeError):
+            _ = from_arrow(pyarrow.array([1]))
+
+    def test_chunked_array(self):
+        dates = [Date(2018, 10, 1), Date(2018, 10, 2)]
+        chunked = pyarrow.chunked_array([dates_to_arrow(dates[:1]), dates_to_arrow(dates[1:])])
+        self.assertEqual(from_arrow(chunked), dates)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+
+import asyncio
+from unittest import TestCase
+
+from neotime import ClockTime, DateTime, Duration
+from neotime.asyncio import time_until, sleep_until, wait_until, every
+from neotime.clock_implementations import PEP564Clock, SafeClock
+
+
+# An explicit wall clock, as other test modules register fixed clocks
+# that Clock() would otherwise select
+clock = object.__new__(PEP564Clock if PEP564Clock.available() else SafeClock)
+
+
+def now():
+    t = clock.utc_time()
+    return 1000000000 * t.seconds + t.nanoseconds
+
+
+def clock_time(nanoseconds):
+    seconds, nanoseconds = divmod(nanoseconds, 1000000000)
+    return ClockTime(seconds, nanoseconds)
+
+
+class FixedClock(object):
+
+    def utc_time(self):
+        return ClockTime(1000, 0)
+
+
+class CountingClock(object):
+
+    def __init__(self):
+        self.reads = 0
+
+    def utc_time(self):
+        self.reads += 1
+        return clock.utc_time()
+
+
+class AsyncioTestCase(TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_time_until(self):
+        self.assertEqual(time_until(ClockTime(1001, 500), FixedClock()), Duration(seconds=1, nanoseconds=500))
+        self.assertEqual(time_until(ClockTime(999), FixedClock()), Duration(seconds=-1))
+        self.assertEqual(time_until(DateTime(1970, 1, 1, 0, 16, 40), FixedClock()), Duration())
+
+    def test_bad_deadline(self):
+        with self.assertRaises(TypeError):
+            _ = time_until(1000)
+
+    def test_sleep_until(self):
+        deadline = now() + 50000000
+        self.loop.run_until_complete(sleep_until(clock_time(deadline), clock=clock, loop=self.loop))
+        self.assertGreaterEqual(now(), deadline)
+
+    def test_sleep_until_past_deadline(self):
+        future = sleep_until(DateTime(2000, 1, 1, 0, 0, 0), clock=clock, loop=self.loop)
+        self.assertTrue(future.done())
+
+    def test_cancel_sleep_until(self):
+        counting_clock = CountingClock()
+        future = sleep_until(clock_time(now() + 20000000), clock=counting_clock, loop=self.loop)
+        future.cancel()
+        reads = counting_clock.reads
+        self.loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertTrue(future.cancelled())
+        self.assertEqual(counting_clock.reads, reads)
+
+    def test_wait_until_times_out(self):
+        never = self.loop.create_future()
+        with self.assertRaises(asyncio.TimeoutError):
+            self.loop.run_until_complete(wait_until(never, clock_time(now() + 20000000), clock=clock))
+
+    def test_every_is_aligned(self):
+        interval = 20000000
+        calls = []
+        done = self.loop.create_future()
+
+        def callback(tag):
+            calls.append((tag, now()))
+            if len(calls) == 3:
+                periodic.cancel()
+                done.set_result(None)
+
+        periodic = every(Duration(nanoseconds=interval), callback, args=("tick",), clock=clock, loop=self.loop)
+        self.loop.run_until_complete(done)
+        self.assertTrue(periodic.cancelled)
+        boundaries = [t // interval for _, t in calls]
+        self.assertEqual(boundaries, sorted(set(boundaries)))
+        for tag, t in calls:
+            self.assertEqual(tag, "tick")
+            self.assertLess(t % interval, interval // 2)
+
+    def test_every_rejects_bad_intervals(self):
+        with self.assertRaises(ValueError):
+            _ = every(0, print, loop=self.loop)
+        with self.assertRaises(ValueError):
+            _ = every(Duration(months=1), print, loop=self.loop)
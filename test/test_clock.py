@@ -19,9 +19,12 @@
 # limitations under the License.
 
 
+from threading import Thread
+from time import sleep
 from unittest import TestCase
 
-from neotime import Clock, ClockTime
+from neotime import Clock, ClockTime, DateTime
+from neotime.clock_implementations import SafeClock, LibCClock
 
 
 class ClockTestCase(TestCase):
@@ -34,6 +37,35 @@ class ClockTestCase(TestCase):
         finally:
             Clock._Clock__implementations = None
 
+    def test_implementations_probed_once_across_threads(self):
+        probes = []
+        originals = [(clock, vars(clock)["available"]) for clock in (SafeClock, LibCClock)]
+
+        def counting(clock, original):
+            def available(cls):
+                probes.append(clock)
+                sleep(0.01)     # widen the window for a race
+                return original.__func__(cls)
+            return classmethod(available)
+
+        def utc_now_many():
+            for _ in range(100):
+                _ = DateTime.utc_now()
+
+        try:
+            for clock, original in originals:
+                clock.available = counting(clock, original)
+            Clock._Clock__implementations = None
+            threads = [Thread(target=utc_now_many) for _ in range(32)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            for clock, original in originals:
+                clock.available = original
+        self.assertEqual(sorted(probes, key=lambda clock: clock.__name__), [LibCClock, SafeClock])
+
     def test_base_clock_precision(self):
         clock = object.__new__(Clock)
         with self.assertRaises(NotImplementedError):
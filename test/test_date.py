@@ -19,13 +19,14 @@
 # limitations under the License.
 
 
-from datetime import date
+from datetime import date, timedelta
+from gc import collect
 from time import struct_time
 from unittest import TestCase
 
 import pytz
 
-from neotime import Duration, Date, UnixEpoch, ZeroDate
+from neotime import Duration, Date, UnixEpoch, ZeroDate, bucket_many
 
 
 eastern = pytz.timezone("US/Eastern")
@@ -38,6 +39,16 @@ class DateTestCase(TestCase):
         with self.assertRaises(AttributeError):
             _ = d.x
 
+    def test_standard_library_aliases(self):
+        d = Date(2000, 1, 1)
+        self.assertEqual(Date.fromisoformat("2000-01-01"), d)
+        self.assertEqual(Date.fromordinal(d.toordinal()), d)
+        self.assertEqual(d.isoformat(), "2000-01-01")
+        self.assertEqual(d.isoweekday(), 6)
+        self.assertEqual(d.isocalendar(), (1999, 52, 6))
+        self.assertEqual(d.timetuple(), d.time_tuple())
+        self.assertIn("isoformat", vars(Date))
+
     def test_zero_date(self):
         d = Date(0, 0, 0)
         self.assertEqual(d.year_month_day, (0, 0, 0))
@@ -230,6 +241,27 @@ class DateTestCase(TestCase):
         with self.assertRaises(ValueError):
             _ = Date.parse(object())
 
+    def test_parse_with_format(self):
+        self.assertEqual(Date.parse("30 April 2018", "%d %B %Y"), Date(2018, 4, 30))
+        self.assertEqual(Date.parse("Mon, 30 apr 18 12:00", "%a, %d %b %y %H:%M"), Date(2018, 4, 30))
+        self.assertEqual(Date.parse("2018/120", "%Y/%j"), Date(2018, 4, 30))
+        self.assertEqual(Date.parse("30/04/2018", "%d/%m/%Y"), Date(2018, 4, 30))
+
+    def test_parse_cache_is_keyword_only(self):
+        with self.assertRaises(TypeError):
+            _ = Date.parse("2018-04-30", True)
+        with self.assertRaises(TypeError):
+            _ = Date.parse("2018-04-30", cahce=True)
+
+    def test_bad_parse_with_format(self):
+        with self.assertRaises(ValueError):
+            _ = Date.parse("2018-04-30", "%d %B %Y")
+
+    def test_parse_many(self):
+        self.assertEqual(Date.parse_many(["30/04/2018", "01/05/2018"], "%d/%m/%Y"),
+                         [Date(2018, 4, 30), Date(2018, 5, 1)])
+        self.assertEqual(Date.parse_many(["2018-04-30"]), [Date(2018, 4, 30)])
+
     def test_replace(self):
         d1 = Date(2018, 4, 30)
         d2 = d1.replace(year=2017)
@@ -507,8 +539,14 @@ class DateTestCase(TestCase):
 
     def test_format(self):
         d = Date(2018, 4, 30)
-        with self.assertRaises(NotImplementedError):
-            _ = d.__format__("")
+        self.assertEqual(d.__format__(""), "2018-04-30")
+        self.assertEqual(d.__format__("%A %d %B %Y"), "Monday 30 April 2018")
+        self.assertEqual("{:%j %H:%M}".format(d), "120 00:00")
+
+    def test_strftime_matches_native(self):
+        fmt = "%a %A %w %u %d %e %b %B %m %y %Y %j %U %W %G %V %c %x %%"
+        for d in (Date(2018, 4, 30), Date(2016, 2, 29), Date(2020, 12, 31), Date(2021, 1, 3)):
+            self.assertEqual(d.strftime(fmt), d.to_native().strftime(fmt))
 
     def test_from_native(self):
         native = date(2018, 10, 1)
@@ -524,11 +562,183 @@ class DateTestCase(TestCase):
         self.assertEqual(d.month, native.month)
         self.assertEqual(d.day, native.day)
 
+    def test_to_native_many(self):
+        dates = [Date(2018, 10, 1), Date(2018, 10, 31), Date(2000, 2, 29)]
+        natives = Date.to_native_many(dates)
+        self.assertEqual(natives, [date(2018, 10, 1), date(2018, 10, 31), date(2000, 2, 29)])
+
+    def test_to_native_many_empty(self):
+        self.assertEqual(Date.to_native_many([]), [])
+
     def test_iso_format(self):
         d = Date(2018, 10, 1)
         self.assertEqual("2018-10-01", d.iso_format())
 
+    def test_iso_format_end_of_month(self):
+        d = Date(2016, 2, 29)
+        self.assertEqual("2016-02-29", d.iso_format())
+
     def test_from_iso_format(self):
         expected = Date(2018, 10, 1)
         actual = Date.from_iso_format("2018-10-01")
         self.assertEqual(expected, actual)
+
+    def test_from_iso_format_with_cache(self):
+        Date.string_cache.clear()
+        d1 = Date.from_iso_format("2018-10-01", cache=True)
+        d2 = Date.from_iso_format("2018-10-01", cache=True)
+        self.assertEqual(d1, Date(2018, 10, 1))
+        self.assertIs(d1, d2)
+        self.assertEqual(Date.string_cache.stats()["hits"], 1)
+        self.assertEqual(Date.string_cache.stats()["misses"], 1)
+
+    def test_from_iso_format_without_cache(self):
+        Date.string_cache.clear()
+        d1 = Date.from_iso_format("2018-10-01")
+        d2 = Date.from_iso_format("2018-10-01")
+        self.assertIsNot(d1, d2)
+        self.assertEqual(len(Date.string_cache), 0)
+
+    def test_from_iso_format_with_global_cache(self):
+        Date.string_cache.clear()
+        Date.string_cache_enabled = True
+        try:
+            d1 = Date.from_iso_format("2018-10-01")
+            d2 = Date.parse("2018-10-01")
+            d3 = Date.from_iso_format("2018-10-01", cache=False)
+        finally:
+            Date.string_cache_enabled = False
+        self.assertIs(d1, d2)
+        self.assertIsNot(d1, d3)
+
+    def test_parse_with_cache_only_caches_canonical_strings(self):
+        Date.string_cache.clear()
+        self.assertEqual(Date.parse("2018-1-1", cache=True), Date(2018, 1, 1))
+        with self.assertRaises(ValueError):
+            _ = Date.from_iso_format("2018-1-1", cache=True)
+
+    def test_from_iso_format_with_cache_rejects_bad_strings(self):
+        with self.assertRaises(ValueError):
+            _ = Date.from_iso_format("2018-10", cache=True)
+
+    def test_interning(self):
+        Date.intern_cache.clear()
+        Date.intern_enabled = True
+        try:
+            d1 = Date(2018, 10, 1)
+            d2 = Date.from_ordinal(d1.to_ordinal())
+            d3 = Date.from_iso_format("2018-10-01")
+        finally:
+            Date.intern_enabled = False
+        self.assertIs(d1, d2)
+        self.assertIs(d1, d3)
+        self.assertIsNot(d1, Date(2018, 10, 1))
+
+    def test_interned_dates_are_not_modified_by_arithmetic(self):
+        Date.intern_cache.clear()
+        Date.intern_enabled = True
+        try:
+            d1 = Date(2018, 1, 31)
+            d2 = d1 + Duration(months=1, days=1)
+            d3 = Date(2018, 1, 31)
+        finally:
+            Date.intern_enabled = False
+        self.assertEqual(d1, Date(2018, 1, 31))
+        self.assertEqual(d2, Date(2018, 3, 1))
+        self.assertIs(d1, d3)
+
+    def test_interning_counts_each_miss_once(self):
+        Date.intern_cache.clear()
+        Date.intern_enabled = True
+        try:
+            d1 = Date.from_ordinal(737000)
+            d2 = Date.from_ordinal(737000)
+            d3 = Date.from_ordinal(1000)
+            stats = Date.intern_cache.stats()
+        finally:
+            Date.intern_enabled = False
+        self.assertIs(d1, d2)
+        self.assertEqual(d3, Date.from_ordinal(1000))
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 2))
+
+    def test_interned_dates_are_released(self):
+        Date.intern_cache.clear()
+        Date.intern_enabled = True
+        try:
+            d = Date(2018, 10, 1)
+            self.assertEqual(len(Date.intern_cache), 1)
+            del d
+            collect()
+            self.assertEqual(len(Date.intern_cache), 0)
+        finally:
+            Date.intern_enabled = False
+
+    def test_range(self):
+        r = Date.range(Date(2018, 1, 1), Date(2018, 1, 10), Duration(days=3))
+        self.assertEqual(len(r), 3)
+        self.assertEqual(list(r), [Date(2018, 1, 1), Date(2018, 1, 4), Date(2018, 1, 7)])
+        self.assertEqual(r[1], Date(2018, 1, 4))
+        self.assertEqual(r[-1], Date(2018, 1, 7))
+        with self.assertRaises(IndexError):
+            _ = r[3]
+
+    def test_range_defaults_to_days(self):
+        r = Date.range(Date(2018, 12, 30), Date(2019, 1, 2))
+        self.assertEqual(list(r), [Date(2018, 12, 30), Date(2018, 12, 31), Date(2019, 1, 1)])
+
+    def test_range_backwards(self):
+        r = Date.range(Date(2018, 1, 10), Date(2018, 1, 1), timedelta(days=-3))
+        self.assertEqual(list(r), [Date(2018, 1, 10), Date(2018, 1, 7), Date(2018, 1, 4)])
+
+    def test_empty_range(self):
+        r = Date.range(Date(2018, 1, 10), Date(2018, 1, 1))
+        self.assertEqual(len(r), 0)
+        self.assertEqual(list(r), [])
+
+    def test_range_by_months_keeps_end_of_month(self):
+        r = Date.range(Date(2018, 1, 31), Date(2018, 6, 30), Duration(months=1))
+        self.assertEqual(list(r), [Date(2018, 1, 31), Date(2018, 2, 28), Date(2018, 3, 31),
+                                   Date(2018, 4, 30), Date(2018, 5, 31)])
+        self.assertEqual(r[3], Date(2018, 1, 31) + Duration(months=3))
+
+    def test_range_by_months_backwards(self):
+        r = Date.range(Date(2018, 6, 15), Date(2018, 3, 15), Duration(months=-1))
+        self.assertEqual(list(r), [Date(2018, 6, 15), Date(2018, 5, 15), Date(2018, 4, 15)])
+
+    def test_range_with_invalid_step(self):
+        with self.assertRaises(ValueError):
+            _ = Date.range(Date(2018, 1, 1), Date(2018, 2, 1), Duration())
+        with self.assertRaises(ValueError):
+            _ = Date.range(Date(2018, 1, 1), Date(2018, 2, 1), Duration(hours=12))
+        with self.assertRaises(ValueError):
+            _ = Date.range(Date(2018, 1, 1), Date(2018, 2, 1), Duration(months=1, days=1))
+        with self.assertRaises(TypeError):
+            _ = Date.range(Date(2018, 1, 1), Date(2018, 2, 1), 1)
+
+    def test_truncate(self):
+        d = Date(2018, 10, 17)
+        self.assertEqual(d.truncate("millennium"), Date(2000, 1, 1))
+        self.assertEqual(d.truncate("century"), Date(2000, 1, 1))
+        self.assertEqual(d.truncate("decade"), Date(2010, 1, 1))
+        self.assertEqual(d.truncate("year"), Date(2018, 1, 1))
+        self.assertEqual(d.truncate("quarter"), Date(2018, 10, 1))
+        self.assertEqual(d.truncate("month"), Date(2018, 10, 1))
+        self.assertEqual(d.truncate("week"), Date(2018, 10, 15))
+        self.assertEqual(d.truncate("day"), d)
+
+    def test_truncate_first_millennium_century_and_decade(self):
+        for unit, year in [("millennium", 999), ("century", 99), ("decade", 9)]:
+            d = Date(year, 6, 1)
+            self.assertEqual(d.truncate(unit), Date.min)
+            self.assertEqual(Date(1, 1, 1).truncate(unit), Date.min)
+            self.assertEqual(bucket_many([d], unit), bucket_many([Date.min], unit))
+        self.assertEqual(Date(1000, 1, 1).truncate("millennium"), Date(1000, 1, 1))
+
+    def test_truncate_to_week_across_years(self):
+        self.assertEqual(Date(2021, 1, 3).truncate("week"), Date(2020, 12, 28))
+        self.assertEqual(Date(2020, 12, 28).truncate("week"), Date(2020, 12, 28))
+
+    def test_truncate_to_time_unit(self):
+        with self.assertRaises(ValueError):
+            _ = Date(2018, 10, 17).truncate("hour")
+
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from datetime import date
+from unittest import TestCase
+
+from neotime import Date, Duration
+from neotime.datetable import DateTable, DEFAULT_WINDOW
+
+
+class DateTableTestCase(TestCase):
+
+    def assert_table_matches_native(self, table):
+        for offset in range(len(table)):
+            d = date.fromordinal(table.first_ordinal + offset)
+            self.assertEqual(Date(table.years[offset], table.months[offset], table.days[offset]), d)
+            self.assertEqual((table.iso_years[offset], table.iso_weeks[offset], table.weekdays[offset]),
+                             tuple(d.isocalendar()))
+            self.assertEqual(table.year_days[offset], d.timetuple().tm_yday)
+
+    def test_fields(self):
+        self.assert_table_matches_native(DateTable(2003, 2005))
+
+    def test_fields_at_calendar_limits(self):
+        self.assert_table_matches_native(DateTable(1, 2))
+        self.assert_table_matches_native(DateTable(9998, 9999))
+
+    def test_month_starts(self):
+        table = DateTable(2000, 2001)
+        self.assertEqual(len(table.month_starts), table.month_count + 1)
+        self.assertEqual(table.month_starts[1], date(2000, 2, 1).toordinal())
+        self.assertEqual(table.month_starts[-1], date(2002, 1, 1).toordinal())
+
+    def test_window(self):
+        table = DateTable()
+        self.assertEqual((table.start_year, table.end_year), DEFAULT_WINDOW)
+        self.assertEqual(table.first_ordinal, date(1900, 1, 1).toordinal())
+        self.assertEqual(len(table), date(2101, 1, 1).toordinal() - table.first_ordinal)
+        self.assertIn(date(2100, 12, 31).toordinal(), table)
+        self.assertNotIn(date(1899, 12, 31).toordinal(), table)
+        self.assertEqual(repr(table), "DateTable(1900, 2100)")
+
+    def test_built_on_first_use(self):
+        table = DateTable()
+        self.assertNotIn("years", vars(table))
+        self.assertEqual(table.years[0], 1900)
+        self.assertIn("iso_weeks", vars(table))
+        self.assertNotIn("month_starts", vars(table))
+
+    def test_month_starts_built_separately(self):
+        table = DateTable()
+        self.assertEqual(table.month_starts[0], table.first_ordinal)
+        self.assertNotIn("years", vars(table))
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            _ = DateTable().weeks
+
+    def test_invalid_window(self):
+        with self.assertRaises(ValueError):
+            _ = DateTable(2000, 1999)
+        with self.assertRaises(ValueError):
+            _ = DateTable(1, 10000)
+
+
+class DateWithTableTestCase(TestCase):
+
+    def setUp(self):
+        self.previous = Date.date_table
+        self.table = Date.date_table = DateTable()
+
+    def tearDown(self):
+        Date.date_table = self.previous
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(self.previous)
+
+    def test_construction_builds_month_starts_only(self):
+        _ = Date(2018, 10, 1)
+        self.assertIn("month_starts", vars(self.table))
+        self.assertNotIn("years", vars(self.table))
+
+    def dates(self):
+        for year in (1, 1899, 1900, 1901, 2018, 2020, 2099, 2100, 2101, 9999):
+            for month, day in ((1, 1), (1, 3), (2, 28), (2, -1), (12, 28), (12, 31)):
+                yield year, month, day
+
+    def fields(self, year, month, day):
+        d = Date(year, month, day)
+        d_from_ordinal = Date.from_ordinal(d.to_ordinal())
+        return (d.to_ordinal(), d.year_month_day, d.year_week_day, d.year_day,
+                d_from_ordinal.year_month_day, d_from_ordinal == d, (d + Duration(months=1)).to_ordinal())
+
+    def test_same_results_without_table(self):
+        for year, month, day in self.dates():
+            if year == 9999 and month == 12:
+                continue
+            Date.date_table = self.table
+            with_table = self.fields(year, month, day)
+            Date.date_table = None
+            without_table = self.fields(year, month, day)
+            self.assertEqual(with_table, without_table, (year, month, day))
+
+    def test_custom_window(self):
+        Date.date_table = DateTable(1800, 1810)
+        d = Date.from_ordinal(date(1805, 3, 1).toordinal())
+        self.assertEqual(d.year_month_day, (1805, 3, 1))
+        self.assertEqual(d.iso_calendar(), (1805, 9, 5))
+        self.assertIn("years", vars(Date.date_table))
+
+    def test_invalid_dates_within_window(self):
+        with self.assertRaises(ValueError):
+            _ = Date(2000, 2, 30)
+        with self.assertRaises(ValueError):
+            _ = Date(2000, 13, 1)
+        with self.assertRaises(ValueError):
+            _ = Date(2000, 0, 1)
@@ -20,11 +20,12 @@
 
 
 from datetime import datetime, timedelta
+from random import Random
 from unittest import TestCase
 
 from pytz import timezone, FixedOffset
 
-from neotime import DateTime, MIN_YEAR, MAX_YEAR, Duration
+from neotime import Date, Time, DateTime, MIN_YEAR, MAX_YEAR, Duration, bucket_many, temporal_to_nanoseconds
 from neotime.arithmetic import nano_add, nano_div
 from neotime.clock_implementations import Clock, ClockTime
 
@@ -113,6 +114,21 @@ class DateTimeTestCase(TestCase):
         self.assertEqual(t.month, 1)
         self.assertEqual(t.day, 31)
 
+    def test_bad_attribute(self):
+        t = DateTime(2000, 1, 1)
+        with self.assertRaises(AttributeError):
+            _ = t.x
+
+    def test_standard_library_aliases(self):
+        dt = DateTime.fromisoformat("2018-10-01T12:34:56.789+01:00")
+        self.assertEqual(dt.isoformat(), "2018-10-01T12:34:56.789000000+01:00")
+        self.assertEqual(dt.utcoffset().total_seconds(), 3600)
+        self.assertEqual(dt.isoweekday(), 1)
+        self.assertEqual(dt.isocalendar(), (2018, 40, 1))
+        self.assertEqual(DateTime.fromordinal(dt.toordinal()), DateTime(2018, 10, 1))
+        self.assertEqual(DateTime.utcfromtimestamp(0), DateTime(1970, 1, 1))
+        self.assertIn("isoformat", vars(DateTime))
+
     def test_today(self):
         t = DateTime.today()
         self.assertEqual(t.year, 1970)
@@ -191,6 +207,44 @@ class DateTimeTestCase(TestCase):
         dt2 = dt1 + delta
         self.assertEqual(dt2, DateTime(2018, 4, 27, 23, 0, 17.914390409))
 
+    def test_add_timedelta_carries_into_date(self):
+        dt = DateTime(2018, 12, 31, 23, 0, 0) + timedelta(hours=2, microseconds=5)
+        self.assertEqual(dt, DateTime(2019, 1, 1, 1, 0, 0.000005))
+
+    def test_add_timedelta_keeps_tzinfo(self):
+        dt = DateTime(2018, 4, 26, 23, 0, 0, tzinfo=FixedOffset(60)) + timedelta(hours=2)
+        self.assertEqual(dt.tzinfo, FixedOffset(60))
+        self.assertEqual(dt.year_month_day, (2018, 4, 27))
+
+    def test_add_duration(self):
+        dt = DateTime(2018, 4, 26, 23, 0, 17.914390409) + Duration(months=1, days=5, hours=2, nanoseconds=1)
+        self.assertEqual(dt, DateTime(2018, 6, 1, 1, 0, 17.91439041))
+
+    def test_add_duration_clamps_day_of_month(self):
+        self.assertEqual(DateTime(2018, 1, 31, 12) + Duration(months=1), DateTime(2018, 2, 28, 12))
+        self.assertEqual(DateTime(2020, 1, 31, 12) + Duration(months=1, days=1), DateTime(2020, 3, 1, 12))
+
+    def test_add_duration_is_commutative(self):
+        self.assertEqual(Duration(days=1) + DateTime(2018, 1, 31), DateTime(2018, 2, 1))
+
+    def test_add_negative_duration(self):
+        dt = DateTime(2018, 3, 1, 0, 0, 0.5) + Duration(seconds=-1)
+        self.assertEqual(dt, DateTime(2018, 2, 28, 23, 59, 59.5))
+
+    def test_add_duration_out_of_range(self):
+        with self.assertRaises(ValueError):
+            _ = DateTime(9999, 12, 1) + Duration(months=1)
+        with self.assertRaises(ValueError):
+            _ = DateTime(9999, 12, 31, 23) + Duration(hours=1)
+
+    def test_subtract_duration(self):
+        dt = DateTime(2018, 3, 31, 1, 0, 0) - Duration(months=1, hours=2)
+        self.assertEqual(dt, DateTime(2018, 2, 27, 23, 0, 0))
+
+    def test_subtract_timedelta(self):
+        dt = DateTime(2018, 3, 1, 1, 0, 0) - timedelta(hours=2)
+        self.assertEqual(dt, DateTime(2018, 2, 28, 23, 0, 0))
+
     def test_subtract_datetime_1(self):
         dt1 = DateTime(2018, 4, 26, 23, 0, 17.914390409)
         dt2 = DateTime(2018, 1, 1, 0, 0, 0.0)
@@ -245,6 +299,29 @@ class DateTimeTestCase(TestCase):
         self.assertEqual(dt.minute, native.minute)
         self.assertEqual(56.789123, nano_add(native.second, nano_div(native.microsecond, 1000000)))
 
+    def test_to_native_many(self):
+        dts = [DateTime(2018, 10, 1, 12, 34, 56.789123456),
+               DateTime(2018, 10, 31, 23, 59, 59.999999999),
+               DateTime(2018, 10, 1, 12, 34, 56.789, tzinfo=FixedOffset(60))]
+        natives = DateTime.to_native_many(dts)
+        self.assertEqual(natives, [dt.to_native() for dt in dts])
+        self.assertEqual(natives[1], datetime(2018, 10, 31, 23, 59, 59, 999999))
+        self.assertEqual(natives[2].tzinfo, FixedOffset(60))
+
+    def test_temporal_to_nanoseconds(self):
+        self.assertEqual(temporal_to_nanoseconds(Date(1970, 1, 2)), 86400000000000)
+        self.assertEqual(temporal_to_nanoseconds(DateTime(1970, 1, 1, 1, 0, 0, tzinfo=FixedOffset(60))), 0)
+        self.assertEqual(temporal_to_nanoseconds(DateTime(1969, 12, 31, 23, 59, 59.999999999)), -1)
+        with self.assertRaises(TypeError):
+            _ = temporal_to_nanoseconds(Time(12, 0, 0))
+
+    def test_to_native_many_matches_to_native(self):
+        random = Random(0)
+        dts = [DateTime(random.randint(1, 9999), random.randint(1, 12), random.randint(1, 28), random.randint(0, 23),
+                        random.randint(0, 59), random.randint(0, 59999999) / 1000000) for _ in range(10000)]
+        dts.append(DateTime(6134, 5, 21, 17, 32, 5.125182))
+        self.assertEqual(DateTime.to_native_many(dts), [dt.to_native() for dt in dts])
+
     def test_iso_format(self):
         dt = DateTime(2018, 10, 1, 12, 34, 56.789123456)
         self.assertEqual("2018-10-01T12:34:56.789123456", dt.iso_format())
@@ -261,11 +338,73 @@ class DateTimeTestCase(TestCase):
         dt = eastern.localize(DateTime(2018, 10, 1, 12, 34, 56.789))
         self.assertEqual("2018-10-01T12:34:56.789000000-04:00", dt.iso_format())
 
+    def test_iso_format_with_precision(self):
+        dt = eastern.localize(DateTime(2018, 10, 31, 12, 34, 56.789123456))
+        self.assertEqual("2018-10-31T12:34:56-04:00", dt.iso_format(precision=0))
+        self.assertEqual("2018-10-31T12:34:56.789-04:00", dt.iso_format(precision=3))
+        self.assertEqual("2018-10-31T12:34:56.789123-04:00", dt.iso_format(precision=6))
+        self.assertEqual("2018-10-31 12:34:56.789123456-04:00", dt.iso_format(" ", 9))
+
+    def test_format(self):
+        dt = DateTime(2018, 10, 1, 12, 34, 56.123456789, tzinfo=FixedOffset(60))
+        self.assertEqual(dt.__format__(""), dt.iso_format())
+        self.assertEqual(dt.strftime("%Y-%m-%dT%H:%M:%S.%N%z"), "2018-10-01T12:34:56.123456789+0100")
+        self.assertEqual("{:%c}".format(dt), "Mon Oct  1 12:34:56 2018")
+
+    def test_strftime_matches_native(self):
+        fmt = "%a %d %b %Y %H %I %p %M %S %f %z %j %U %W %G %V %c %x %X"
+        dt = eastern.localize(DateTime(2018, 12, 31, 23, 59, 59.999999))
+        self.assertEqual(dt.strftime(fmt), dt.to_native().strftime(fmt))
+
+    def test_parse(self):
+        dt = DateTime.parse("2018-10-01 12:34:56.123456789", "%Y-%m-%d %H:%M:%S.%f")
+        self.assertEqual(dt, DateTime(2018, 10, 1, 12, 34, 56.123456789))
+        self.assertEqual(dt.second, DateTime.from_iso_format("2018-10-01T12:34:56.123456789").second)
+
+    def test_parse_with_offset(self):
+        dt = DateTime.strptime("01/10/2018 01:34 PM +01:30", "%d/%m/%Y %I:%M %p %z")
+        self.assertEqual(dt, DateTime(2018, 10, 1, 13, 34, 0, tzinfo=FixedOffset(90)))
+        self.assertEqual(dt.tzinfo, FixedOffset(90))
+        self.assertEqual(DateTime.parse("2018-10-01T12:00Z", "%Y-%m-%dT%H:%M%z").tzinfo, FixedOffset(0))
+
+    def test_parse_round_trips_format(self):
+        fmt = "%a %d %b %Y %H:%M:%S.%N%z"
+        dt = DateTime(2018, 12, 31, 23, 59, 59.999999999, tzinfo=FixedOffset(-270))
+        self.assertEqual(DateTime.parse(dt.strftime(fmt), fmt), dt)
+
+    def test_parse_matches_native(self):
+        for s, fmt in [("Mon Oct  1 12:34:56 2018", "%c"),
+                       ("10/01/18 12:34:56", "%x %X"),
+                       ("2018-10-01   7:05:00.5", "%Y-%m-%d %H:%M:%S.%f")]:
+            self.assertEqual(DateTime.parse(s, fmt), datetime.strptime(s, fmt))
+
+    def test_bad_parse(self):
+        with self.assertRaises(ValueError):
+            _ = DateTime.parse("2018-10-01", "%Y-%m-%d %H")
+        with self.assertRaises(ValueError):
+            _ = DateTime.parse("2018-02-30", "%Y-%m-%d")
+
+    def test_parse_many(self):
+        strings = ["2018-10-01 12:34:56.000000001", "2018-10-02 00:00:00.5"]
+        self.assertEqual(DateTime.parse_many(strings, "%Y-%m-%d %H:%M:%S.%f"),
+                         [DateTime(2018, 10, 1, 12, 34, 56.000000001), DateTime(2018, 10, 2, 0, 0, 0.5)])
+
+    def test_iso_format_with_bad_precision(self):
+        dt = DateTime(2018, 10, 1, 12, 34, 56.789123456)
+        with self.assertRaises(ValueError):
+            _ = dt.iso_format(precision=1)
+
     def test_from_iso_format_hour_only(self):
         expected = DateTime(2018, 10, 1, 12, 0, 0)
         actual = DateTime.from_iso_format("2018-10-01T12")
         self.assertEqual(expected, actual)
 
+    def test_from_iso_format_with_cache(self):
+        dt1 = DateTime.from_iso_format("2018-10-01T12:34:56", cache=True)
+        dt2 = DateTime.from_iso_format("2018-10-01T01:02:03", cache=True)
+        self.assertEqual(dt1, DateTime(2018, 10, 1, 12, 34, 56))
+        self.assertIs(dt1.date(), dt2.date())
+
     def test_from_iso_format_hour_and_minute(self):
         expected = DateTime(2018, 10, 1, 12, 34, 0)
         actual = DateTime.from_iso_format("2018-10-01T12:34")
@@ -311,6 +450,88 @@ class DateTimeTestCase(TestCase):
         actual = DateTime.from_iso_format("2018-10-01T12:34:56.123456789-12:34:56.123456")
         self.assertEqual(expected, actual)
 
+    def test_truncate(self):
+        dt = DateTime(2018, 10, 17, 12, 34, 56.789123456, tzinfo=FixedOffset(60))
+        self.assertEqual(dt.truncate("year"), DateTime(2018, 1, 1, tzinfo=FixedOffset(60)))
+        self.assertEqual(dt.truncate("quarter"), DateTime(2018, 10, 1, tzinfo=FixedOffset(60)))
+        self.assertEqual(dt.truncate("week"), DateTime(2018, 10, 15, tzinfo=FixedOffset(60)))
+        self.assertEqual(dt.truncate("day"), DateTime(2018, 10, 17, tzinfo=FixedOffset(60)))
+        self.assertEqual(dt.truncate("hour"), DateTime(2018, 10, 17, 12, tzinfo=FixedOffset(60)))
+        self.assertEqual(dt.truncate("millisecond"), DateTime(2018, 10, 17, 12, 34, 56.789, tzinfo=FixedOffset(60)))
+
+    def test_truncate_to_unknown_unit(self):
+        with self.assertRaises(ValueError):
+            _ = DateTime(2018, 10, 17).truncate("fortnight")
+
+    def test_bucket_many_by_date_unit(self):
+        values = [DateTime(2018, 10, 15, 1), Date(2018, 10, 21), DateTime(2018, 10, 22), None]
+        keys = bucket_many(values, "week")
+        self.assertEqual(keys[0], keys[1])
+        self.assertNotEqual(keys[1], keys[2])
+        self.assertIsNone(keys[3])
+        self.assertEqual(bucket_many([Date(2018, 12, 31), Date(2019, 1, 1)], "month"),
+                         [12 * 2018 + 11, 12 * 2019])
+
+    def test_bucket_many_by_time_unit(self):
+        values = [DateTime(2018, 10, 17, 12, 0, 0), DateTime(2018, 10, 17, 12, 59, 59.999999999),
+                  DateTime(2018, 10, 18, 12, 0, 0)]
+        keys = bucket_many(values, "hour")
+        self.assertEqual(keys[0], keys[1])
+        self.assertEqual(keys[2] - keys[0], 24)
+        self.assertEqual(bucket_many([Time(12, 34, 56)], "minute"), [12 * 60 + 34])
+
+    def test_bucket_many_matches_truncate(self):
+        values = [DateTime(2018, 10, 17, 12, 34, 56.5), DateTime(2018, 10, 17, 12, 34, 57),
+                  DateTime(2018, 12, 31, 23, 59, 59)]
+        for unit in ["decade", "year", "quarter", "month", "week", "day", "hour", "minute", "second"]:
+            keys = bucket_many(values, unit)
+            for a, b, ka, kb in zip(values, values[1:], keys, keys[1:]):
+                self.assertEqual(a.truncate(unit) == b.truncate(unit), ka == kb)
+
+    def test_bucket_many_errors(self):
+        with self.assertRaises(ValueError):
+            _ = bucket_many([Date(2018, 10, 17)], "hour")
+        with self.assertRaises(ValueError):
+            _ = bucket_many([], "fortnight")
+        with self.assertRaises(TypeError):
+            _ = bucket_many([1], "day")
+
+    def test_range(self):
+        r = DateTime.range(DateTime(2018, 1, 1, 23), DateTime(2018, 1, 2, 2), Duration(minutes=50))
+        self.assertEqual(len(r), 4)
+        self.assertEqual(list(r), [DateTime(2018, 1, 1, 23, 0, 0), DateTime(2018, 1, 1, 23, 50, 0),
+                                   DateTime(2018, 1, 2, 0, 40, 0), DateTime(2018, 1, 2, 1, 30, 0)])
+        self.assertEqual(r[2], DateTime(2018, 1, 2, 0, 40, 0))
+
+    def test_range_with_timedelta(self):
+        r = DateTime.range(DateTime(2018, 1, 1), DateTime(2018, 1, 1, 0, 0, 1), timedelta(microseconds=250000))
+        self.assertEqual(len(r), 4)
+        self.assertEqual(r[-1], DateTime(2018, 1, 1, 0, 0, 0.75))
+
+    def test_range_by_months(self):
+        r = DateTime.range(DateTime(2018, 1, 31, 12), DateTime(2018, 4, 30, 12), Duration(months=1))
+        self.assertEqual(list(r), [DateTime(2018, 1, 31, 12), DateTime(2018, 2, 28, 12), DateTime(2018, 3, 31, 12)])
+
+    def test_range_by_months_matches_arithmetic(self):
+        start = DateTime(2019, 1, 30, 6)
+        step = Duration(months=1)
+        r = DateTime.range(start, DateTime(2020, 1, 1), step)
+        self.assertEqual(r[1], DateTime(2019, 2, 28, 6))
+        self.assertEqual(list(r), [start + step * k for k in range(len(r))])
+
+    def test_range_keeps_tzinfo(self):
+        tz = FixedOffset(60)
+        r = DateTime.range(DateTime(2018, 1, 1, tzinfo=tz), DateTime(2018, 1, 3, tzinfo=tz))
+        self.assertEqual([dt.tzinfo for dt in r], [tz, tz])
+
+    def test_range_mixing_naive_and_aware(self):
+        with self.assertRaises(TypeError):
+            _ = DateTime.range(DateTime(2018, 1, 1), DateTime(2018, 1, 3, tzinfo=FixedOffset(60)))
+
+    def test_range_with_months_and_days(self):
+        with self.assertRaises(ValueError):
+            _ = DateTime.range(DateTime(2018, 1, 1), DateTime(2019, 1, 1), Duration(months=1, hours=1))
+
 
 def test_iso_format_with_time_zone_case_1():
     # python -m pytest tests/unit/time/test_datetime.py -s -v -k test_iso_format_with_time_zone_case_1
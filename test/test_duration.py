@@ -333,3 +333,45 @@ class DurationTestCase(TestCase):
                          Duration.from_iso_format("P1Y2M3D"))
         self.assertEqual(Duration(years=1, months=2, days=3, hours=12, minutes=34, seconds=56.789),
                          Duration.from_iso_format("P1Y2M3DT12H34M56.789S"))
+
+    def test_from_iso_format_is_exact(self):
+        for s in ("PT0.123456789S", "PT12345.678901234S", "PT-0.000000001S"):
+            d = Duration.from_iso_format(s)
+            whole, _, fraction = s[2:-1].lstrip("-").partition(".")
+            nanoseconds = int(whole) * 1000000000 + int(fraction)
+            self.assertEqual(1000000000 * abs(d.seconds) + int(round(1000000000 * abs(d.subseconds))), nanoseconds)
+        self.assertEqual(Duration.from_iso_format("PT56.789S"), Duration(seconds=56, milliseconds=789))
+
+    def test_from_iso_format_with_weeks(self):
+        self.assertEqual(Duration.from_iso_format("P2W"), Duration(days=14))
+        self.assertEqual(Duration.from_iso_format("P1W2D"), Duration(days=9))
+
+    def test_from_iso_format_with_negative_components(self):
+        self.assertEqual(Duration.from_iso_format("P-1Y-1M"), Duration(months=-13))
+        self.assertEqual(Duration.from_iso_format("PT1H-30M"), Duration(minutes=30))
+        self.assertEqual(Duration.from_iso_format("-P1DT1S"), Duration(days=-1, seconds=-1))
+        self.assertEqual(Duration.from_iso_format("PT-0.5S"), Duration(seconds=-0.5))
+
+    def test_from_iso_format_with_fractions(self):
+        self.assertEqual(Duration.from_iso_format("P1.5D"), Duration(days=1, hours=12))
+        self.assertEqual(Duration.from_iso_format("PT1.5H"), Duration(hours=1, minutes=30))
+        self.assertEqual(Duration.from_iso_format("PT0,25M"), Duration(seconds=15))
+
+    def test_from_iso_format_alternative_form(self):
+        self.assertEqual(Duration.from_iso_format("P0001-02-03T04:05:06.000000007"),
+                         Duration(years=1, months=2, days=3, hours=4, minutes=5, seconds=6, nanoseconds=7))
+
+    def test_from_iso_format_round_trips_iso_format(self):
+        for d in (Duration(months=-13), Duration(months=2, days=3, seconds=5.7),
+                  Duration(seconds=-0.123456789), Duration(days=-1, hours=-2, nanoseconds=-3)):
+            self.assertEqual(Duration.from_iso_format(d.iso_format()), d)
+
+    def test_bad_from_iso_format(self):
+        for s in ("", "P", "PT", "P1DT", "P1.5Y", "P1M2Y", "1D", "P1D2"):
+            with self.assertRaises(ValueError):
+                _ = Duration.from_iso_format(s)
+
+    def test_from_iso_format_many(self):
+        strings = ["P1D", "PT0.000000001S", "-P1W"]
+        self.assertEqual(Duration.from_iso_format_many(strings),
+                         [Duration.from_iso_format(s) for s in strings])
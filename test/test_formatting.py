@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+
+from unittest import TestCase
+
+from neotime import Date, DateTime
+from neotime.formatting import compile_format, format_cache
+
+
+class CompileFormatTestCase(TestCase):
+
+    def setUp(self):
+        format_cache.clear()
+
+    def test_compiled_format_is_cached(self):
+        emitters = compile_format("%Y-%m-%d")
+        self.assertIs(compile_format("%Y-%m-%d"), emitters)
+        self.assertEqual(format_cache.stats()["hits"], 1)
+
+    def test_literal_text_is_merged(self):
+        emitters = compile_format("Date: %Y, %%d")
+        self.assertEqual(len(emitters), 3)
+
+    def test_percent(self):
+        self.assertEqual(Date(2018, 10, 1).strftime("%d%%"), "01%")
+
+    def test_invalid_directive(self):
+        with self.assertRaises(ValueError):
+            _ = compile_format("%Y-%Q")
+
+    def test_incomplete_directive(self):
+        with self.assertRaises(ValueError):
+            _ = compile_format("%Y-%")
+
+    def test_nanoseconds(self):
+        dt = DateTime(2018, 10, 1, 12, 34, 56.000000001)
+        self.assertEqual(dt.strftime("%S.%N"), "56.000000001")
+        self.assertEqual(dt.strftime("%S.%f"), "56.000000")
+
+    def test_c99_and_posix_directives(self):
+        dt = DateTime(2018, 10, 1, 7, 4, 5)
+        self.assertEqual(format(dt, "%F %T"), "2018-10-01 07:04:05")
+        self.assertEqual(dt.strftime("%D %R"), "10/01/18 07:04")
+        self.assertEqual(dt.strftime("%r"), "07:04:05 AM")
+        self.assertEqual(dt.strftime("%C|%g|%h"), "20|18|Oct")
+        self.assertEqual(dt.strftime("%Y%n%m%t%d"), "2018\n10\t01")
+
+    def test_gnu_directives(self):
+        dt = DateTime(2018, 10, 1, 19, 4, 5)
+        self.assertEqual(dt.strftime("%k|%l|%P"), "19| 7|pm")
+
+    def test_iso_year_directives_at_year_end(self):
+        d = Date(2018, 12, 31)
+        self.assertEqual(d.strftime("%G %g %V"), "2019 19 01")
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from os import environ
+from os.path import dirname
+from subprocess import check_call, check_output, STDOUT
+from sys import executable, version_info
+from unittest import TestCase, skipIf
+
+import neotime
+from neotime import Date, IS_LEAP_YEAR, DAYS_IN_YEAR, DAYS_IN_MONTH
+from neotime.caching import LRUCache, WeakCache
+
+
+ROOT = dirname(dirname(__file__)) or "."
+
+# Upper bound for the cumulative import time of neotime, in
+# microseconds, as reported by -X importtime. The import takes a few
+# milliseconds; the budget leaves ample room for slow machines while
+# still catching eager work of the order of the former lookup tables.
+IMPORT_BUDGET = 30000
+
+
+def run_python(*args, **kwargs):
+    return check_output([executable] + list(args), cwd=ROOT, **kwargs)
+
+
+class ImportTestCase(TestCase):
+
+    @skipIf(version_info < (3, 7), "-X importtime requires Python 3.7")
+    def test_import_time_within_budget(self):
+        # Write bytecode first so that compilation is not measured
+        env = dict(environ)
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        check_call([executable, "-c", "import neotime"], cwd=ROOT, env=env)
+        out = run_python("-X", "importtime", "-c", "import neotime", stderr=STDOUT, env=env)
+        line, = [line for line in out.decode("ascii").splitlines() if line.endswith("| neotime")]
+        cumulative = int(line.split("|")[1])
+        self.assertLess(cumulative, IMPORT_BUDGET)
+
+    def test_import_is_lazy(self):
+        out = run_python("-c", "import sys, neotime; "
+                               "print(sorted(set(sys.modules) & {'re', 'threading', 'decimal', 'pytz', "
+                               "'neotime.caching', 'neotime.formatting', 'neotime.parsing'}))")
+        self.assertEqual(out.strip(), b"[]")
+
+    def test_lookup_tables(self):
+        self.assertIs(IS_LEAP_YEAR[2000], True)
+        self.assertIs(IS_LEAP_YEAR[1900], False)
+        self.assertEqual(DAYS_IN_YEAR[2024], 366)
+        self.assertEqual(DAYS_IN_MONTH[2023, 2], 28)
+        self.assertEqual(DAYS_IN_MONTH[9999, 12], 31)
+
+    def test_lookup_tables_before_first_access(self):
+        out = run_python("-c", "from neotime import IS_LEAP_YEAR, DAYS_IN_YEAR, DAYS_IN_MONTH; "
+                               "print(IS_LEAP_YEAR.get(2000), 2024 in DAYS_IN_YEAR, (2023, 2) in DAYS_IN_MONTH, "
+                               "DAYS_IN_MONTH.get((2023, 2)), len(DAYS_IN_YEAR), len(DAYS_IN_MONTH))")
+        self.assertEqual(out.split(), [b"True", b"True", b"True", b"28", b"9999", b"119988"])
+
+    def test_lookup_tables_as_mappings(self):
+        self.assertEqual(DAYS_IN_YEAR.get(2023), 365)
+        self.assertIsNone(DAYS_IN_YEAR.get(0))
+        self.assertEqual(DAYS_IN_MONTH.get((2000, 13), 0), 0)
+        self.assertEqual(list(IS_LEAP_YEAR)[:3], [1, 2, 3])
+        self.assertEqual(list(DAYS_IN_MONTH)[-1], (9999, 12))
+        self.assertEqual(sum(DAYS_IN_YEAR.values()), 3652059)
+        self.assertEqual(dict(DAYS_IN_MONTH.items())[2024, 2], 29)
+        self.assertEqual(DAYS_IN_YEAR, {year: DAYS_IN_YEAR[year] for year in range(1, 10000)})
+
+    def test_lookup_tables_reject_out_of_range_keys(self):
+        for table, key in [(IS_LEAP_YEAR, 0), (DAYS_IN_YEAR, 10000), (DAYS_IN_MONTH, (2000, 13)),
+                           (DAYS_IN_MONTH, (0, 1)), (DAYS_IN_MONTH, 2000)]:
+            with self.assertRaises(KeyError):
+                _ = table[key]
+            self.assertNotIn(key, table)
+
+    def test_patterns(self):
+        self.assertIsNotNone(neotime.DATE_ISO_PATTERN.match("2018-10-01"))
+        self.assertIs(neotime.DURATION_ISO_PATTERN, neotime.DURATION_ISO_PATTERN)
+        with self.assertRaises(AttributeError):
+            _ = neotime.NO_SUCH_PATTERN
+
+    def test_caches(self):
+        self.assertIsInstance(Date.string_cache, LRUCache)
+        self.assertIsInstance(Date.intern_cache, WeakCache)
+        self.assertIs(Date.string_cache, Date.string_cache)
+        self.assertIs(Date(2018, 10, 1).intern_cache, Date.intern_cache)
+
+    def test_constants(self):
+        self.assertEqual(Date.min.to_ordinal(), 1)
+        self.assertEqual(Date.max.to_ordinal(), 3652059)
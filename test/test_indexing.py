@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from unittest import TestCase
+
+from pytz import FixedOffset
+
+from neotime import Date, DateTime
+from neotime.indexing import TemporalIndex
+
+
+class TemporalIndexTestCase(TestCase):
+
+    def setUp(self):
+        self.index = TemporalIndex.from_sorted((DateTime(2018, 10, day, 12), day) for day in range(1, 11))
+
+    def test_length_and_order(self):
+        index = TemporalIndex([(DateTime(2018, 10, 2), "b"), (DateTime(2018, 10, 1), "a"),
+                               (DateTime(2018, 10, 3), "c")])
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.values(), ["a", "b", "c"])
+        self.assertEqual(index[0], (DateTime(2018, 10, 1), "a"))
+        self.assertEqual(list(index), list(zip(index.keys(), index.values())))
+
+    def test_equal_keys_keep_insertion_order(self):
+        index = TemporalIndex()
+        index.insert(DateTime(2018, 10, 1), "a")
+        index.insert(DateTime(2018, 10, 1), "b")
+        index.insert(DateTime(2018, 9, 30), "c")
+        self.assertEqual(index.values(), ["c", "a", "b"])
+
+    def test_range(self):
+        values = [value for _, value in self.index.range(DateTime(2018, 10, 3, 12), DateTime(2018, 10, 6, 12))]
+        self.assertEqual(values, [3, 4, 5])
+
+    def test_open_range(self):
+        self.assertEqual([value for _, value in self.index.range(end=Date(2018, 10, 3))], [1, 2])
+        self.assertEqual([value for _, value in self.index.range(start=Date(2018, 10, 9))], [9, 10])
+        self.assertEqual(len(self.index.range()), 10)
+
+    def test_range_with_nanoseconds(self):
+        index = TemporalIndex([(DateTime(2018, 10, 1, 0, 0, 0.000000001 * n), n) for n in range(5)])
+        values = [value for _, value in index.range(DateTime(2018, 10, 1, 0, 0, 0.000000001),
+                                                    DateTime(2018, 10, 1, 0, 0, 0.000000003))]
+        self.assertEqual(values, [1, 2])
+
+    def test_aware_keys_are_ordered_by_instant(self):
+        index = TemporalIndex([(DateTime(2018, 10, 1, 12, tzinfo=FixedOffset(0)), "utc"),
+                               (DateTime(2018, 10, 1, 12, tzinfo=FixedOffset(120)), "ahead")])
+        self.assertEqual(index.values(), ["ahead", "utc"])
+
+    def test_nearest_before(self):
+        self.assertEqual(self.index.nearest_before(DateTime(2018, 10, 5, 12)), (DateTime(2018, 10, 5, 12), 5))
+        self.assertEqual(self.index.nearest_before(DateTime(2018, 10, 5, 11)), (DateTime(2018, 10, 4, 12), 4))
+        self.assertIsNone(self.index.nearest_before(Date(2018, 10, 1)))
+
+    def test_nearest_after(self):
+        self.assertEqual(self.index.nearest_after(DateTime(2018, 10, 5, 12)), (DateTime(2018, 10, 5, 12), 5))
+        self.assertEqual(self.index.nearest_after(DateTime(2018, 10, 5, 13)), (DateTime(2018, 10, 6, 12), 6))
+        self.assertIsNone(self.index.nearest_after(Date(2018, 10, 11)))
+
+    def test_from_unsorted(self):
+        with self.assertRaises(ValueError):
+            _ = TemporalIndex.from_sorted([(DateTime(2018, 10, 2), 1), (DateTime(2018, 10, 1), 2)])
+
+    def test_keys_before_epoch_and_far_future(self):
+        index = TemporalIndex([(Date(9999, 12, 31), "max"), (Date(1, 1, 1), "min"), (Date(1970, 1, 1), "epoch")])
+        self.assertEqual(index.values(), ["min", "epoch", "max"])
+
+    def test_key_of_other_type(self):
+        with self.assertRaises(TypeError):
+            TemporalIndex().insert(1, "a")
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from datetime import timedelta
+from os import environ
+from subprocess import check_output
+from sys import executable
+from unittest import TestCase
+
+from neotime import ClockTime, Duration, Date, Time, DateTime
+from neotime.datetable import DateTable
+from neotime.instrumentation import instrumented, enable, disable, is_enabled, reset, counters
+
+
+class InstrumentationTestCase(TestCase):
+
+    def test_disabled_by_default(self):
+        self.assertFalse(is_enabled())
+
+    def test_constructions(self):
+        with instrumented() as c:
+            _ = DateTime(2018, 10, 1, 12, 34, 56)
+            _ = Duration(days=1)
+            _ = ClockTime(1, 2)
+        self.assertEqual(c["construct.Date"], 1)
+        self.assertEqual(c["construct.Time"], 1)
+        self.assertEqual(c["construct.DateTime"], 1)
+        self.assertEqual(c["construct.Duration"], 1)
+        self.assertEqual(c["construct.ClockTime"], 1)
+
+    def test_from_ordinal_slow_path(self):
+        with instrumented() as c:
+            _ = Date.from_ordinal(Date(2102, 2, 1).to_ordinal())
+            _ = Date.fromordinal(1)
+        self.assertEqual(c["from_ordinal.calls"], 2)
+        self.assertEqual(c["from_ordinal.iterations"], 84 + 1)
+        self.assertGreaterEqual(c["from_ordinal.seconds"], 0)
+
+    def test_from_ordinal_without_date_table(self):
+        table = Date.date_table
+        Date.date_table = None
+        try:
+            with instrumented() as c:
+                _ = Date.from_ordinal(736695 + 400)
+        finally:
+            Date.date_table = table
+        self.assertEqual(c["from_ordinal.iterations"], 1 + 1)
+
+    def test_from_ordinal_within_date_table(self):
+        Date.date_table = DateTable()
+        try:
+            with instrumented() as c:
+                _ = Date.from_ordinal(736695 + 400)
+        finally:
+            Date.date_table = None
+        self.assertEqual(c["from_ordinal.calls"], 1)
+        self.assertNotIn("from_ordinal.iterations", c)
+
+    def test_from_ordinal_by_keyword(self):
+        ordinal = Date(2102, 2, 1).to_ordinal()
+        with instrumented() as c:
+            d = Date.from_ordinal(ordinal=ordinal)
+        self.assertEqual(d, Date(2102, 2, 1))
+        self.assertEqual(c["from_ordinal.iterations"], 84 + 1)
+
+    def test_datetime_arithmetic_avoids_from_ordinal(self):
+        with instrumented() as c:
+            _ = DateTime(2018, 10, 1, 12) + Duration(months=1, days=40, hours=20)
+            _ = DateTime(2018, 10, 1, 12) - timedelta(days=400)
+        self.assertNotIn("from_ordinal.calls", c)
+
+    def test_regex_parses(self):
+        with instrumented() as c:
+            _ = DateTime.from_iso_format("2018-10-01T12:34:56")
+            _ = Duration.from_iso_format("P1D")
+        self.assertEqual(c["regex_parses"], 3)
+
+    def test_string_cache_hits_are_not_regex_parses(self):
+        Date.string_cache.clear()
+        with instrumented() as c:
+            _ = Date.from_iso_format("2018-10-01", cache=True)
+            _ = Date.from_iso_format("2018-10-01", cache=True)
+        self.assertEqual(c["regex_parses"], 1)
+        self.assertEqual(c["Date.from_iso_format.calls"], 2)
+
+    def test_wrappers_are_removed_when_disabled(self):
+        original = vars(Date)["from_ordinal"]
+        enable()
+        try:
+            self.assertIsNot(vars(Date)["from_ordinal"], original)
+            self.assertIs(vars(Date)["fromordinal"], vars(Date)["from_ordinal"])
+        finally:
+            disable()
+        self.assertIs(vars(Date)["from_ordinal"], original)
+        self.assertIs(vars(Date)["fromordinal"], original)
+
+    def test_counters_persist_until_reset(self):
+        reset()
+        enable()
+        try:
+            _ = Date(2018, 10, 1)
+        finally:
+            disable()
+        _ = Date(2018, 10, 1)
+        self.assertEqual(counters()["construct.Date"], 1)
+        reset()
+        self.assertEqual(counters(), {})
+
+    def test_environment_variable(self):
+        out = check_output([executable, "-c", "import neotime.instrumentation as i; print(i.is_enabled())"],
+                           env=dict(environ, NEOTIME_INSTRUMENT="1"))
+        self.assertEqual(out.strip(), b"True")
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from unittest import TestCase
+
+from pytz import FixedOffset
+
+from neotime import Date, DateTime
+from neotime.intervals import Interval, IntervalSet
+
+
+def day(d, hour=0):
+    return DateTime(2018, 10, d, hour)
+
+
+class IntervalTestCase(TestCase):
+
+    def test_bad_endpoints(self):
+        with self.assertRaises(ValueError):
+            _ = Interval(day(2), day(1))
+        with self.assertRaises(TypeError):
+            _ = Interval(1, 2)
+
+    def test_empty(self):
+        self.assertFalse(Interval(day(1), day(1)))
+        self.assertTrue(Interval(day(1), day(2)))
+
+    def test_equality(self):
+        self.assertEqual(Interval(day(1), day(2)), Interval(Date(2018, 10, 1), Date(2018, 10, 2)))
+        self.assertEqual(hash(Interval(day(1), day(2))), hash(Interval(Date(2018, 10, 1), Date(2018, 10, 2))))
+        self.assertNotEqual(Interval(day(1), day(2)), Interval(day(1), day(3)))
+
+    def test_overlaps_is_half_open(self):
+        self.assertTrue(Interval(day(1), day(3)).overlaps(Interval(day(2), day(4))))
+        self.assertFalse(Interval(day(1), day(2)).overlaps(Interval(day(2), day(3))))
+        self.assertFalse(Interval(day(2), day(2)).overlaps(Interval(day(1), day(3))))
+
+    def test_contains(self):
+        interval = Interval(day(1), day(3))
+        self.assertIn(day(1), interval)
+        self.assertIn(day(2, 12), interval)
+        self.assertNotIn(day(3), interval)
+        self.assertIn(Interval(day(1), day(3)), interval)
+        self.assertNotIn(Interval(day(2), day(4)), interval)
+
+    def test_intersection(self):
+        self.assertEqual(Interval(day(1), day(3)).intersection(Interval(day(2), day(4))), Interval(day(2), day(3)))
+        self.assertIsNone(Interval(day(1), day(2)).intersection(Interval(day(2), day(4))))
+
+    def test_union(self):
+        self.assertEqual(Interval(day(1), day(3)).union(Interval(day(2), day(4))), Interval(day(1), day(4)))
+        self.assertEqual(Interval(day(1), day(2)).union(Interval(day(2), day(4))), Interval(day(1), day(4)))
+        with self.assertRaises(ValueError):
+            _ = Interval(day(1), day(2)).union(Interval(day(3), day(4)))
+
+    def test_aware_endpoints_use_utc_instant(self):
+        utc = Interval(DateTime(2018, 10, 1, 12, tzinfo=FixedOffset(0)), DateTime(2018, 10, 1, 13, tzinfo=FixedOffset(0)))
+        cet = Interval(DateTime(2018, 10, 1, 13, tzinfo=FixedOffset(60)), DateTime(2018, 10, 1, 14, tzinfo=FixedOffset(60)))
+        self.assertEqual(utc, cet)
+        self.assertIn(DateTime(2018, 10, 1, 8, 30, tzinfo=FixedOffset(-240)), utc)
+
+
+class IntervalSetTestCase(TestCase):
+
+    def test_merges_overlapping_and_adjacent(self):
+        s = IntervalSet([Interval(day(5), day(6)), Interval(day(1), day(3)), Interval(day(2), day(4)),
+                         Interval(day(4), day(5)), Interval(day(8), day(9)), Interval(day(7), day(7))])
+        self.assertEqual(list(s), [Interval(day(1), day(6)), Interval(day(8), day(9))])
+        self.assertEqual(len(s), 2)
+
+    def test_nested_intervals(self):
+        s = IntervalSet([Interval(day(1), day(9)), Interval(day(2), day(3))])
+        self.assertEqual(list(s), [Interval(day(1), day(9))])
+
+    def test_contains(self):
+        s = IntervalSet([Interval(day(1), day(3)), Interval(day(5), day(7))])
+        self.assertIn(day(1), s)
+        self.assertIn(day(6, 23), s)
+        self.assertNotIn(day(3), s)
+        self.assertNotIn(day(4), s)
+        self.assertNotIn(day(7), s)
+        self.assertIn(Interval(day(5), day(7)), s)
+        self.assertNotIn(Interval(day(2), day(6)), s)
+
+    def test_overlapping(self):
+        s = IntervalSet([Interval(day(1), day(3)), Interval(day(5), day(7)), Interval(day(9), day(11))])
+        self.assertEqual(s.overlapping(Interval(day(3), day(9, 1))), [Interval(day(5), day(7)), Interval(day(9), day(11))])
+        self.assertTrue(s.overlaps(Interval(day(2), day(4))))
+        self.assertFalse(s.overlaps(Interval(day(3), day(5))))
+
+    def test_union(self):
+        a = IntervalSet([Interval(day(1), day(3))])
+        b = IntervalSet([Interval(day(2), day(4)), Interval(day(6), day(7))])
+        self.assertEqual(a.union(b), IntervalSet([Interval(day(1), day(4)), Interval(day(6), day(7))]))
+
+    def test_intersection(self):
+        a = IntervalSet([Interval(day(1), day(5)), Interval(day(7), day(10))])
+        b = IntervalSet([Interval(day(2), day(3)), Interval(day(4), day(8)), Interval(day(9), day(12))])
+        self.assertEqual(list(a.intersection(b)), [Interval(day(2), day(3)), Interval(day(4), day(5)),
+                                                   Interval(day(7), day(8)), Interval(day(9), day(10))])
+
+    def test_empty_set(self):
+        s = IntervalSet()
+        self.assertFalse(s)
+        self.assertNotIn(day(1), s)
+        self.assertEqual(s.overlapping(Interval(day(1), day(2))), [])
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+
+from io import BytesIO
+from mmap import mmap, ACCESS_READ
+from tempfile import TemporaryFile
+from unittest import TestCase
+
+from pytz import FixedOffset
+
+from neotime import Date, Time, DateTime, time_to_nanoseconds, datetime_to_nanoseconds
+from neotime.io import parse_iso_stream, parse_iso_columns
+
+
+DATETIMES = [
+    "2018-10-01T12:34:56.123456789+01:00",
+    "2018-10-01T12:34:56.789",
+    "2018-10-31T23:59:59.999999999-04:30",
+    "1970-01-01T00:00",
+    "2018-10-01 12",
+]
+
+
+class ParseIsoStreamTestCase(TestCase):
+
+    def test_dates(self):
+        values = list(parse_iso_stream(b"2018-10-01\n2016-02-29\n", Date))
+        self.assertEqual(values, [Date(2018, 10, 1), Date(2016, 2, 29)])
+
+    def test_times(self):
+        values = list(parse_iso_stream(b"12:34:56.123456789\n12:34+01:00", Time))
+        self.assertEqual(values, [Time(12, 34, 56.123456789), Time(12, 34, 0, tzinfo=FixedOffset(60))])
+
+    def test_datetimes_match_from_iso_format(self):
+        source = "\n".join(DATETIMES).encode("ascii")
+        values = list(parse_iso_stream(source, DateTime))
+        expected = [DateTime.from_iso_format(s.replace(" ", "T")) for s in DATETIMES]
+        self.assertEqual(values, expected)
+        self.assertEqual([v.tzinfo for v in values], [e.tzinfo for e in expected])
+
+    def test_file_object(self):
+        source = BytesIO("\r\n".join(DATETIMES).encode("ascii"))
+        values = list(parse_iso_stream(source, DateTime, chunk_size=16))
+        self.assertEqual(len(values), len(DATETIMES))
+        self.assertEqual(values[2], DateTime(2018, 10, 31, 23, 59, 59.999999999, tzinfo=FixedOffset(-270)))
+
+    def test_mmap(self):
+        with TemporaryFile() as f:
+            f.write("\n".join(DATETIMES).encode("ascii"))
+            f.flush()
+            buffer = mmap(f.fileno(), 0, access=ACCESS_READ)
+            try:
+                values = list(parse_iso_stream(buffer, DateTime, chunk_size=7))
+            finally:
+                buffer.close()
+        self.assertEqual(values, list(parse_iso_stream("\n".join(DATETIMES).encode("ascii"))))
+
+    def test_small_chunks_preserve_order(self):
+        lines = ["2018-10-%02d" % day for day in range(1, 32)]
+        source = "\n".join(lines).encode("ascii")
+        for chunk_size in (1, 5, 11, 1000):
+            values = list(parse_iso_stream(BytesIO(source), Date, chunk_size=chunk_size))
+            self.assertEqual([v.iso_format() for v in values], lines)
+
+    def test_workers(self):
+        lines = ["2018-10-%02dT12:00:00" % day for day in range(1, 32)] * 10
+        source = "\n".join(lines).encode("ascii")
+        values = list(parse_iso_stream(source, DateTime, chunk_size=50, workers=4))
+        self.assertEqual(values, [DateTime.from_iso_format(line) for line in lines])
+
+    def test_csv_column(self):
+        source = b"1,2018-10-01,x\n2,2018-10-02,y\n"
+        values = list(parse_iso_stream(source, Date, column=1, delimiter=b","))
+        self.assertEqual(values, [Date(2018, 10, 1), Date(2018, 10, 2)])
+
+    def test_bad_field(self):
+        with self.assertRaises(ValueError):
+            _ = list(parse_iso_stream(b"2018-10-01\n2018-1-1\n", Date))
+
+    def test_bad_type(self):
+        with self.assertRaises(TypeError):
+            _ = list(parse_iso_stream(b"P1D", object))
+
+
+class ParseIsoColumnsTestCase(TestCase):
+
+    def test_dates(self):
+        keys = parse_iso_columns(b"0001-01-01\n2018-10-01\n", Date)
+        self.assertEqual(list(keys), [1, Date(2018, 10, 1).to_ordinal()])
+
+    def test_times(self):
+        keys = parse_iso_columns(b"12:34:56.123456789\n23:59:59.999999999+01:00", Time)
+        self.assertEqual(list(keys), [time_to_nanoseconds(Time(12, 34, 56.123456789)),
+                                      time_to_nanoseconds(Time(23, 59, 59.999999999))])
+
+    def test_datetimes(self):
+        source = "\n".join(DATETIMES).encode("ascii")
+        keys = parse_iso_columns(source, DateTime, workers=2, chunk_size=20)
+        self.assertEqual(list(keys), [datetime_to_nanoseconds(DateTime.from_iso_format(s.replace(" ", "T")))
+                                      for s in DATETIMES])
+
+    def test_out_of_range(self):
+        with self.assertRaises(ValueError):
+            _ = parse_iso_columns(b"24:00:00", Time)
+        with self.assertRaises(ValueError):
+            _ = parse_iso_columns(b"2018-02-30", Date)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from subprocess import check_output
+from sys import executable
+from unittest import TestCase, skipIf
+
+from pytz import FixedOffset
+
+from neotime import DateTime, Duration
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+else:
+    from neotime.numpy import (to_datetime64_many, from_datetime64_many,
+                               to_timedelta64_many, from_timedelta64_many)
+
+
+class NumPyImportTestCase(TestCase):
+
+    def test_import_does_not_load_numpy(self):
+        out = check_output([executable, "-c", "import sys, neotime; print('numpy' in sys.modules)"])
+        self.assertEqual(out.strip(), b"False")
+
+
+@skipIf(numpy is None, "NumPy is not installed")
+class DateTime64TestCase(TestCase):
+
+    def test_to_datetime64(self):
+        dt = DateTime(2018, 10, 1, 12, 34, 56.789123456)
+        self.assertEqual(dt.to_datetime64(), numpy.datetime64("2018-10-01T12:34:56.789123456"))
+
+    def test_to_datetime64_with_tz(self):
+        dt = DateTime(2018, 10, 1, 12, 34, 56.789123456, tzinfo=FixedOffset(60))
+        self.assertEqual(dt.to_datetime64(), numpy.datetime64("2018-10-01T11:34:56.789123456"))
+
+    def test_to_datetime64_before_epoch(self):
+        dt = DateTime(1969, 12, 31, 23, 59, 59.999999999)
+        self.assertEqual(dt.to_datetime64(), numpy.datetime64(-1, "ns"))
+
+    def test_to_datetime64_out_of_range(self):
+        with self.assertRaises(ValueError):
+            _ = DateTime(1677, 1, 1).to_datetime64()
+        with self.assertRaises(ValueError):
+            _ = DateTime(2263, 1, 1).to_datetime64()
+
+    def test_from_datetime64(self):
+        dt = DateTime.from_datetime64(numpy.datetime64("2018-10-01T12:34:56.789123456"))
+        self.assertEqual(dt, DateTime(2018, 10, 1, 12, 34, 56.789123456))
+
+    def test_from_datetime64_with_coarser_unit(self):
+        dt = DateTime.from_datetime64(numpy.datetime64("1969-12-31"))
+        self.assertEqual(dt, DateTime(1969, 12, 31))
+
+    def test_from_nat(self):
+        with self.assertRaises(ValueError):
+            _ = DateTime.from_datetime64(numpy.datetime64("NaT"))
+
+    def test_from_datetime64_out_of_range(self):
+        with self.assertRaises(ValueError):
+            _ = DateTime.from_datetime64(numpy.datetime64("2300-01-01"))
+        with self.assertRaises(ValueError):
+            _ = from_datetime64_many(numpy.array(["2018-10-01", "1600-01-01"], dtype="datetime64[D]"))
+        with self.assertRaises(ValueError):
+            _ = from_datetime64_many(numpy.array([10 ** 12], dtype="datetime64[s]"))
+
+    def test_from_datetime64_at_range_limits(self):
+        array = numpy.array(["1677-09-22", "2262-04-11"], dtype="datetime64[D]")
+        self.assertEqual(from_datetime64_many(array), [DateTime(1677, 9, 22), DateTime(2262, 4, 11)])
+
+    def test_many_round_trip(self):
+        dts = [DateTime(2018, 10, 1, 12, 34, 56.789123456),
+               DateTime(2018, 10, 1, 0, 0, 0),
+               DateTime(1900, 2, 28, 23, 59, 59.999999999)]
+        array = to_datetime64_many(dts)
+        self.assertEqual(array.dtype, numpy.dtype("datetime64[ns]"))
+        self.assertEqual(from_datetime64_many(array), dts)
+
+    def test_from_many_shares_dates(self):
+        array = numpy.array(["2018-10-01T01:00", "2018-10-01T02:00"], dtype="datetime64[ns]")
+        dts = from_datetime64_many(array)
+        self.assertIs(dts[0].date(), dts[1].date())
+
+    def test_from_many_rejects_other_types(self):
+        with self.assertRaises(TypeError):
+            _ = from_datetime64_many(numpy.array([1, 2, 3]))
+
+
+@skipIf(numpy is None, "NumPy is not installed")
+class TimeDelta64TestCase(TestCase):
+
+    def test_to_timedelta64(self):
+        d = Duration(days=1, hours=2, seconds=3.000000004)
+        self.assertEqual(d.to_timedelta64(), numpy.timedelta64(93603000000004, "ns"))
+
+    def test_to_timedelta64_with_months(self):
+        with self.assertRaises(ValueError):
+            _ = Duration(months=1).to_timedelta64()
+
+    def test_to_timedelta64_out_of_range(self):
+        with self.assertRaises(ValueError):
+            _ = Duration(days=200000).to_timedelta64()
+
+    def test_from_timedelta64_out_of_range(self):
+        with self.assertRaises(ValueError):
+            _ = Duration.from_timedelta64(numpy.timedelta64(300 * 365, "D"))
+        with self.assertRaises(ValueError):
+            _ = from_timedelta64_many(numpy.array([1, -300 * 365], dtype="timedelta64[D]"))
+
+    def test_from_timedelta64(self):
+        d = Duration.from_timedelta64(numpy.timedelta64(-93603000000004, "ns"))
+        self.assertEqual(d, Duration(days=-1, hours=-2, seconds=-3.000000004))
+
+    def test_many_round_trip(self):
+        durations = [Duration(days=1), Duration(seconds=-1, nanoseconds=-5), Duration()]
+        array = to_timedelta64_many(durations)
+        self.assertEqual(array.dtype, numpy.dtype("timedelta64[ns]"))
+        self.assertEqual(from_timedelta64_many(array), durations)
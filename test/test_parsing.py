@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+
+from unittest import TestCase
+
+from neotime.parsing import compile_pattern, parse_fields, pattern_cache
+
+
+class CompilePatternTestCase(TestCase):
+
+    def setUp(self):
+        pattern_cache.clear()
+
+    def test_compiled_pattern_is_cached(self):
+        parse = compile_pattern("%Y-%m-%d")
+        self.assertIs(compile_pattern("%Y-%m-%d"), parse)
+        self.assertEqual(pattern_cache.stats()["hits"], 1)
+
+    def test_defaults(self):
+        self.assertEqual(parse_fields("12", "%H"), (1900, 1, 1, 12, 0, 0, 0, None))
+
+    def test_fraction_digits(self):
+        self.assertEqual(parse_fields("5.1", "%S.%f")[5:7], (5, 100000000))
+        self.assertEqual(parse_fields("5.000000001", "%S.%N")[5:7], (5, 1))
+
+    def test_two_digit_years(self):
+        self.assertEqual(parse_fields("68", "%y")[0], 2068)
+        self.assertEqual(parse_fields("69", "%y")[0], 1969)
+
+    def test_twelve_hour_clock(self):
+        self.assertEqual(parse_fields("12 AM", "%I %p")[3], 0)
+        self.assertEqual(parse_fields("12 pm", "%I %p")[3], 12)
+
+    def test_composite_directives(self):
+        self.assertEqual(parse_fields("2018-10-01 07:04:05", "%F %T"), (2018, 10, 1, 7, 4, 5, 0, None))
+        self.assertEqual(parse_fields("10/01/18 07:04", "%D%n%R")[:5], (2018, 10, 1, 7, 4))
+
+    def test_offsets(self):
+        self.assertEqual(parse_fields("+0130", "%z")[7], 90)
+        self.assertEqual(parse_fields("-01:30", "%z")[7], -90)
+        self.assertEqual(parse_fields("Z", "%z")[7], 0)
+
+    def test_literal_percent(self):
+        self.assertEqual(parse_fields("50%", "%S%%")[5], 50)
+
+    def test_invalid_directive(self):
+        with self.assertRaises(ValueError):
+            _ = compile_pattern("%Y-%V")
+
+    def test_incomplete_directive(self):
+        with self.assertRaises(ValueError):
+            _ = compile_pattern("%Y-%")
+
+    def test_mismatch(self):
+        with self.assertRaises(ValueError):
+            _ = parse_fields("2018-10-01x", "%Y-%m-%d")
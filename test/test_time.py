@@ -21,15 +21,24 @@
 
 from __future__ import division
 
-from datetime import time
-from unittest import TestCase
+from datetime import time, timedelta
+from random import Random
+from subprocess import check_output
+from sys import executable
+from unittest import TestCase, skipIf
 
 from pytz import timezone, FixedOffset
 
-from neotime import Time
+from neotime import Time, Duration
 from neotime.arithmetic import nano_add, nano_div
 
 
+try:
+    from datetime import timezone as native_timezone
+except ImportError:
+    native_timezone = None
+
+
 eastern = timezone("US/Eastern")
 timezone_utc = timezone("UTC")
 
@@ -41,6 +50,13 @@ class TimeTestCase(TestCase):
         with self.assertRaises(AttributeError):
             _ = t.x
 
+    def test_standard_library_aliases(self):
+        t = Time.fromisoformat("12:34:56.789+01:00")
+        self.assertEqual(t.isoformat(), "12:34:56.789000000+01:00")
+        self.assertEqual(t.utcoffset().total_seconds(), 3600)
+        self.assertIsInstance(Time.utcnow(), Time)
+        self.assertIn("isoformat", vars(Time))
+
     def test_simple_time(self):
         t = Time(12, 34, 56.789)
         self.assertEqual(t.hour_minute_second, (12, 34, 56.789))
@@ -96,14 +112,123 @@ class TimeTestCase(TestCase):
         self.assertEqual(t.minute, native.minute)
         self.assertEqual(56.789123, nano_add(native.second, nano_div(native.microsecond, 1000000)))
 
+    def test_to_native_many(self):
+        times = [Time(12, 34, 56.789123456), Time(0, 0, 0), Time(23, 59, 59.999999999, tzinfo=eastern)]
+        natives = Time.to_native_many(times)
+        self.assertEqual(natives, [t.to_native() for t in times])
+        self.assertEqual(natives[1], time(0, 0, 0))
+        self.assertEqual(natives[2].tzinfo, eastern)
+
+    def test_to_native_many_matches_to_native(self):
+        random = Random(0)
+        times = [Time(random.randint(0, 23), random.randint(0, 59), random.randint(0, 59999999999) / 1000000000)
+                 for _ in range(10000)]
+        times.append(Time(17, 32, 5.125182))
+        self.assertEqual(Time.to_native_many(times), [t.to_native() for t in times])
+
     def test_iso_format(self):
         t = Time(12, 34, 56.789123456)
         self.assertEqual("12:34:56.789123456", t.iso_format())
 
+    @skipIf(native_timezone is None, "datetime.timezone is not available")
+    def test_native_fixed_offset(self):
+        t = Time(12, 0, 0, tzinfo=native_timezone(timedelta(hours=1)))
+        self.assertEqual(t.utc_offset(), timedelta(hours=1))
+        self.assertIsNone(t.dst())
+        self.assertEqual(t.tzname(), "UTC+01:00")
+        self.assertEqual(t.iso_format(), "12:00:00.000000000+01:00")
+        self.assertEqual(t - Time(10, 0, 0, tzinfo=native_timezone(timedelta(0))), Duration(hours=1))
+        self.assertEqual("{:%H:%M %z}".format(t), "12:00 +0100")
+
+    @skipIf(native_timezone is None, "datetime.timezone is not available")
+    def test_parsed_offset_without_pytz(self):
+        out = check_output([executable, "-c", "import sys; sys.modules['pytz'] = None; "
+                                              "from neotime import Time; "
+                                              "t = Time.from_iso_format('12:00:00+01:00'); "
+                                              "print(t, t.utc_offset(), t - Time(10, 0, 0, t.tzinfo))"])
+        self.assertEqual(out.split(), [b"12:00:00.000000000+01:00", b"1:00:00", b"PT2H"])
+
     def test_iso_format_with_trailing_zeroes(self):
         t = Time(12, 34, 56.789)
         self.assertEqual("12:34:56.789000000", t.iso_format())
 
+    def test_add_duration(self):
+        t = Time(12, 34, 56.789123456)
+        self.assertEqual(t + Duration(hours=1, nanoseconds=1), Time(13, 34, 56.789123457))
+        self.assertEqual(Duration(seconds=0.210876544) + t, Time(12, 34, 57))
+        self.assertEqual(t + Duration(months=1, days=2), t)
+
+    def test_add_wraps_around_midnight(self):
+        t = Time(23, 59, 59.999999999)
+        self.assertEqual(t + Duration(nanoseconds=2), Time(0, 0, 0.000000001))
+        self.assertEqual(Time(0, 0, 0) - Duration(nanoseconds=1), t)
+
+    def test_add_timedelta(self):
+        t = Time(12, 0, 0)
+        self.assertEqual(t + timedelta(hours=13, microseconds=5), Time(1, 0, 0.000005))
+        self.assertEqual(timedelta(minutes=1) + t, Time(12, 1, 0))
+        self.assertEqual(t - timedelta(hours=1), Time(11, 0, 0))
+        aware = Time(12, 0, 0, tzinfo=FixedOffset(60))
+        self.assertEqual(aware + timedelta(hours=1), Time(13, 0, 0, tzinfo=FixedOffset(60)))
+
+    def test_subtract_time(self):
+        self.assertEqual(Time(1, 2, 3.123456789) - Time(0, 0, 0.5), Duration(hours=1, minutes=2, seconds=2.623456789))
+        self.assertEqual(Time(0, 0, 0) - Time(0, 0, 0.000000001), Duration(nanoseconds=-1))
+
+    def test_subtract_aware_times(self):
+        t1 = Time(12, 0, 0, tzinfo=FixedOffset(60))
+        t2 = Time(12, 0, 0, tzinfo=FixedOffset(0))
+        self.assertEqual(t1 - t2, Duration(hours=-1))
+        with self.assertRaises(TypeError):
+            _ = t1 - Time(12, 0, 0)
+
+    def test_bad_arithmetic(self):
+        with self.assertRaises(TypeError):
+            _ = Time(12, 0, 0) + 1
+        with self.assertRaises(TypeError):
+            _ = Time(12, 0, 0) - 1
+
+    def test_truncate(self):
+        t = Time(12, 34, 56.789123456, tzinfo=FixedOffset(60))
+        self.assertEqual(t.truncate("day"), Time(0, 0, 0, tzinfo=FixedOffset(60)))
+        self.assertEqual(t.truncate("hour"), Time(12, 0, 0, tzinfo=FixedOffset(60)))
+        self.assertEqual(t.truncate("minute"), Time(12, 34, 0, tzinfo=FixedOffset(60)))
+        self.assertEqual(t.truncate("second"), Time(12, 34, 56, tzinfo=FixedOffset(60)))
+        self.assertEqual(t.truncate("millisecond"), Time(12, 34, 56.789, tzinfo=FixedOffset(60)))
+        self.assertEqual(t.truncate("microsecond"), Time(12, 34, 56.789123, tzinfo=FixedOffset(60)))
+        self.assertEqual(t.truncate("hour").tzinfo, FixedOffset(60))
+
+    def test_truncate_to_date_unit(self):
+        with self.assertRaises(ValueError):
+            _ = Time(12, 0, 0).truncate("month")
+
+    def test_format(self):
+        t = Time(13, 4, 5.123456789, tzinfo=FixedOffset(-90))
+        self.assertEqual(t.__format__(""), t.iso_format())
+        self.assertEqual(t.__format__("%I:%M:%S %p %z"), "01:04:05 PM -0130")
+        self.assertEqual(t.strftime("%H:%M:%S.%f"), "13:04:05.123456")
+        self.assertEqual("{:%S.%N}".format(t), "05.123456789")
+
+    def test_format_date_fields(self):
+        t = Time(12, 34, 56)
+        self.assertEqual(t.strftime("%Y-%m-%d"), t.to_native().strftime("%Y-%m-%d"))
+
+    def test_iso_format_with_precision(self):
+        t = Time(12, 34, 56.789123456)
+        self.assertEqual("12:34:56", t.iso_format(precision=0))
+        self.assertEqual("12:34:56.789", t.iso_format(precision=3))
+        self.assertEqual("12:34:56.789123", t.iso_format(precision=6))
+        self.assertEqual("12:34:56.789123456", t.iso_format(precision=9))
+
+    def test_iso_format_with_bad_precision(self):
+        t = Time(12, 34, 56.789123456)
+        with self.assertRaises(ValueError):
+            _ = t.iso_format(precision=2)
+
+    def test_iso_format_with_negative_partial_hour_tz(self):
+        t = Time(12, 34, 56.789, tzinfo=FixedOffset(-90))
+        self.assertEqual("12:34:56.789000000-01:30", t.iso_format())
+
     def test_from_iso_format_hour_only(self):
         expected = Time(12, 0, 0)
         actual = Time.from_iso_format("12")
@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from datetime import datetime, timedelta, tzinfo
+from subprocess import check_output
+from sys import executable
+from unittest import TestCase, skipIf
+
+from pytz import timezone, utc, FixedOffset
+
+from neotime import DateTime
+from neotime.timezones import (CompiledZone, compile_zone, as_timezone_many, get_zone, set_backend,
+                               fixed_offset)
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    ZoneInfo = None
+
+
+eastern = timezone("US/Eastern")
+
+
+class SummerTime(tzinfo):
+    """ A time zone one hour ahead of UTC, or two hours ahead from June
+    to August, with no transition table of its own.
+    """
+
+    def utcoffset(self, dt):
+        if dt is None:
+            return None
+        return timedelta(hours=2 if 6 <= dt.month <= 8 else 1)
+
+    def dst(self, dt):
+        return timedelta(hours=1 if 6 <= dt.month <= 8 else 0)
+
+    def tzname(self, dt):
+        return "ST"
+
+
+class DoubleStep(tzinfo):
+    """ A time zone that moves from one to two hours ahead of UTC at
+    06:00 UTC on 1 March 2018, and to three hours ahead at 12:00 UTC
+    the same day. Calls to :meth:`fromutc` are counted.
+    """
+
+    calls = 0
+
+    def utcoffset(self, dt):
+        if dt is None:
+            return None
+        dt = dt.replace(tzinfo=None)
+        if dt < datetime(2018, 3, 1, 7):
+            return timedelta(hours=1)
+        if dt < datetime(2018, 3, 1, 14):
+            return timedelta(hours=2)
+        return timedelta(hours=3)
+
+    def dst(self, dt):
+        return timedelta(0)
+
+    def fromutc(self, dt):
+        DoubleStep.calls += 1
+        return super(DoubleStep, self).fromutc(dt)
+
+
+class CompiledZoneTestCase(TestCase):
+
+    def assert_matches_pytz(self, value, tz):
+        native = tz.fromutc(value.to_native().astimezone(utc).replace(tzinfo=tz))
+        converted = value.as_timezone(tz)
+        self.assertEqual(converted.to_native(), native)
+        self.assertEqual(converted.tzinfo, native.tzinfo)
+        self.assertEqual(converted.tzname(), native.tzname())
+
+    def test_as_timezone_matches_pytz(self):
+        for value in [DateTime(2018, 3, 11, 6, 59, 59, tzinfo=utc), DateTime(2018, 3, 11, 7, 0, 0, tzinfo=utc),
+                      DateTime(2018, 11, 4, 5, 30, tzinfo=utc), DateTime(2018, 11, 4, 6, 30, tzinfo=utc),
+                      DateTime(1850, 1, 1, tzinfo=FixedOffset(60)), DateTime(2050, 7, 1, tzinfo=FixedOffset(-90))]:
+            self.assert_matches_pytz(value, eastern)
+
+    def test_as_timezone_keeps_nanoseconds(self):
+        value = DateTime(2018, 7, 1, 12, 0, 0.123456789, tzinfo=utc).as_timezone(eastern)
+        self.assertEqual(value.hour_minute_second, (8, 0, 0.123456789))
+
+    def test_as_timezone_of_naive_value(self):
+        value = DateTime(2018, 7, 1, 12)
+        self.assertIs(value.as_timezone(eastern), value)
+
+    def test_fixed_offset(self):
+        zone = CompiledZone(FixedOffset(330))
+        self.assertEqual(zone.resolve(0), (19800, FixedOffset(330)))
+        value = zone.as_timezone(DateTime(2018, 12, 31, 20, tzinfo=utc))
+        self.assertEqual(value, DateTime(2019, 1, 1, 1, 30, tzinfo=FixedOffset(330)))
+
+    def test_probed_zone(self):
+        tz = SummerTime()
+        zone = CompiledZone(tz)
+        june = (datetime(2018, 5, 31, 23) - datetime(1970, 1, 1)).days * 86400 + 82800
+        self.assertEqual(zone.resolve(june - 1), (3600, tz))
+        self.assertEqual(zone.resolve(june), (7200, tz))
+        # Outside the probe window, the tzinfo is called directly
+        self.assertEqual(zone.resolve((datetime(1800, 1, 1) - datetime(1970, 1, 1)).days * 86400), (3600, tz))
+        self.assertEqual(zone.resolve((datetime(1800, 7, 1) - datetime(1970, 1, 1)).days * 86400), (7200, tz))
+
+    def test_probed_zone_with_two_transitions_in_a_day(self):
+        tz = DoubleStep()
+        zone = CompiledZone(tz)
+        six = (datetime(2018, 3, 1, 6) - datetime(1970, 1, 1)).days * 86400 + 21600
+        self.assertEqual(zone.resolve(six - 1), (3600, tz))
+        self.assertEqual(zone.resolve(six), (7200, tz))
+        self.assertEqual(zone.resolve(six + 21599), (7200, tz))
+        self.assertEqual(zone.resolve(six + 21600), (10800, tz))
+
+    def test_as_timezone_does_not_probe_for_single_values(self):
+        tz = DoubleStep()
+        DoubleStep.calls = 0
+        value = DateTime(2018, 3, 1, 9, 0, 0.5, tzinfo=utc).as_timezone(tz)
+        self.assertEqual(value, DateTime(2018, 3, 1, 11, 0, 0.5, tzinfo=tz))
+        self.assertEqual(value.utc_offset(), timedelta(hours=2))
+        self.assertLess(DoubleStep.calls, 5)
+
+    def test_compiled_once(self):
+        self.assertIs(compile_zone(eastern), compile_zone(eastern))
+
+    def test_as_timezone_many(self):
+        values = [DateTime(2018, 1, 1, 12, tzinfo=utc), None, DateTime(2018, 7, 1, 12, tzinfo=FixedOffset(60))]
+        self.assertEqual(as_timezone_many(values, eastern),
+                         [values[0].as_timezone(eastern), None, values[2].as_timezone(eastern)])
+
+
+class BackendTestCase(TestCase):
+
+    def tearDown(self):
+        set_backend()
+
+    @skipIf(ZoneInfo is None, "zoneinfo is not available")
+    def test_prefers_zoneinfo(self):
+        self.assertEqual(get_zone("Europe/Stockholm"), ZoneInfo("Europe/Stockholm"))
+
+    def test_zones_are_cached_by_name(self):
+        self.assertIs(get_zone("Europe/Stockholm"), get_zone("Europe/Stockholm"))
+
+    def test_pytz_backend(self):
+        set_backend("pytz")
+        self.assertIs(get_zone("US/Eastern"), eastern)
+
+    def test_custom_backend(self):
+        set_backend(lambda name: FixedOffset(60))
+        self.assertEqual(get_zone("Anywhere"), FixedOffset(60))
+
+    def test_no_backend_available(self):
+        def missing(name):
+            raise ImportError(name)
+        set_backend(missing)
+        with self.assertRaises(ImportError):
+            _ = get_zone("Europe/Stockholm")
+
+    def test_unknown_zone(self):
+        with self.assertRaises(KeyError):
+            _ = get_zone("Nowhere/Special")
+
+    def test_fixed_offset(self):
+        self.assertEqual(fixed_offset(-90), FixedOffset(-90))
+        self.assertIs(fixed_offset(-90), fixed_offset(-90))
+
+    @skipIf(ZoneInfo is None, "zoneinfo is not available")
+    def test_zoneinfo_values(self):
+        value = DateTime(2018, 7, 1, 12, tzinfo=utc).as_timezone(get_zone("Europe/Stockholm"))
+        self.assertEqual(value.utc_offset(), timedelta(hours=2))
+        self.assertEqual(value.dst(), timedelta(hours=1))
+        self.assertEqual(value.tzname(), "CEST")
+        self.assertEqual(value.iso_format(), "2018-07-01T14:00:00.000000000+02:00")
+        self.assertEqual("{:%H:%M %z %Z}".format(value), "14:00 +0200 CEST")
+
+    def test_backends_are_imported_lazily(self):
+        out = check_output([executable, "-c", "import sys, neotime; "
+                                              "print('pytz' in sys.modules or 'zoneinfo' in sys.modules)"])
+        self.assertEqual(out.strip(), b"False")
+